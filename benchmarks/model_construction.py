@@ -0,0 +1,83 @@
+"""Compare creating models with lazily and eagerly converted fields.
+
+Run with `python benchmarks/model_construction.py` in an environment where
+linnapi is installed. Date times are converted lazily while raw data is
+retained in full and eagerly otherwise, so the eager figures use the "none"
+mode. Projection is timed separately, as it ignores the raw retention mode.
+Each order has its own received, paid and processed date times, and the
+parse_date_time cache is cleared before each timed run.
+"""
+
+import timeit
+from typing import Callable
+
+from model_memory import PROCESSED_ORDER
+
+from linnapi import models
+
+ORDERS = [
+    dict(
+        PROCESSED_ORDER,
+        dReceivedDate=f"2022-05-22T{i // 600:02d}:{i // 10 % 60:02d}:{i % 10:02d}Z",
+        dPaidOn=f"2022-05-22T{i // 600:02d}:{i // 10 % 60:02d}:{i % 10 + 10:02d}Z",
+        dProcessedOn=f"2022-05-23T{i // 600:02d}:{i // 10 % 60:02d}:{i % 10:02d}Z",
+    )
+    for i in range(10000)
+]
+READ_FIELDS = ("order_id", "processed_at", "total_charge")
+REPEATS = 5
+
+
+def read_some() -> None:
+    """Create every order and read the fields most jobs use."""
+    for data in ORDERS:
+        order = models.ProcessedOrder(data)
+        for name in READ_FIELDS:
+            getattr(order, name)
+
+
+def read_projected() -> None:
+    """Create every order with only the fields most jobs use and read them."""
+    for data in ORDERS:
+        order = models.ProcessedOrder(data, fields=READ_FIELDS)
+        for name in READ_FIELDS:
+            getattr(order, name)
+
+
+def read_all() -> None:
+    """Create every order and read all of its fields."""
+    for data in ORDERS:
+        order = models.ProcessedOrder(data)
+        for name in models.ProcessedOrder.__slots__:
+            getattr(order, name)
+
+
+def best_time(func: Callable[[], None], mode: models.RawRetention) -> float:
+    """Return the best time in seconds to run func with a raw retention mode."""
+    with models.raw_retention(mode):
+        return min(
+            timeit.repeat(
+                func, setup=models.parse_date_time.cache_clear, number=1, repeat=REPEATS
+            )
+        )
+
+
+def main() -> None:
+    """Print the time taken to create and read processed orders."""
+    print(f"{len(ORDERS)} ProcessedOrder instances")
+    for description, func in (
+        (f"reading {', '.join(READ_FIELDS)}", read_some),
+        ("reading every field", read_all),
+    ):
+        lazy = best_time(func, "full")
+        eager = best_time(func, "none")
+        print(
+            f"{description:<48} eager {eager * 1000:6.1f} ms"
+            f"  lazy {lazy * 1000:6.1f} ms"
+        )
+    projected = best_time(read_projected, "full")
+    print(f"{'projecting ' + ', '.join(READ_FIELDS):<48} {projected * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
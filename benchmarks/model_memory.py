@@ -0,0 +1,203 @@
+"""Measure the memory used by model instances.
+
+Run with `python benchmarks/model_memory.py` in an environment where linnapi
+is installed. Every field of each model is read before measuring, so the
+figures include the converted values of lazily parsed fields.
+
+The first table compares models with and without __slots__. Each model is
+built many times from one shared response dict, so the figures are the cost
+of the instances alone, not of the raw data.
+
+The second table compares raw retention modes. Each model is built from its
+own decoded response, as when reading a result set, so the figures include
+whatever each mode keeps of the raw data. The last row creates ProcessedOrders
+with only the fields in PROJECTED_FIELDS.
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable
+
+from linnapi import models
+
+INSTANCES = 10000
+
+STOCK_LEVEL = {
+    "Location": {
+        "StockLocationId": "00000000-0000-0000-0000-000000000000",
+        "StockLocationIntId": 0,
+        "LocationName": "Default",
+        "IsFulfillmentCenter": False,
+        "IsWarehouseManaged": False,
+    },
+    "StockLevel": 18,
+    "StockValue": 172.8,
+    "MinimumLevel": 4,
+    "InOrderBook": 0,
+    "Due": 0,
+    "JIT": False,
+    "InOrders": 0,
+    "Available": 18,
+    "UnitCost": 9.6,
+    "SKU": "E32-99X-8G2",
+    "LastUpdateDate": "2022-03-18T15:22:06.273Z",
+    "rowid": "2df49516-77f7-4eb6-aa75-dd6ae9ec7e82",
+    "PendingUpdate": False,
+    "StockItemPurchasePrice": 9.6,
+    "StockItemId": "965c4c47-227d-4b87-913f-0114dab13b61",
+    "StockItemIntId": 0,
+}
+
+PROCESSED_ORDER = {
+    "pkOrderID": "73846ae8-9f64-42ef-8d76-31aa418da9d5",
+    "dReceivedDate": "2022-05-23T00:09:35Z",
+    "dProcessedOn": "2022-05-23T07:25:47.19Z",
+    "timeDiff": 0.30291886574074073,
+    "fPostageCost": 0.0,
+    "fTotalCharge": 27.99,
+    "PostageCostExTax": 0.0,
+    "Subtotal": 23.325,
+    "fTax": 4.665,
+    "TotalDiscount": 0.0,
+    "ProfitMargin": 0.0,
+    "CountryTaxRate": 20.0,
+    "nOrderId": 109390,
+    "nStatus": 1,
+    "cCurrency": "GBP",
+    "PostalTrackingNumber": "JH47846456175GB",
+    "cCountry": "United Kingdom",
+    "Source": "EBAY",
+    "PostalServiceName": "Royal Mail Tracked 48",
+    "ReferenceNum": "20-08658-40025",
+    "SecondaryReference": "20-08658-40025",
+    "ExternalReference": "1238579407101",
+    "Address1": "59 Fake Drive",
+    "Address2": "",
+    "Address3": "",
+    "Town": "Sometown",
+    "Region": "Nowhere",
+    "BuyerPhoneNumber": "999666999",
+    "Company": "",
+    "SubSource": "store",
+    "ChannelBuyerName": "buyer",
+    "AccountName": "Default",
+    "cFullName": "Some Name",
+    "cEmailAddress": "noone@nowhere.com",
+    "cPostCode": "GUFF FFF",
+    "dPaidOn": "2022-05-23T00:09:36Z",
+    "dCancelledOn": "0001-01-01T00:00:00Z",
+    "ItemWeight": 0.0,
+    "TotalWeight": 0.0,
+    "HoldOrCancel": False,
+    "IsResend": False,
+    "IsExchange": False,
+    "TaxId": "",
+    "FulfilmentLocationName": "Default",
+}
+
+STOCK_ITEM_HISTORY_RECORD = {
+    "Date": "2022-04-11T13:32:10.993Z",
+    "Level": 44,
+    "StockValue": 0.0,
+    "Note": "Imported from file",
+    "ChangeQty": 44,
+    "ChangeValue": 0.0,
+    "StockItemId": "6079faa4-e4ff-4b5b-9990-fc571e70412e",
+    "StockItemIntId": 0,
+}
+
+
+def without_slots(model: Any) -> Callable[[dict], Any]:
+    """Return a copy of model whose instances store attributes in a __dict__."""
+    members = (
+        "__init__",
+        "__getattr__",
+        "_set_raw",
+        "_lazy_fields",
+        "_lazy_keys",
+        "raw",
+    )
+    namespace = {name: getattr(model, name) for name in members}
+    return type(f"Unslotted{model.__name__}", (), namespace)
+
+
+def loaded(model: Any) -> Callable[[dict], Any]:
+    """Return a function creating instances of model with every field read."""
+
+    def create(data: dict) -> Any:
+        instance = model(data)
+        for name in model.__slots__:
+            getattr(instance, name)
+        return instance
+
+    return create
+
+
+def bytes_per_instance(model: Callable[[dict], Any], data: dict) -> float:
+    """Return the average memory allocated by each model created from data."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [model(data) for _ in range(INSTANCES)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (end - start) / INSTANCES
+
+
+def retained_bytes_per_instance(model: Callable[[dict], Any], payload: str) -> float:
+    """Return the average memory kept by each model created from a new response."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [model(json.loads(payload)) for _ in range(INSTANCES)]
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (end - start) / INSTANCES
+
+
+PROJECTED_FIELDS = ("order_id", "processed_at", "total_charge")
+
+MODELS = (
+    (models.StockLevelInfo, STOCK_LEVEL),
+    (models.ProcessedOrder, PROCESSED_ORDER),
+    (models.StockItemHistoryRecord, STOCK_ITEM_HISTORY_RECORD),
+)
+
+
+def main() -> None:
+    """Print the bytes allocated per instance of each model."""
+    print("__slots__")
+    for model, data in MODELS:
+        unslotted = without_slots(model)
+        model(data)  # Warm the parse_date_time cache before measuring.
+        before = bytes_per_instance(unslotted, data)
+        after = bytes_per_instance(loaded(model), data)
+        print(
+            f"{model.__name__:<24} {before:8.0f} B -> {after:8.0f} B"
+            f"  ({1 - after / before:.0%} smaller)"
+        )
+    print()
+    print(
+        f"{'raw retention':<24}"
+        + "".join(f"{m:>12}" for m in models.RAW_RETENTION_MODES)
+    )
+    for model, data in MODELS:
+        payload = json.dumps(data)
+        sizes = []
+        for mode in models.RAW_RETENTION_MODES:
+            with models.raw_retention(mode):
+                sizes.append(retained_bytes_per_instance(loaded(model), payload))
+        print(f"{model.__name__:<24}" + "".join(f"{s:10.0f} B" for s in sizes))
+    projected = retained_bytes_per_instance(
+        lambda data: models.ProcessedOrder(data, fields=PROJECTED_FIELDS),
+        json.dumps(PROCESSED_ORDER),
+    )
+    print(f"{'ProcessedOrder projected':<24}{projected:34.0f} B")
+
+
+if __name__ == "__main__":
+    main()
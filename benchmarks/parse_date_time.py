@@ -0,0 +1,80 @@
+"""Compare models.parse_date_time with the string splitting parser it replaced.
+
+Run with `python benchmarks/parse_date_time.py` in an environment where linnapi
+is installed. The memoisation cache is cleared before each timed run.
+"""
+
+import datetime as dt
+import timeit
+from typing import Callable
+
+from linnapi import models
+
+TIMESTAMPS = [
+    f"2022-05-{day:02d}T{hour:02d}:{minute:02d}:47.19Z"
+    for day in range(1, 29)
+    for hour in range(24)
+    for minute in range(0, 60, 15)
+]
+REPEATS = 5
+
+
+def split_parse_date_time(date_time_string: str) -> dt.datetime:
+    """Parse a timestamp the way parse_date_time did before using fromisoformat."""
+    numeric_string = date_time_string.replace("Z", "")
+    date, time = numeric_string.split("T")
+    year, month, day = date.split("-")
+    if "." in time:
+        time, microsecond = time.split(".")
+        microsecond = microsecond[:6]
+    else:
+        microsecond = "0"
+    hour, minute, second = time.split(":")
+    return dt.datetime(
+        year=int(year),
+        month=int(month),
+        day=int(day),
+        hour=int(hour),
+        minute=int(minute),
+        second=int(second),
+        microsecond=int(microsecond),
+    )
+
+
+def uncached_parse_date_time(date_time_string: str) -> dt.datetime:
+    """Call parse_date_time without its memoisation."""
+    return models.parse_date_time.__wrapped__(date_time_string)
+
+
+def bench(func: Callable[[str], dt.datetime], timestamps: list[str]) -> float:
+    """Return the best time in seconds to parse timestamps with func."""
+    return min(
+        timeit.repeat(
+            lambda: [func(timestamp) for timestamp in timestamps],
+            setup=models.parse_date_time.cache_clear,
+            number=1,
+            repeat=REPEATS,
+        )
+    )
+
+
+def main() -> None:
+    """Print parse times for unique and repeated timestamps."""
+    repeated = TIMESTAMPS[:100] * (len(TIMESTAMPS) // 100)
+    for label, timestamps in (("unique", TIMESTAMPS), ("repeated", repeated)):
+        baseline = bench(split_parse_date_time, timestamps)
+        print(f"{len(timestamps)} {label} timestamps")
+        print(f"  str.split parser:        {baseline * 1000:8.2f} ms")
+        for name, func in (
+            ("fromisoformat", uncached_parse_date_time),
+            ("fromisoformat, memoised", models.parse_date_time),
+        ):
+            elapsed = bench(func, timestamps)
+            print(
+                f"  {name + ':':<24} {elapsed * 1000:8.2f} ms"
+                f"  ({baseline / elapsed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,26 @@
 """linnapi - Linnworks API integration."""
 
-from . import exceptions, inventory, orders
+from . import (
+    cache,
+    exceptions,
+    inventory,
+    loader,
+    orders,
+    ratelimit,
+    retry,
+    token_store,
+)
 from .session import LinnworksAPISession, linnworks_api_session
 
 __all__ = [
+    "cache",
     "exceptions",
     "inventory",
+    "loader",
     "orders",
+    "ratelimit",
+    "retry",
+    "token_store",
     "LinnworksAPISession",
     "linnworks_api_session",
 ]
@@ -0,0 +1,589 @@
+"""Caches for Linnworks API data that rarely changes."""
+
+import collections
+import contextvars
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, Union
+
+
+class Cache:
+    """
+    Base class for key value caches.
+
+    Entries expire ttl seconds after they are set. A ttl of None means entries
+    do not expire.
+    """
+
+    def get(self, key: str) -> Any:
+        """Return the value cached for key. Raise KeyError if it is not cached."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for key, expiring after ttl seconds if ttl is not None."""
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        """Remove keys from the cache."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return a dict of the cached values for those keys that are cached."""
+        values = {}
+        for key in keys:
+            try:
+                values[key] = self.get(key)
+            except KeyError:
+                continue
+        return values
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache every key and value in items."""
+        for key, value in items.items():
+            self.set(key, value, ttl=ttl)
+
+    @staticmethod
+    def _expires_at(ttl: Optional[float]) -> Optional[float]:
+        if ttl is None:
+            return None
+        return time.time() + ttl
+
+
+class LRUCache(Cache):
+    """
+    A thread-safe in-memory cache holding at most maxsize entries.
+
+    The least recently used entry is discarded when the cache is full. Hits and
+    misses are counted in self.hits and self.misses.
+
+    Kwargs:
+        maxsize (int): The maximum number of entries to hold.
+        ttl (float): The default number of seconds entries are kept for. None
+            keeps entries until they are discarded to make room.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        """Create an empty cache."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[
+            Hashable, tuple[Any, Optional[float]]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the value cached for key. Raise KeyError if it is not cached."""
+        with self._lock:
+            try:
+                value, expires_at = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for key, expiring after ttl seconds or the default ttl."""
+        expires_at = self._expires_at(self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: Hashable) -> None:
+        """Remove keys from the cache."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of entries, hits and misses."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class SQLiteCache(Cache):
+    """
+    Cache JSON serialisable values in an SQLite database.
+
+    The database can be shared by several processes, so cached values survive
+    restarts.
+
+    Kwargs:
+        ttl (float): The default number of seconds entries are kept for. None
+            keeps entries until they are deleted.
+        table (str): The name of the table used to store entries.
+    """
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        ttl: Optional[float] = None,
+        table: str = "linnapi_cache",
+    ) -> None:
+        """Cache values in the SQLite database at path."""
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name {table!r}.")
+        self.path = Path(path)
+        self.ttl = ttl
+        self.table = table
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+
+    def get(self, key: str) -> Any:
+        """Return the value cached for key. Raise KeyError if it is not cached."""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return a dict of the cached values for those keys that are cached."""
+        keys = list(keys)
+        values: dict[str, Any] = {}
+        now = time.time()
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM {self.table} "
+                    f"WHERE key IN ({placeholders}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (*batch, now),
+                ).fetchall()
+                values.update({key: json.loads(value) for key, value in rows})
+        return values
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for key, expiring after ttl seconds or the default ttl."""
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache every key and value in items."""
+        expires_at = self._expires_at(self.ttl if ttl is None else ttl)
+        rows = [(key, json.dumps(value), expires_at) for key, value in items.items()]
+        with self._lock:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, *keys: str) -> None:
+        """Remove keys from the cache."""
+        with self._lock:
+            self._connection.executemany(
+                f"DELETE FROM {self.table} WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class TieredCache(Cache):
+    """
+    Look values up in a series of caches, fastest first.
+
+    Values found in a slower tier are copied to the faster tiers, where they
+    expire after those tiers' default ttl. Values are set in and deleted from
+    every tier.
+    """
+
+    def __init__(self, *tiers: Cache) -> None:
+        """Combine tiers into a single cache."""
+        if not tiers:
+            raise ValueError("At least one cache tier is required.")
+        self.tiers = tiers
+
+    def get(self, key: str) -> Any:
+        """Return the value cached for key. Raise KeyError if it is not cached."""
+        values = self.get_many([key])
+        try:
+            return values[key]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return a dict of the cached values for those keys that are cached."""
+        missing = list(keys)
+        values: dict[str, Any] = {}
+        for i, tier in enumerate(self.tiers):
+            if not missing:
+                break
+            found = tier.get_many(missing)
+            if found:
+                for faster_tier in self.tiers[:i]:
+                    faster_tier.set_many(found)
+                values.update(found)
+                missing = [key for key in missing if key not in found]
+        return values
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for key in every tier."""
+        for tier in self.tiers:
+            tier.set(key, value, ttl=ttl)
+
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache every key and value in items in every tier."""
+        for tier in self.tiers:
+            tier.set_many(items, ttl=ttl)
+
+    def delete(self, *keys: str) -> None:
+        """Remove keys from every tier."""
+        for tier in self.tiers:
+            tier.delete(*keys)
+
+    def clear(self) -> None:
+        """Remove every entry from every tier."""
+        for tier in self.tiers:
+            tier.clear()
+
+
+class ResponseCache:
+    """
+    Cache API responses in memory, invalidated by tag.
+
+    Each response is cached with the tags it depends on. Invalidating a tag
+    makes every response cached with it stale, including responses to requests
+    that were in progress when the tag was invalidated.
+
+    Kwargs:
+        maxsize (int): The maximum number of responses to hold.
+    """
+
+    DEFAULT_MAXSIZE = 256
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Cache API responses in memory, invalidated by tag."""
+        self.cache = LRUCache(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._tag_versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _versions(self, tags: Iterable[str]) -> tuple[tuple[str, int], ...]:
+        with self._lock:
+            return tuple((tag, self._tag_versions.get(tag, 0)) for tag in tags)
+
+    def _get(self, key: Hashable) -> Any:
+        try:
+            response, versions = self.cache.get(key)
+        except KeyError:
+            pass
+        else:
+            if versions == self._versions(tag for tag, _ in versions):
+                with self._lock:
+                    self.hits += 1
+                return response
+            self.cache.delete(key)
+        with self._lock:
+            self.misses += 1
+        raise KeyError(key)
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        ttl: float,
+        tags: Iterable[str] = (),
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the response cached for key, or fetch and cache it.
+
+        A fetched response is cached for ttl seconds unless cacheable returns
+        False for it.
+        """
+        try:
+            return self._get(key)
+        except KeyError:
+            pass
+        versions = self._versions(tags)
+        response = fetch()
+        if cacheable is None or cacheable(response):
+            self.cache.set(key, (response, versions), ttl=ttl)
+        return response
+
+    def invalidate(self, *tags: str) -> None:
+        """Make every response cached with any of tags stale."""
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of cached responses, hits and misses."""
+        with self._lock:
+            return {"size": len(self.cache), "hits": self.hits, "misses": self.misses}
+
+
+class StockItemIDCache:
+    """
+    Cache the stock item IDs of product SKUs.
+
+    SKUs that do not exist are cached as None for negative_ttl seconds so that
+    they are not requested again on every lookup.
+
+    Kwargs:
+        cache (Cache): The cache to store IDs in. Defaults to an LRUCache.
+        ttl (float): The number of seconds stock item IDs are kept for.
+        negative_ttl (float): The number of seconds unknown SKUs are kept for.
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+    DEFAULT_NEGATIVE_TTL = 10 * 60
+
+    def __init__(
+        self,
+        cache: Optional[Cache] = None,
+        ttl: Optional[float] = DEFAULT_TTL,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+    ) -> None:
+        """Cache the stock item IDs of product SKUs."""
+        self.cache = LRUCache(maxsize=10000) if cache is None else cache
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    @classmethod
+    def with_sqlite(
+        cls,
+        path: Union[Path, str],
+        maxsize: int = 10000,
+        ttl: Optional[float] = DEFAULT_TTL,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+        namespace: Optional[str] = None,
+    ) -> "StockItemIDCache":
+        """
+        Return a cache backed by memory and the SQLite database at path.
+
+        IDs loaded from the database are kept in memory for at most
+        negative_ttl seconds, so SKUs found not to exist by another process
+        are not remembered for longer than that.
+
+        Stock item IDs are specific to a Linnworks account. If several
+        accounts share the database, pass each a different namespace, such as
+        LinnworksAPISession.token_store_key(), to keep their IDs in separate
+        tables.
+        """
+        memory_cache = LRUCache(maxsize=maxsize, ttl=negative_ttl)
+        if namespace is None:
+            sqlite_cache = SQLiteCache(path)
+        else:
+            namespace_hash = hashlib.sha256(namespace.encode()).hexdigest()
+            sqlite_cache = SQLiteCache(
+                path, table=f"linnapi_cache_{namespace_hash[:16]}"
+            )
+        cache = TieredCache(memory_cache, sqlite_cache)
+        return cls(cache=cache, ttl=ttl, negative_ttl=negative_ttl)
+
+    def lookup(self, skus: Iterable[str]) -> dict[str, Optional[str]]:
+        """
+        Return the cached stock item IDs for those SKUs that are cached.
+
+        SKUs known not to exist map to None.
+        """
+        return self.cache.get_many(skus)
+
+    def store(self, skus: Iterable[str], stock_item_ids: Mapping[str, str]) -> None:
+        """Cache the result of looking up skus, including those not found."""
+        self.cache.set_many(stock_item_ids, ttl=self.ttl)
+        unknown_skus = {sku: None for sku in skus if sku not in stock_item_ids}
+        if unknown_skus:
+            self.cache.set_many(unknown_skus, ttl=self.negative_ttl)
+
+    def invalidate(self, *skus: str) -> None:
+        """Remove SKUs from the cache, or every SKU if none are passed."""
+        if skus:
+            self.cache.delete(*skus)
+        else:
+            self.cache.clear()
+
+
+class StockLevelCache:
+    """
+    Cache stock level information by SKU, refreshing it in the background.
+
+    Entries younger than fresh_for seconds are fresh. Older entries may still be
+    returned by a read that accepts them, and are then refreshed in the
+    background. Only one background refresh runs for each SKU at a time.
+
+    Kwargs:
+        fresh_for (float): The number of seconds entries are fresh for.
+        maxsize (int): The maximum number of SKUs to hold.
+        max_workers (int): The number of background refreshes to run at once.
+    """
+
+    DEFAULT_FRESH_FOR = 30.0
+    DEFAULT_MAXSIZE = 10000
+
+    def __init__(
+        self,
+        fresh_for: float = DEFAULT_FRESH_FOR,
+        maxsize: int = DEFAULT_MAXSIZE,
+        max_workers: int = 2,
+    ) -> None:
+        """Cache stock level information by SKU."""
+        self.fresh_for = fresh_for
+        self.cache = LRUCache(maxsize=maxsize)
+        self.max_workers = max_workers
+        self.refresh_errors: collections.deque[BaseException] = collections.deque(
+            maxlen=100
+        )
+        self._refreshing: set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, skus: Iterable[str], max_staleness: float
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Return cached stock levels no older than max_staleness seconds.
+
+        Returns a dict of the usable stock levels by SKU and a list of the SKUs
+        among them that are no longer fresh.
+        """
+        now = time.time()
+        stock_levels = {}
+        stale_skus = []
+        for sku, (stock_level, cached_at) in self.cache.get_many(skus).items():
+            age = now - cached_at
+            if age > max_staleness:
+                continue
+            stock_levels[sku] = stock_level
+            if age >= self.fresh_for:
+                stale_skus.append(sku)
+        return stock_levels, stale_skus
+
+    def store(self, stock_levels: Mapping[str, Any]) -> None:
+        """Cache stock levels by SKU."""
+        now = time.time()
+        self.cache.set_many(
+            {sku: (stock_level, now) for sku, stock_level in stock_levels.items()}
+        )
+
+    def update(self, stock_levels: Iterable[Any]) -> None:
+        """
+        Cache stock levels returned by a stock level update.
+
+        A cached entry is only replaced by a stock level for the same location,
+        so an update at one location does not overwrite the level cached for
+        another.
+        """
+        stock_levels = list(stock_levels)
+        cached = self.cache.get_many(stock_level.sku for stock_level in stock_levels)
+        self.store(
+            {
+                stock_level.sku: stock_level
+                for stock_level in stock_levels
+                if stock_level.sku not in cached
+                or cached[stock_level.sku][0].location_id == stock_level.location_id
+            }
+        )
+
+    def invalidate(self, *skus: str) -> None:
+        """Remove SKUs from the cache, or every SKU if none are passed."""
+        if skus:
+            self.cache.delete(*skus)
+        else:
+            self.cache.clear()
+
+    def refresh(
+        self,
+        skus: Iterable[str],
+        fetch: Callable[[list[str]], Mapping[str, Any]],
+    ) -> Optional[Future]:
+        """
+        Refresh SKUs in the background with fetch, unless already refreshing.
+
+        fetch runs in a copy of the current context, so it uses the session
+        bound by the caller. Returns a future for the refresh, or None if every
+        SKU is already being refreshed. The most recent errors are kept in
+        self.refresh_errors.
+        """
+        with self._lock:
+            skus = [sku for sku in dict.fromkeys(skus) if sku not in self._refreshing]
+            if not skus:
+                return None
+            self._refreshing.update(skus)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="linnapi-stock-refresh",
+                )
+            executor = self._executor
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._refresh, skus, fetch)
+
+    def _refresh(
+        self, skus: list[str], fetch: Callable[[list[str]], Mapping[str, Any]]
+    ) -> None:
+        try:
+            self.store(fetch(skus))
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors.append(e)
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(skus)
+
+    def close(self) -> None:
+        """Wait for background refreshes to finish and stop their threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -35,3 +35,16 @@ class IncompleteResponseError(ValueError):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Exception raised wthen and API request returns a response with missing data."""
         super().__init__(*args, **kwargs)
+
+
+class PartialRequestError(Exception):
+    """Exception raised when some chunks of a multi-item request fail."""
+
+    def __init__(self, result: Any, failed_chunks: list[Any]) -> None:
+        """Exception raised when some chunks of a multi-item request fail."""
+        self.result = result
+        self.failed_chunks = failed_chunks
+        super().__init__(result, failed_chunks)
+
+    def __str__(self) -> str:
+        return f"{len(self.failed_chunks)} request chunk(s) failed."
@@ -1,9 +1,14 @@
 """Methods for interacting with the Linnworks inventory."""
 
-from typing import MutableMapping
+import heapq
+from concurrent.futures import as_completed
+from typing import Iterable, MutableMapping, Optional, Sequence
+
+import requests
 
 from linnapi import exceptions, models
-from linnapi.request import MultiItemRequest, make_request
+from linnapi.loader import BatchLoader
+from linnapi.request import MultiItemRequest, RequestExecutor, chunked, make_request
 from linnapi.requests.inventory import (
     AddImageToInventoryItem,
     BatchGetInventoryItemChannelSKUs,
@@ -17,10 +22,36 @@ from linnapi.requests.inventory import (
     SetStockLevelBySKU,
     UpdateImages,
 )
+from linnapi.session import LinnworksAPISession
 
 
 def get_stock_item_ids_by_sku(*skus: str) -> MutableMapping[str, str]:
-    """Return the stock item ID for a product SKU."""
+    """
+    Return the stock item ID for a product SKU.
+
+    If the current session has a stock item ID cache only SKUs missing from the
+    cache are requested. SKUs that do not exist are left out of the returned
+    dict.
+    """
+    cache = LinnworksAPISession.current().stock_item_id_cache
+    if cache is None:
+        return _request_stock_item_ids(skus)
+    stock_item_ids = cache.lookup(skus)
+    missing_skus = tuple(
+        sku for sku in dict.fromkeys(skus) if sku not in stock_item_ids
+    )
+    if missing_skus:
+        requested_ids = _request_stock_item_ids(missing_skus)
+        cache.store(missing_skus, requested_ids)
+        stock_item_ids.update(requested_ids)
+    return {
+        sku: stock_item_id
+        for sku, stock_item_id in stock_item_ids.items()
+        if stock_item_id is not None
+    }
+
+
+def _request_stock_item_ids(skus: tuple[str, ...]) -> dict[str, str]:
     response = make_request(GetStockItemIDsBySKU, skus=skus)
     try:
         return {item["SKU"]: item["StockItemId"] for item in response["Items"]}
@@ -29,14 +60,44 @@ def get_stock_item_ids_by_sku(*skus: str) -> MutableMapping[str, str]:
 
 
 def get_stock_item_id_by_sku(sku: str) -> str:
-    """Return the stock item ID for a product SKU."""
-    stock_item_ids = get_stock_item_ids_by_sku(sku)
+    """
+    Return the stock item ID for a product SKU.
+
+    If the current session has a stock item ID loader the lookup is combined
+    with concurrent lookups from other threads.
+    """
+    loader = LinnworksAPISession.current().stock_item_id_loader
     try:
-        return stock_item_ids[sku]
+        if loader is None:
+            return get_stock_item_ids_by_sku(sku)[sku]
+        return loader.load(sku)
     except KeyError as e:
         raise exceptions.InvalidResponseError("Requested SKU not in response.") from e
 
 
+class StockItemIDLoader(BatchLoader[str, str]):
+    """
+    Combine concurrent stock item ID lookups into batched requests.
+
+    SKUs requested within wait seconds of each other are looked up with a
+    single GetStockItemIDsBySKU request.
+    """
+
+    def __init__(
+        self,
+        wait: float = BatchLoader.DEFAULT_WAIT,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """Combine concurrent stock item ID lookups into batched requests."""
+        super().__init__(
+            lambda skus: get_stock_item_ids_by_sku(*skus),
+            wait=wait,
+            max_batch_size=max_batch_size
+            or GetStockItemIDsBySKU.MAX_ITEMS_PER_REQUEST
+            or BatchLoader.DEFAULT_MAX_BATCH_SIZE,
+        )
+
+
 def get_stock_level_by_stock_id(stock_item_id: str) -> models.StockLevelInfo:
     """Return stock level information for a product by stock item ID."""
     response = make_request(GetStockLevel, stock_item_id=stock_item_id)
@@ -58,10 +119,59 @@ def get_stock_level_by_sku(sku: str) -> models.StockLevelInfo:
         return stock_level_info
 
 
-def get_stock_levels_by_skus(*skus: str) -> dict[str, models.StockLevelInfo]:
-    """Return stock level information for multliple SKUs."""
-    stock_item_id_lookup = get_stock_item_ids_by_sku(*skus)
-    stock_item_ids = list(stock_item_id_lookup.values())
+def get_stock_levels_by_skus(
+    *skus: str, max_workers: int = 4, max_staleness: Optional[float] = None
+) -> dict[str, models.StockLevelInfo]:
+    """
+    Return stock level information for multliple SKUs.
+
+    SKUs are looked up in batches of GetStockItemIDsBySKU.MAX_ITEMS_PER_REQUEST.
+    Stock levels for each batch of stock item IDs are requested as soon as the
+    batch is resolved, using up to max_workers concurrent requests.
+
+    If the current session has a stock level cache, requested stock levels are
+    cached. If max_staleness is also passed, cached stock levels up to
+    max_staleness seconds old are returned without waiting for a request.
+    Those that are no longer fresh are refreshed in the background.
+    """
+    cache = LinnworksAPISession.current().stock_level_cache
+    if cache is None:
+        return _request_stock_levels(skus, max_workers=max_workers)
+    if max_staleness is None:
+        stock_levels = _request_stock_levels(skus, max_workers=max_workers)
+        cache.store(stock_levels)
+        return stock_levels
+    stock_levels, stale_skus = cache.lookup(skus, max_staleness=max_staleness)
+    if stale_skus:
+        cache.refresh(stale_skus, lambda skus: _request_stock_levels(skus, max_workers))
+    missing_skus = [sku for sku in dict.fromkeys(skus) if sku not in stock_levels]
+    if missing_skus:
+        requested_levels = _request_stock_levels(missing_skus, max_workers)
+        cache.store(requested_levels)
+        stock_levels.update(requested_levels)
+    return stock_levels
+
+
+def _request_stock_levels(
+    skus: Sequence[str], max_workers: int
+) -> dict[str, models.StockLevelInfo]:
+    sku_batches = chunked(skus, GetStockItemIDsBySKU.MAX_ITEMS_PER_REQUEST)
+    if len(sku_batches) == 1:
+        stock_item_id_lookup = get_stock_item_ids_by_sku(*skus)
+        stock_levels = _get_stock_level_batch(list(stock_item_id_lookup.values()))
+    else:
+        stock_levels = _get_stock_levels_pipelined(sku_batches, max_workers)
+    if set(skus) != set(stock_levels.keys()):
+        missing_skus = set(skus) - set(stock_levels.keys())
+        raise exceptions.IncompleteResponseError(
+            f"Incomplete Response: Missing SKUs {list(missing_skus)}"
+        )
+    return stock_levels
+
+
+def _get_stock_level_batch(
+    stock_item_ids: list[str],
+) -> dict[str, models.StockLevelInfo]:
     response = make_request(GetStockLevelBatch, stock_item_ids=stock_item_ids)
     stock_levels = {}
     try:
@@ -71,11 +181,27 @@ def get_stock_levels_by_skus(*skus: str) -> dict[str, models.StockLevelInfo]:
                 stock_levels[stock_level_info.sku] = stock_level_info
     except (KeyError, IndexError, TypeError) as e:
         raise exceptions.InvalidResponseError(f"Invalid Response: {response}") from e
-    if set(skus) != set(stock_levels.keys()):
-        missing_skus = set(skus) - set(stock_levels.keys())
-        raise exceptions.IncompleteResponseError(
-            f"Incomplete Response: Missing SKUs {list(missing_skus)}"
-        )
+    return stock_levels
+
+
+def _get_stock_levels_pipelined(
+    sku_batches: list[list[str]], max_workers: int
+) -> dict[str, models.StockLevelInfo]:
+    stock_levels: dict[str, models.StockLevelInfo] = {}
+    with RequestExecutor(max_workers=max_workers) as executor:
+        id_futures = [
+            executor.submit(get_stock_item_ids_by_sku, *sku_batch)
+            for sku_batch in sku_batches
+        ]
+        level_futures = []
+        for id_future in as_completed(id_futures):
+            stock_item_ids = list(id_future.result().values())
+            for id_batch in chunked(
+                stock_item_ids, GetStockLevelBatch.MAX_ITEMS_PER_REQUEST
+            ):
+                level_futures.append(executor.submit(_get_stock_level_batch, id_batch))
+        for level_future in level_futures:
+            stock_levels.update(level_future.result())
     return stock_levels
 
 
@@ -84,22 +210,197 @@ def set_stock_level(
 ) -> list[models.StockLevelInfo]:
     """Update the stock level for multiple products by SKU by a relative amount.
 
+    The current session's stock level cache, if any, is updated with the
+    returned stock levels.
+
     Kwargs:
         changes: tuple(tuple(SKU, level)).
         location_id: The ID of the product's location.
     """
-    response = make_request(
-        SetStockLevelBySKU,
-        location_id=location_id,
-        changes=changes,
-        change_source=change_source,
-    )
+    cache = LinnworksAPISession.current().stock_level_cache
     try:
-        stock_level_info = [models.StockLevelInfo(_) for _ in response]
-    except (KeyError, IndexError, TypeError) as e:
-        raise exceptions.InvalidResponseError(f"Invalid Response: {response}") from e
-    else:
-        return stock_level_info
+        response = make_request(
+            SetStockLevelBySKU,
+            location_id=location_id,
+            changes=changes,
+            change_source=change_source,
+        )
+        try:
+            stock_level_info = [models.StockLevelInfo(_) for _ in response]
+        except (KeyError, IndexError, TypeError) as e:
+            raise exceptions.InvalidResponseError(
+                f"Invalid Response: {response}"
+            ) from e
+    except Exception:
+        if cache is not None and changes:
+            cache.invalidate(*(sku for sku, _ in changes))
+        raise
+    if cache is not None:
+        cache.update(stock_level_info)
+    return stock_level_info
+
+
+class StockLevelUpdateRequester(MultiItemRequest):
+    """Requester for updating the stock level of multiple products by SKU."""
+
+    request_method = SetStockLevelBySKU
+
+    def add_request(  # type: ignore[override]
+        self, sku: str, level: int, location_id: str, change_source: str = ""
+    ) -> None:
+        """
+        Add a stock level change.
+
+        Kwargs:
+            sku (str): The SKU of the product to update.
+            level (int): The amount to change the stock level by.
+            location_id (str): The ID of the product's location.
+            change_source (str): The change source recorded in the stock history.
+        """
+        kwargs = {
+            "sku": sku,
+            "level": level,
+            "location_id": location_id,
+            "change_source": change_source,
+        }
+        self._add_request(kwargs)
+
+
+class StockLevelUpdateResult:
+    """
+    The outcome of a bulk stock level update.
+
+    Attributes:
+        stock_levels (list[models.StockLevelInfo]): Updated stock levels
+            returned for the chunks that succeeded.
+        failed_changes (list[tuple[str, int]]): The (SKU, level) changes in
+            chunks that failed. Pass these to bulk_set_stock_level to resend
+            them.
+        errors (list[Exception]): The error raised by each failed chunk.
+        skipped_changes (list[tuple[str, int]]): The (SKU, level) changes that
+            were not sent because they would not change the stock level.
+    """
+
+    def __init__(
+        self,
+        stock_levels: list[models.StockLevelInfo],
+        failed_changes: list[tuple[str, int]],
+        errors: list[BaseException],
+        skipped_changes: Optional[list[tuple[str, int]]] = None,
+    ) -> None:
+        """Record the outcome of a bulk stock level update."""
+        self.stock_levels = stock_levels
+        self.failed_changes = failed_changes
+        self.errors = errors
+        self.skipped_changes = skipped_changes or []
+
+    @property
+    def skipped_count(self) -> int:
+        """Return the number of changes that were not sent."""
+        return len(self.skipped_changes)
+
+    @property
+    def failed_skus(self) -> list[str]:
+        """Return the SKUs whose changes were not applied."""
+        return [sku for sku, _ in self.failed_changes]
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if every change was applied."""
+        return not self.failed_changes
+
+
+_CHUNK_FAILURES = (requests.RequestException, exceptions.InvalidResponseError)
+
+
+def bulk_set_stock_level(
+    changes: Iterable[tuple[str, int]],
+    location_id: str,
+    change_source: str = "",
+    max_workers: int = 4,
+    skip_unchanged: bool = False,
+) -> StockLevelUpdateResult:
+    """Update the stock level for many products by SKU by a relative amount.
+
+    Changes are sent in chunks of SetStockLevelBySKU.MAX_ITEMS_PER_REQUEST,
+    up to max_workers chunks at a time, within the endpoint's rate limit. A
+    failed chunk does not stop the others. Chunks that fail because a request
+    or its response fails are returned in the result rather than raised. Any
+    other error, such as an unauthorised session, is raised.
+
+    The current session's stock level cache, if any, is updated with the
+    returned stock levels. SKUs in failed chunks are removed from it.
+
+    If skip_unchanged is True, changes of 0, which would not change the stock
+    level, are not sent and are reported in the result's skipped_changes.
+
+    Kwargs:
+        changes: Iterable of (SKU, level), where level is the amount to change
+            the stock level by.
+        location_id: The ID of the products' location.
+        change_source: The change source recorded in the stock history.
+        max_workers: The maximum number of concurrent requests.
+        skip_unchanged: Do not send changes of 0.
+    """
+    changes = list(changes)
+    skipped_changes: list[tuple[str, int]] = []
+    if skip_unchanged:
+        skipped_changes = [(sku, level) for sku, level in changes if int(level) == 0]
+        changes = [(sku, level) for sku, level in changes if int(level) != 0]
+    requester = StockLevelUpdateRequester(max_workers=max_workers)
+    for sku, level in changes:
+        requester.add_request(
+            sku=sku, level=level, location_id=location_id, change_source=change_source
+        )
+    if not requester.requests:
+        return StockLevelUpdateResult(
+            stock_levels=[],
+            failed_changes=[],
+            errors=[],
+            skipped_changes=skipped_changes,
+        )
+    try:
+        requester.request()
+    except (exceptions.PartialRequestError, *_CHUNK_FAILURES):
+        pass
+    for chunk_result in requester.chunk_results:
+        if chunk_result.error is not None and not isinstance(
+            chunk_result.error, _CHUNK_FAILURES
+        ):
+            raise chunk_result.error
+    stock_levels: list[models.StockLevelInfo] = []
+    failed_changes: list[tuple[str, int]] = []
+    errors: list[BaseException] = []
+    for chunk_result in requester.chunk_results:
+        error = chunk_result.error
+        if error is None:
+            try:
+                chunk_stock_levels = [
+                    models.StockLevelInfo(_) for _ in chunk_result.response
+                ]
+            except (KeyError, IndexError, TypeError) as e:
+                error = exceptions.InvalidResponseError(
+                    f"Invalid Response: {chunk_result.response}"
+                )
+                error.__cause__ = e
+            else:
+                stock_levels.extend(chunk_stock_levels)
+                continue
+        failed_changes.extend(
+            (request["sku"], request["level"]) for request in chunk_result.requests
+        )
+        errors.append(error)
+    cache = LinnworksAPISession.current().stock_level_cache
+    if cache is not None:
+        if failed_changes:
+            cache.invalidate(*(sku for sku, _ in failed_changes))
+        cache.update(stock_levels)
+    return StockLevelUpdateResult(
+        stock_levels=stock_levels,
+        failed_changes=failed_changes,
+        errors=errors,
+        skipped_changes=skipped_changes,
+    )
 
 
 def add_image_to_inventory_item(
@@ -141,9 +442,71 @@ def get_stock_level_history_by_stock_item_id(
     stock_item_id: str,
     location_id: str,
     entries_per_page: int = 500,
-    page_number: int = 1,
+    page_number: int | None = None,
+    all_pages: bool = False,
+    max_workers: int = 4,
+    fields: Iterable[str] | None = None,
 ) -> list[models.StockItemHistoryRecord]:
-    """Return a history of stock level changes for a stock item ID."""
+    """
+    Return a history of stock level changes for a stock item ID.
+
+    Only page_number, by default the first page, is returned unless all_pages
+    is True, in which case every page is returned and page_number must not be
+    passed. The page count is read from the first page and the remaining pages
+    are requested using up to max_workers concurrent requests. Records are
+    returned newest first.
+
+    If fields is given only the StockItemHistoryRecord attributes it names are
+    set and the raw response data is not kept. The timestamp is always set, as
+    records are sorted by it.
+    """
+    if all_pages and page_number is not None:
+        raise ValueError("page_number cannot be passed with all_pages.")
+    if fields is not None:
+        fields = models.StockItemHistoryRecord.check_fields(
+            dict.fromkeys(("timestamp", *fields))
+        )
+    if not all_pages:
+        records, _ = _get_stock_level_history_page(
+            stock_item_id=stock_item_id,
+            location_id=location_id,
+            entries_per_page=entries_per_page,
+            page_number=page_number or 1,
+            fields=fields,
+        )
+        return records
+    first_page, total_pages = _get_stock_level_history_page(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=entries_per_page,
+        page_number=1,
+        fields=fields,
+    )
+    if total_pages <= 1:
+        return first_page
+    with RequestExecutor(max_workers=min(max_workers, total_pages - 1)) as executor:
+        futures = [
+            executor.submit(
+                _get_stock_level_history_page,
+                stock_item_id=stock_item_id,
+                location_id=location_id,
+                entries_per_page=entries_per_page,
+                page_number=page,
+                fields=fields,
+            )
+            for page in range(2, total_pages + 1)
+        ]
+        pages = [first_page] + [future.result()[0] for future in futures]
+    return list(heapq.merge(*pages, key=lambda record: record.timestamp, reverse=True))
+
+
+def _get_stock_level_history_page(
+    stock_item_id: str,
+    location_id: str,
+    entries_per_page: int,
+    page_number: int,
+    fields: Iterable[str] | None = None,
+) -> tuple[list[models.StockItemHistoryRecord], int]:
     response = make_request(
         GetItemChangesHistory,
         stock_item_id=stock_item_id,
@@ -152,21 +515,38 @@ def get_stock_level_history_by_stock_item_id(
         page_number=page_number,
     )
     try:
-        records = [models.StockItemHistoryRecord(_) for _ in response["Data"]]
-    except (KeyError, IndexError, TypeError) as e:
+        records = [
+            models.StockItemHistoryRecord(_, fields=fields) for _ in response["Data"]
+        ]
+        total_pages = int(response.get("TotalPages") or 0)
+    except (KeyError, IndexError, TypeError, AttributeError, ValueError) as e:
         raise exceptions.InvalidResponseError(f"Invalid Response: {response}") from e
-    else:
-        return sorted(records, key=lambda x: x.timestamp, reverse=True)
+    return sorted(records, key=lambda x: x.timestamp, reverse=True), total_pages
 
 
 def get_stock_level_history_by_sku(
     sku: str,
     location_id: str,
+    all_pages: bool = False,
+    fields: Iterable[str] | None = None,
+    entries_per_page: int = 500,
+    max_workers: int = 4,
 ) -> list[models.StockItemHistoryRecord]:
-    """Return a history of stock level changes for a product SKU."""
+    """
+    Return a history of stock level changes for a product SKU.
+
+    If all_pages is True every page of the history is returned, otherwise only
+    the first. See get_stock_level_history_by_stock_item_id for the other
+    arguments.
+    """
     stock_item_id = get_stock_item_id_by_sku(sku)
     return get_stock_level_history_by_stock_item_id(
-        stock_item_id=stock_item_id, location_id=location_id
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=entries_per_page,
+        all_pages=all_pages,
+        max_workers=max_workers,
+        fields=fields,
     )
 
 
@@ -0,0 +1,94 @@
+"""Coalesce concurrent lookups into batched requests."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, Hashable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Batch(Generic[K, V]):
+    def __init__(self) -> None:
+        self.futures: dict[K, Future[V]] = {}
+        self.full = threading.Event()
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Collect keys loaded at about the same time and look them up together.
+
+    The first call to load starts a batch and waits up to wait seconds, or
+    until max_batch_size keys have been added, before calling load_batch once
+    for every key in the batch. The batch is loaded in the context of the
+    thread that started it, so it uses the session bound by that caller. Each
+    caller receives the value for its own key.
+
+    Args:
+        load_batch (Callable): A function taking a list of keys and returning a
+            mapping of keys to values. Keys missing from the mapping raise
+            KeyError for the callers that requested them.
+
+    Kwargs:
+        wait (float): The number of seconds to collect keys for.
+        max_batch_size (int): The maximum number of keys to load at once.
+    """
+
+    DEFAULT_WAIT = 0.005
+    DEFAULT_MAX_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        load_batch: Callable[[list[K]], Mapping[K, V]],
+        wait: float = DEFAULT_WAIT,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Collect keys loaded at about the same time and look them up together."""
+        if wait < 0 or max_batch_size < 1:
+            raise ValueError("wait must not be negative and max_batch_size positive.")
+        self.load_batch = load_batch
+        self.wait = wait
+        self.max_batch_size = max_batch_size
+        self.batches_loaded = 0
+        self._batch: _Batch[K, V] | None = None
+        self._lock = threading.Lock()
+
+    def load(self, key: K) -> V:
+        """Return the value for key, loading it in a batch with concurrent calls."""
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if batch is None:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = Future()
+            if len(batch.futures) >= self.max_batch_size:
+                self._batch = None
+                batch.full.set()
+        if leader:
+            batch.full.wait(self.wait)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._dispatch(batch)
+        return future.result()
+
+    def _dispatch(self, batch: _Batch[K, V]) -> None:
+        keys = list(batch.futures)
+        try:
+            values = self.load_batch(keys)
+        except BaseException as e:
+            for future in batch.futures.values():
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        finally:
+            with self._lock:
+                self.batches_loaded += 1
+        for key, future in batch.futures.items():
+            try:
+                future.set_result(values[key])
+            except KeyError:
+                future.set_exception(KeyError(key))
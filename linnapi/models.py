@@ -1,50 +1,261 @@
 """Models for Linnworks API response data."""
 
+import contextlib
+import contextvars
 import datetime as dt
-from typing import Any
+import functools
+import json
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal
 
 import pytz
 
+RawRetention = Literal["full", "compact", "none"]
+RAW_RETENTION_MODES: tuple[RawRetention, ...] = ("full", "compact", "none")
 
+_default_raw_retention: RawRetention = "full"
+_raw_retention: contextvars.ContextVar[RawRetention | None] = contextvars.ContextVar(
+    "linnapi_raw_retention", default=None
+)
+
+
+def _check_raw_retention(mode: str) -> None:
+    if mode not in RAW_RETENTION_MODES:
+        raise ValueError(
+            f"Invalid raw retention mode {mode!r}, expected one of "
+            f"{', '.join(RAW_RETENTION_MODES)}."
+        )
+
+
+def get_raw_retention() -> RawRetention:
+    """Return the raw retention mode used for models created now."""
+    return _raw_retention.get() or _default_raw_retention
+
+
+def set_raw_retention(mode: RawRetention) -> None:
+    """
+    Set how models created from now on keep their raw response data.
+
+    Modes:
+        full: Keep the decoded response dict as model.raw. This is the default.
+        compact: Keep the response as compact JSON, decoded on access to raw.
+        none: Drop the response once parsed. Accessing raw raises
+            AttributeError.
+
+    The mode set by raw_retention takes precedence within its block.
+    """
+    global _default_raw_retention
+    _check_raw_retention(mode)
+    _default_raw_retention = mode
+
+
+@contextlib.contextmanager
+def raw_retention(mode: RawRetention) -> Iterator[None]:
+    """
+    Use a raw retention mode for models created within the block.
+
+    The mode applies to the current context, including requests made on
+    threads started by linnapi. See set_raw_retention for the modes.
+    """
+    _check_raw_retention(mode)
+    token = _raw_retention.set(mode)
+    try:
+        yield
+    finally:
+        _raw_retention.reset(token)
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date_time(date_time_string: str) -> dt.datetime:
-    """Return a date time string as datetime.datetime."""
-    numeric_string = date_time_string.replace("Z", "")
-    date, time = numeric_string.split("T")
-    year, month, day = date.split("-")
-    if "." in time:
-        time, microsecond = time.split(".")
-        microsecond = microsecond[:6]
-    else:
-        microsecond = "0"
-    hour, minute, second = time.split(":")
+    """
+    Return an ISO 8601 date time string as a UTC datetime.datetime.
+
+    Date times without a timezone are assumed to be UTC. Results are memoised,
+    as the same timestamps recur across many records.
+    """
     try:
-        date_time = dt.datetime(
-            year=int(year),
-            month=int(month),
-            day=int(day),
-            hour=int(hour),
-            minute=int(minute),
-            second=int(second),
-            microsecond=int(microsecond),
-        )
-    except ValueError:
+        date_time = dt.datetime.fromisoformat(date_time_string)
+    except (TypeError, ValueError):
         raise ValueError(f"Error parsing datestring {date_time_string!r}.") from None
-    date_time.replace(tzinfo=pytz.utc)
+    if date_time.tzinfo is None:
+        return date_time.replace(tzinfo=pytz.utc)
+    return date_time.astimezone(pytz.utc)
+
+
+def _parse_optional_date_time(date_time_string: str) -> dt.datetime | None:
+    date_time = parse_date_time(date_time_string)
+    if date_time.year == 1:
+        return None
     return date_time
 
 
-class StockLevelInfo:
+class _Model:
+    """
+    Base class for models of response data.
+
+    Attributes in _lazy_fields map to the key they are read from and the
+    function converting the value. While the raw data is retained in full they
+    are converted on first access and kept, so models are cheap to create when
+    they are not read. Otherwise they are converted when the model is created.
+    Other attributes are set by each model's __init__.
+
+    Models with a _fields table, mapping every attribute to its key and
+    conversion, can be created with only some of their attributes. See
+    _project.
+    """
+
+    __slots__ = ("_raw",)
+
+    _raw: dict[str, Any] | bytes | None
+    _lazy_fields: dict[str, tuple[str, Callable[[Any], Any]]] = {}
+    _lazy_keys: frozenset[str] = frozenset()
+    _fields: dict[str, tuple[str, Callable[[Any], Any] | None]] = {}
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._lazy_keys = frozenset(key for key, _ in cls._lazy_fields.values())
+
+    def _set_raw(self, data: dict[str, Any]) -> None:
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"{type(self).__name__} requires a dict, not {type(data).__name__}."
+            )
+        if not self._lazy_keys <= data.keys():
+            raise KeyError(min(self._lazy_keys - data.keys()))
+        self.raw = data
+        if self._raw is not data:
+            for name, (key, convert) in self._lazy_fields.items():
+                setattr(self, name, convert(data[key]))
+
+    def _project(self, data: dict[str, Any], fields: Iterable[str]) -> None:
+        """
+        Set only the attributes named in fields from data.
+
+        The raw data is not kept, whatever the raw retention mode, and reading
+        any other attribute raises AttributeError.
+        """
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"{type(self).__name__} requires a dict, not {type(data).__name__}."
+            )
+        self._raw = None
+        for name in fields:
+            try:
+                key, convert = self._fields[name]
+            except KeyError:
+                raise ValueError(
+                    f"{type(self).__name__} has no field {name!r}."
+                ) from None
+            value = data[key]
+            setattr(self, name, value if convert is None else convert(value))
+
+    @classmethod
+    def check_fields(cls, fields: Iterable[str]) -> tuple[str, ...]:
+        """
+        Return fields as a tuple of attribute names that can be projected.
+
+        Raises:
+            ValueError: If the model does not support projection or a name is
+                not one of its attributes.
+        """
+        fields = tuple(fields)
+        unknown = [name for name in fields if name not in cls._fields]
+        if unknown:
+            raise ValueError(
+                f"{cls.__name__} has no field {', '.join(map(repr, unknown))}."
+            )
+        return fields
+
+    def _raw_not_retained_error(self) -> AttributeError:
+        return AttributeError(
+            f"{type(self).__name__} was created without retaining raw data."
+        )
+
+    # __getattr__ is hidden from mypy, which would otherwise accept any
+    # attribute name on a model and stop catching misspelt attributes. Lazy
+    # fields are declared with class annotations instead.
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if name == "raw":
+                # Python calls __getattr__ when the raw property raises
+                # AttributeError, so raise its error again rather than a
+                # generic one.
+                raise self._raw_not_retained_error()
+            lazy_field = self._lazy_fields.get(name)
+            if lazy_field is not None and self._raw is not None:
+                key, convert = lazy_field
+                value = convert(self.raw[key])
+                setattr(self, name, value)
+                return value
+            if name in self._fields:
+                raise AttributeError(
+                    f"{name!r} was not among the fields loaded for this "
+                    f"{type(self).__name__}."
+                )
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """Return the response data the model was created from."""
+        if self._raw is None:
+            raise self._raw_not_retained_error()
+        if isinstance(self._raw, bytes):
+            data: dict[str, Any] = json.loads(self._raw)
+            return data
+        return self._raw
+
+    @raw.setter
+    def raw(self, data: dict[str, Any]) -> None:
+        mode = get_raw_retention()
+        if mode == "full":
+            self._raw = data
+        elif mode == "compact":
+            self._raw = json.dumps(data, separators=(",", ":")).encode()
+        else:
+            self._raw = None
+
+
+class StockLevelInfo(_Model):
     """Model for product stock level information."""
 
+    __slots__ = (
+        "available",
+        "due",
+        "in_order_book",
+        "in_orders",
+        "jit",
+        "last_update_date",
+        "location_is_fulfillment_center",
+        "location_is_warehouse_managed",
+        "location_name",
+        "location_id",
+        "location_int_id",
+        "minimum_level",
+        "pending_update",
+        "sku",
+        "stock_item_id",
+        "stock_item_int_id",
+        "stock_item_purchase_price",
+        "stock_level",
+        "stock_value",
+        "unit_cost",
+        "row_id",
+    )
+
+    _lazy_fields = {"last_update_date": ("LastUpdateDate", parse_date_time)}
+
+    last_update_date: dt.datetime
+
     def __init__(self, stock_level_data: dict[str, Any]):
         """Model for product stock level information."""
-        self.raw = stock_level_data
+        self._set_raw(stock_level_data)
         self.available = stock_level_data["Available"]
         self.due = stock_level_data["Due"]
         self.in_order_book = stock_level_data["InOrderBook"]
         self.in_orders = stock_level_data["InOrders"]
         self.jit = stock_level_data["JIT"]
-        self.last_update_date = parse_date_time(stock_level_data["LastUpdateDate"])
         self.location_is_fulfillment_center = stock_level_data["Location"][
             "IsFulfillmentCenter"
         ]
@@ -67,9 +278,16 @@ class StockLevelInfo:
         self.row_id = stock_level_data["rowid"]
 
 
-class InventoryItemImage:
+class InventoryItemImage(_Model):
     """Model for inventory image information."""
 
+    __slots__ = (
+        "stock_item_id",
+        "image_id",
+        "image_url",
+        "image_thumbnail_url",
+    )
+
     def __init__(self, inventory_image: dict[str, Any]):
         """Model for inventory image information."""
         self.raw = inventory_image
@@ -79,9 +297,20 @@ class InventoryItemImage:
         self.image_thumbnail_url: str = inventory_image["ImageThumbnailUrl"]
 
 
-class StockItemImage:
+class StockItemImage(_Model):
     """Model for stock item image information."""
 
+    __slots__ = (
+        "source",
+        "full_source",
+        "checksum_value",
+        "image_id",
+        "is_main",
+        "sort_order",
+        "stock_item_id",
+        "stock_item_int_id",
+    )
+
     def __init__(self, stock_item_image: dict[str, Any]):
         """Model for stock item image information."""
         self.raw = stock_item_image
@@ -95,19 +324,124 @@ class StockItemImage:
         self.stock_item_int_id: int = stock_item_image["StockItemIntId"]
 
 
-class ProcessedOrder:
+class ProcessedOrder(_Model):
     """Model for processed orders."""
 
-    def __init__(self, processed_order: dict[str, Any]):
-        """Model for processed orders."""
-        self.raw = processed_order
+    __slots__ = (
+        "order_guid",
+        "received_date",
+        "processed_at",
+        "time_diff",
+        "postage_cost",
+        "total_charge",
+        "postage_cost_ex_tax",
+        "subtotal",
+        "tax",
+        "total_discount",
+        "profit_margin",
+        "country_tax_rate",
+        "order_id",
+        "status_number",
+        "currency",
+        "tracking_number",
+        "country",
+        "source",
+        "subsource",
+        "postal_service",
+        "reference_number",
+        "secondary_reference",
+        "external_reference",
+        "address_1",
+        "address_2",
+        "address_3",
+        "town",
+        "region",
+        "buyer_phone_number",
+        "company",
+        "channel_buyer_name",
+        "account_name",
+        "customer_full_name",
+        "customer_email_address",
+        "customer_post_code",
+        "paid_at",
+        "cancelled_at",
+        "item_weight",
+        "total_weight",
+        "hold_or_cancel",
+        "is_resend",
+        "is_exchange",
+        "tax_id",
+        "fulfilment_location_name",
+    )
+
+    _lazy_fields = {
+        "received_date": ("dReceivedDate", parse_date_time),
+        "processed_at": ("dProcessedOn", parse_date_time),
+        "paid_at": ("dPaidOn", parse_date_time),
+        "cancelled_at": ("dCancelledOn", _parse_optional_date_time),
+    }
+    _fields = {
+        "order_guid": ("pkOrderID", None),
+        "time_diff": ("timeDiff", float),
+        "postage_cost": ("fPostageCost", float),
+        "total_charge": ("fTotalCharge", float),
+        "postage_cost_ex_tax": ("PostageCostExTax", float),
+        "subtotal": ("Subtotal", float),
+        "tax": ("fTax", float),
+        "total_discount": ("TotalDiscount", float),
+        "profit_margin": ("ProfitMargin", float),
+        "country_tax_rate": ("CountryTaxRate", float),
+        "order_id": ("nOrderId", str),
+        "status_number": ("nStatus", int),
+        "currency": ("cCurrency", None),
+        "tracking_number": ("PostalTrackingNumber", None),
+        "country": ("cCountry", None),
+        "source": ("Source", None),
+        "subsource": ("SubSource", None),
+        "postal_service": ("PostalServiceName", None),
+        "reference_number": ("ReferenceNum", None),
+        "secondary_reference": ("SecondaryReference", None),
+        "external_reference": ("ExternalReference", None),
+        "address_1": ("Address1", None),
+        "address_2": ("Address2", None),
+        "address_3": ("Address3", None),
+        "town": ("Town", None),
+        "region": ("Region", None),
+        "buyer_phone_number": ("BuyerPhoneNumber", None),
+        "company": ("Company", None),
+        "channel_buyer_name": ("ChannelBuyerName", None),
+        "account_name": ("AccountName", None),
+        "customer_full_name": ("cFullName", None),
+        "customer_email_address": ("cEmailAddress", None),
+        "customer_post_code": ("cPostCode", None),
+        "item_weight": ("ItemWeight", int),
+        "total_weight": ("TotalWeight", int),
+        "hold_or_cancel": ("HoldOrCancel", None),
+        "is_resend": ("IsResend", None),
+        "is_exchange": ("IsExchange", None),
+        "tax_id": ("TaxId", None),
+        "fulfilment_location_name": ("FulfilmentLocationName", None),
+        **_lazy_fields,
+    }
+
+    received_date: dt.datetime
+    processed_at: dt.datetime
+    paid_at: dt.datetime
+    cancelled_at: dt.datetime | None
+
+    def __init__(
+        self, processed_order: dict[str, Any], fields: Iterable[str] | None = None
+    ):
+        """
+        Model for processed orders.
+
+        If fields is given only the attributes it names are set.
+        """
+        if fields is not None:
+            self._project(processed_order, fields)
+            return
+        self._set_raw(processed_order)
         self.order_guid: str = processed_order["pkOrderID"]
-        self.received_date: dt.datetime = parse_date_time(
-            processed_order["dReceivedDate"]
-        )
-        self.processed_at: dt.datetime = parse_date_time(
-            processed_order["dProcessedOn"]
-        )
         self.time_diff = float(processed_order["timeDiff"])
         self.postage_cost = float(processed_order["fPostageCost"])
         self.total_charge = float(processed_order["fTotalCharge"])
@@ -140,12 +474,6 @@ class ProcessedOrder:
         self.customer_full_name: str = processed_order["cFullName"]
         self.customer_email_address: str = processed_order["cEmailAddress"]
         self.customer_post_code: str = processed_order["cPostCode"]
-        self.paid_at: dt.datetime = parse_date_time(processed_order["dPaidOn"])
-        self.cancelled_at: dt.datetime | None = parse_date_time(
-            processed_order["dCancelledOn"]
-        )
-        if self.cancelled_at.year == 1:
-            self.cancelled_at = None
         self.item_weight = int(processed_order["ItemWeight"])
         self.total_weight = int(processed_order["TotalWeight"])
         self.hold_or_cancel: bool = processed_order["HoldOrCancel"]
@@ -155,11 +483,42 @@ class ProcessedOrder:
         self.fulfilment_location_name: str = processed_order["FulfilmentLocationName"]
 
 
-class OrderAuditTrailEntry:
+class OrderAuditTrailEntry(_Model):
     """Model for order audit trail entries."""
 
-    def __init__(self, audit_trail_entry: dict[str, Any]):
-        """Model for order audit trail entries."""
+    __slots__ = (
+        "history_id",
+        "order_guid",
+        "history_note",
+        "timestamp",
+        "tag",
+        "updated_by",
+        "audit_type",
+        "type_description",
+    )
+
+    _fields = {
+        "history_id": ("sid_history", None),
+        "order_guid": ("fkOrderId", None),
+        "history_note": ("HistoryNote", None),
+        "timestamp": ("DateStamp", parse_date_time),
+        "tag": ("Tag", None),
+        "updated_by": ("UpdatedBy", None),
+        "audit_type": ("fkOrderHistoryTypeId", None),
+        "type_description": ("TypeDescription", None),
+    }
+
+    def __init__(
+        self, audit_trail_entry: dict[str, Any], fields: Iterable[str] | None = None
+    ):
+        """
+        Model for order audit trail entries.
+
+        If fields is given only the attributes it names are set.
+        """
+        if fields is not None:
+            self._project(audit_trail_entry, fields)
+            return
         self.raw = audit_trail_entry
         self.history_id: int = audit_trail_entry["sid_history"]
         self.order_guid: str = audit_trail_entry["fkOrderId"]
@@ -171,11 +530,36 @@ class OrderAuditTrailEntry:
         self.type_description: str = audit_trail_entry["TypeDescription"]
 
 
-class StockItemHistoryRecord:
+class StockItemHistoryRecord(_Model):
     """Model for stock item history records."""
 
-    def __init__(self, stock_item_record: dict[str, Any]):
-        """Model for stock item history records."""
+    __slots__ = (
+        "timestamp",
+        "stock_level",
+        "text",
+        "relative_change",
+        "stock_item_id",
+    )
+
+    _fields = {
+        "timestamp": ("Date", parse_date_time),
+        "stock_level": ("Level", None),
+        "text": ("Note", None),
+        "relative_change": ("ChangeQty", None),
+        "stock_item_id": ("StockItemId", None),
+    }
+
+    def __init__(
+        self, stock_item_record: dict[str, Any], fields: Iterable[str] | None = None
+    ):
+        """
+        Model for stock item history records.
+
+        If fields is given only the attributes it names are set.
+        """
+        if fields is not None:
+            self._project(stock_item_record, fields)
+            return
         self.raw = stock_item_record
         self.timestamp = parse_date_time(stock_item_record["Date"])
         self.stock_level = stock_item_record["Level"]
@@ -184,19 +568,40 @@ class StockItemHistoryRecord:
         self.stock_item_id = stock_item_record["StockItemId"]
 
 
-class ChannelLinkedItem:
+class ChannelLinkedItem(_Model):
     """Model for channel linked items."""
 
+    __slots__ = (
+        "channel_sku_id",
+        "sku",
+        "source",
+        "sub_source",
+        "update_status",
+        "channel_reference_id",
+        "last_update",
+        "max_listed_quantity",
+        "end_when_stock",
+        "submitted_quantity",
+        "listed_quantity",
+        "stock_percentage",
+        "ignore_sync",
+        "is_multi_location",
+        "stock_item_id",
+    )
+
+    _lazy_fields = {"last_update": ("LastUpdate", parse_date_time)}
+
+    last_update: dt.datetime
+
     def __init__(self, channel_linked_item: dict[str, Any]):
         """Model for channel linked items."""
-        self.raw = channel_linked_item
+        self._set_raw(channel_linked_item)
         self.channel_sku_id = channel_linked_item["ChannelSKURowId"]
         self.sku = channel_linked_item["SKU"]
         self.source = channel_linked_item["Source"]
         self.sub_source = channel_linked_item["SubSource"]
         self.update_status = channel_linked_item["UpdateStatus"]
         self.channel_reference_id = channel_linked_item["ChannelReferenceId"]
-        self.last_update = parse_date_time(channel_linked_item["LastUpdate"])
         self.max_listed_quantity = channel_linked_item["MaxListedQuantity"]
         self.end_when_stock = channel_linked_item["EndWhenStock"]
         self.submitted_quantity = channel_linked_item["SubmittedQuantity"]
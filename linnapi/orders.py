@@ -1,7 +1,9 @@
 """Methods for interacting with Linnworks orders."""
 
+from typing import Iterable, Iterator
+
 from linnapi import exceptions, models
-from linnapi.request import make_request
+from linnapi.request import RequestExecutor, make_request
 from linnapi.requests.orders import (
     GetOrderDetailsByNumOrderId,
     GetProcessedAuditTrail,
@@ -9,32 +11,98 @@ from linnapi.requests.orders import (
 )
 
 
-def search_processed_orders(search_term: str) -> list[models.ProcessedOrder]:
-    """Return a search for processed orders."""
-    page_number = 1
-    total_pages = 2
-    processed_orders = []
-    while page_number <= total_pages:
-        response = make_request(
-            SearchProcessedOrders, search_term=search_term, page_number=page_number
-        )
-        try:
-            total_pages = response["ProcessedOrders"]["TotalPages"]
-            processed_orders.extend(
-                [
-                    models.ProcessedOrder(order)
-                    for order in response["ProcessedOrders"]["Data"]
-                ]
+def search_processed_orders(
+    search_term: str, max_workers: int = 4, fields: Iterable[str] | None = None
+) -> list[models.ProcessedOrder]:
+    """
+    Return a search for processed orders.
+
+    The page count is read from the first page of results and the remaining
+    pages are requested using up to max_workers concurrent requests. Orders are
+    returned in page order.
+
+    If fields is given only the ProcessedOrder attributes it names are set and
+    the raw response data is not kept.
+    """
+    if fields is not None:
+        fields = models.ProcessedOrder.check_fields(fields)
+    processed_orders, total_pages = _search_processed_orders_page(
+        search_term=search_term, page_number=1, fields=fields
+    )
+    if total_pages <= 1:
+        return processed_orders
+    with RequestExecutor(max_workers=min(max_workers, total_pages - 1)) as executor:
+        futures = [
+            executor.submit(
+                _search_processed_orders_page,
+                search_term=search_term,
+                page_number=page_number,
+                fields=fields,
             )
-        except (KeyError, IndexError, TypeError):
-            raise exceptions.InvalidResponseError(
-                f"Invalid Response: {response}"
-            ) from None
-        else:
-            page_number += 1
+            for page_number in range(2, total_pages + 1)
+        ]
+        for future in futures:
+            processed_orders.extend(future.result()[0])
     return processed_orders
 
 
+def iter_processed_orders(
+    search_term: str, fields: Iterable[str] | None = None
+) -> Iterator[models.ProcessedOrder]:
+    """
+    Yield the results of a search for processed orders one page at a time.
+
+    The next page is requested in the background while the orders of the
+    current page are being consumed, so at most two pages of orders are held
+    in memory at once.
+
+    If fields is given only the ProcessedOrder attributes it names are set and
+    the raw response data is not kept.
+    """
+    if fields is not None:
+        fields = models.ProcessedOrder.check_fields(fields)
+    return _iter_processed_orders(search_term=search_term, fields=fields)
+
+
+def _iter_processed_orders(
+    search_term: str, fields: Iterable[str] | None
+) -> Iterator[models.ProcessedOrder]:
+    processed_orders, total_pages = _search_processed_orders_page(
+        search_term=search_term, page_number=1, fields=fields
+    )
+    with RequestExecutor(max_workers=1) as executor:
+        try:
+            for page_number in range(2, total_pages + 1):
+                next_page = executor.submit(
+                    _search_processed_orders_page,
+                    search_term=search_term,
+                    page_number=page_number,
+                    fields=fields,
+                )
+                yield from processed_orders
+                processed_orders, _ = next_page.result()
+            yield from processed_orders
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _search_processed_orders_page(
+    search_term: str, page_number: int, fields: Iterable[str] | None = None
+) -> tuple[list[models.ProcessedOrder], int]:
+    response = make_request(
+        SearchProcessedOrders, search_term=search_term, page_number=page_number
+    )
+    try:
+        total_pages = response["ProcessedOrders"]["TotalPages"]
+        processed_orders = [
+            models.ProcessedOrder(order, fields=fields)
+            for order in response["ProcessedOrders"]["Data"]
+        ]
+    except (KeyError, IndexError, TypeError):
+        raise exceptions.InvalidResponseError(f"Invalid Response: {response}") from None
+    return processed_orders, total_pages
+
+
 def get_order_guid_by_order_id(order_id: str) -> str:
     """Return the GUID id for an order by order ID."""
     try:
@@ -52,12 +120,21 @@ def get_order_guid_by_order_id(order_id: str) -> str:
 
 
 def get_processed_order_audit_trail(
-    order_guid: str,
+    order_guid: str, fields: Iterable[str] | None = None
 ) -> list[models.OrderAuditTrailEntry]:
-    """Return the the audit trail for a processed order."""
+    """
+    Return the the audit trail for a processed order.
+
+    If fields is given only the OrderAuditTrailEntry attributes it names are set
+    and the raw response data is not kept.
+    """
+    if fields is not None:
+        fields = models.OrderAuditTrailEntry.check_fields(fields)
     response = make_request(GetProcessedAuditTrail, order_guid=order_guid)
     try:
-        audit_trail = [models.OrderAuditTrailEntry(entry) for entry in response]
+        audit_trail = [
+            models.OrderAuditTrailEntry(entry, fields=fields) for entry in response
+        ]
     except (KeyError, IndexError, TypeError):
         raise exceptions.InvalidResponseError(f"Invalid Response: {response}") from None
     else:
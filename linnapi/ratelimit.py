@@ -0,0 +1,105 @@
+"""Client side rate limiting for Linnworks API requests."""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimit:
+    """
+    A rate limit declared by a Linnworks API endpoint.
+
+    Args:
+        calls (int): The number of calls allowed per period.
+
+    Kwargs:
+        period (float): The length of the period in seconds.
+        burst (int): The number of calls that may be made at once before calls
+            are spaced out. Keep this low so that bursts and the steady rate
+            together stay inside the server's limit.
+    """
+
+    def __init__(self, calls: int, period: float = 60.0, burst: int = 1) -> None:
+        """Declare a rate limit of calls per period."""
+        if calls < 1 or period <= 0 or burst < 1:
+            raise ValueError("calls, period and burst must be positive.")
+        self.calls = calls
+        self.period = period
+        self.burst = burst
+
+    @property
+    def rate(self) -> float:
+        """Return the number of calls allowed per second."""
+        return self.calls / self.period
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimit(calls={self.calls}, period={self.period}, burst={self.burst})"
+        )
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket enforcing a rate limit.
+
+    Callers that find the bucket empty reserve the next token and sleep until
+    it is due, so waiting threads are released one at a time at the allowed
+    rate.
+    """
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        """Create a full token bucket for rate_limit."""
+        self.rate_limit = rate_limit
+        self._tokens = float(rate_limit.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(
+                float(self.rate_limit.burst),
+                self._tokens + elapsed * self.rate_limit.rate,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_limit.rate
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available. Return the time waited."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Token buckets for the rate limited endpoints used by one account."""
+
+    def __init__(self) -> None:
+        """Token buckets for the rate limited endpoints used by one account."""
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(
+        self, key: str, rate_limit: Optional[RateLimit]
+    ) -> Optional[TokenBucket]:
+        """Return the token bucket for key, or None if rate_limit is None."""
+        if rate_limit is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.rate_limit is not rate_limit:
+                bucket = TokenBucket(rate_limit)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, key: str, rate_limit: Optional[RateLimit]) -> float:
+        """Wait for a call to key to be allowed. Return the time waited."""
+        bucket = self.bucket(key, rate_limit)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
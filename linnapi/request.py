@@ -1,22 +1,42 @@
 """Methods for making Linnworks API requests."""
 
-from typing import Any, MutableMapping, Type
+import contextvars
+import json as json_module
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, MutableMapping, Optional, Sequence, Type, TypeVar
 
 import requests
 
+from . import exceptions
+from .ratelimit import RateLimit
+from .retry import RetryPolicy
 from .session import LinnworksAPISession
 
+T = TypeVar("T")
+
 
 class LinnworksAPIRequest:
     """Base class for Linnworks API requests."""
 
-    URL = ""
+    PATH = ""
 
     GET = "GET"
     POST = "POST"
 
     METHOD = GET
 
+    READ_ONLY = False
+    RETRY_POLICY = RetryPolicy()
+    RATE_LIMIT: Optional[RateLimit] = None
+    MAX_ITEMS_PER_REQUEST: Optional[int] = None
+    CACHE_TTL: Optional[float] = None
+
+    @classmethod
+    def url(cls, server: str) -> str:
+        """Return the request URL for the Linnworks server at server."""
+        return f"{server.rstrip('/')}{cls.PATH}"
+
     @classmethod
     def headers(cls, *args: Any, **kwargs: Any) -> MutableMapping[str, str]:
         """Return request headers."""
@@ -44,6 +64,16 @@ class LinnworksAPIRequest:
         """Parse the request response."""
         return response.json()
 
+    @classmethod
+    def cache_tags(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return tags that invalidate a cached response to the request."""
+        return [cls.__name__]
+
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        return []
+
     @classmethod
     def multi_headers(
         cls, requests: list[MutableMapping[str, Any]]
@@ -81,15 +111,94 @@ class LinnworksAPIRequest:
         """Parse the request response."""
         return cls.parse_response(response, requests[0])
 
+    @classmethod
+    def multi_invalidates(cls, requests: list[MutableMapping[str, Any]]) -> list[str]:
+        """Return the cache tags made stale by sending the requests."""
+        tags = (tag for request in requests for tag in cls.invalidates(**request))
+        return list(dict.fromkeys(tags))
+
+    @classmethod
+    def multi_merge_responses(cls, responses: list[Any]) -> Any:
+        """
+        Merge the parsed responses of a multi-item request sent in chunks.
+
+        A single response is returned unchanged, list responses are concatenated
+        and other responses are returned as a list. Request classes whose parsed
+        responses are not lists should override this so that the merged
+        response has the same type however many chunks were sent.
+        """
+        if len(responses) == 1:
+            return responses[0]
+        if all(isinstance(response, list) for response in responses):
+            return [item for response in responses for item in response]
+        return responses
+
+
+def chunked(items: Sequence[T], size: Optional[int]) -> list[list[T]]:
+    """Return items split into lists of at most size items."""
+    if not size or len(items) <= size:
+        return [list(items)]
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+class RequestExecutor(ThreadPoolExecutor):
+    """
+    Thread pool for making requests concurrently.
+
+    Submitted calls run in a copy of the submitting context, so they use the
+    session bound by the caller.
+    """
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future:
+        """Submit fn to run in a copy of the current context."""
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
+
+
+class ChunkResult:
+    """The outcome of sending one chunk of a multi-item request."""
+
+    def __init__(
+        self,
+        requests: list[MutableMapping[str, Any]],
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record the outcome of sending one chunk of a multi-item request."""
+        self.requests = requests
+        self.response = response
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if the chunk was sent and parsed without error."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "succeeded" if self.succeeded else f"failed: {self.error!r}"
+        return f"<ChunkResult {len(self.requests)} items {status}>"
+
 
 class MultiItemRequest:
-    """Base class for multi-item requesters."""
+    """
+    Base class for multi-item requesters.
+
+    Added requests are sent in chunks of at most
+    request_method.MAX_ITEMS_PER_REQUEST items, up to max_workers chunks at a
+    time.
+    """
 
     request_method = LinnworksAPIRequest
 
-    def __init__(self) -> None:
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         """Create a request with multiple repeated parameters."""
         self.requests: list[MutableMapping[str, Any]] = []
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.chunk_results: list[ChunkResult] = []
 
     def _add_request(self, request: MutableMapping[str, Any]) -> None:
         self.requests.append(request)
@@ -98,39 +207,194 @@ class MultiItemRequest:
         """Add a request to the request list."""
         raise NotImplementedError
 
+    def chunks(self) -> list[list[MutableMapping[str, Any]]]:
+        """Return the added requests split into chunks that can be sent at once."""
+        return chunked(self.requests, self.request_method.MAX_ITEMS_PER_REQUEST)
+
+    @property
+    def failed_requests(self) -> list[MutableMapping[str, Any]]:
+        """Return the added requests belonging to chunks that failed."""
+        return [
+            request
+            for chunk_result in self.chunk_results
+            if not chunk_result.succeeded
+            for request in chunk_result.requests
+        ]
+
     def request(self) -> Any:
-        """Make request with added parameters."""
-        headers = LinnworksAPISession.request_headers()
-        headers.update(self.request_method.multi_headers(self.requests))
-        params = self.request_method.multi_params(self.requests)
-        data = self.request_method.multi_data(self.requests)
-        json = self.request_method.multi_json(self.requests)
-        response = LinnworksAPISession.session.request(
-            url=self.request_method.URL,
-            method=self.request_method.METHOD,
-            headers=headers,
-            params=params,
-            data=data,
-            json=json,
+        """
+        Make requests with the added parameters and return the merged response.
+
+        The outcome of each chunk is recorded in self.chunk_results. A chunk
+        fails if sending or parsing it raises, including when the response has
+        an unsuccessful status code. If the requests fit in one chunk any error
+        is raised as is. Otherwise the remaining chunks are still sent when one
+        fails and exceptions.PartialRequestError is raised with the merged
+        responses of the chunks that succeeded.
+        """
+        chunks = self.chunks()
+        if len(chunks) == 1:
+            try:
+                response = self._request_chunk(chunks[0])
+            except Exception as e:
+                self.chunk_results = [ChunkResult(chunks[0], error=e)]
+                raise
+            self.chunk_results = [ChunkResult(chunks[0], response=response)]
+            return response
+        with RequestExecutor(max_workers=min(self.max_workers, len(chunks))) as pool:
+            futures = [pool.submit(self._request_chunk, chunk) for chunk in chunks]
+        self.chunk_results = []
+        for chunk, future in zip(chunks, futures, strict=True):
+            error = future.exception()
+            if error is None:
+                chunk_result = ChunkResult(chunk, response=future.result())
+            else:
+                chunk_result = ChunkResult(chunk, error=error)
+            self.chunk_results.append(chunk_result)
+        merged_response = self.request_method.multi_merge_responses(
+            [result.response for result in self.chunk_results if result.succeeded]
         )
-        return self.request_method.multi_parse_response(response, self.requests)
+        failed_chunks = [
+            result for result in self.chunk_results if not result.succeeded
+        ]
+        if failed_chunks:
+            raise exceptions.PartialRequestError(
+                result=merged_response, failed_chunks=failed_chunks
+            ) from failed_chunks[0].error
+        return merged_response
+
+    def _request_chunk(self, requests: list[MutableMapping[str, Any]]) -> Any:
+        session = LinnworksAPISession.current()
+        headers = session.request_headers()
+        headers.update(self.request_method.multi_headers(requests))
+        params = self.request_method.multi_params(requests)
+        data = self.request_method.multi_data(requests)
+        json = self.request_method.multi_json(requests)
+        try:
+            response = send_request(
+                session,
+                self.request_method,
+                url=self.request_method.url(session.server_url()),
+                method=self.request_method.METHOD,
+                headers=headers,
+                params=params,
+                data=data,
+                json=json,
+            )
+        finally:
+            if session.response_cache is not None:
+                session.response_cache.invalidate(
+                    *self.request_method.multi_invalidates(requests)
+                )
+        response.raise_for_status()
+        return self.request_method.multi_parse_response(response, requests)
+
+
+def send_request(
+    session: LinnworksAPISession,
+    request_method: Type[LinnworksAPIRequest],
+    **request_kwargs: Any,
+) -> requests.Response:
+    """
+    Send a request, retrying according to the request method's retry policy.
+
+    Each attempt waits for the request method's rate limit, which is shared by
+    all threads using the session. Responses with a status that should not be
+    retried, responses asking to be retried after longer than the policy's
+    max_backoff, and the last response once attempts are exhausted, are
+    returned to the caller.
+    """
+    policy = request_method.RETRY_POLICY
+    can_retry = policy.allows_retry(request_method.READ_ONLY)
+    attempt = 1
+    while True:
+        session.rate_limiter.acquire(request_method.PATH, request_method.RATE_LIMIT)
+        session.retry_stats.record_attempt()
+        response = None
+        try:
+            response = session.session.request(**request_kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if not can_retry or attempt >= policy.max_attempts:
+                raise
+        else:
+            if (
+                not can_retry
+                or attempt >= policy.max_attempts
+                or not policy.should_retry(response)
+                or policy.retry_after_exceeds_max_backoff(response)
+            ):
+                return response
+        delay = policy.backoff(attempt, response)
+        session.retry_stats.record_backoff(delay)
+        time.sleep(delay)
+        attempt += 1
+
+
+def request_key(
+    request_method: Type[LinnworksAPIRequest], **request_kwargs: Any
+) -> tuple[Type[LinnworksAPIRequest], str]:
+    """Return a key identifying identical requests made with request_method."""
+    serialised = json_module.dumps(
+        {
+            name: request_kwargs.get(name)
+            for name in ("url", "method", "headers", "params", "data", "json")
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return request_method, serialised
 
 
 def make_request(
     request_method: Type[LinnworksAPIRequest], *args: Any, **kwargs: Any
 ) -> Any:
-    """Make a Linnworks API request."""
-    headers = LinnworksAPISession.request_headers()
+    """
+    Make a Linnworks API request with the current session.
+
+    If the session has a response cache, successful responses to request
+    methods with a CACHE_TTL are reused until they expire or a request that
+    invalidates one of their cache tags is sent.
+
+    If the session deduplicates requests, a read-only request identical to one
+    already in progress shares that request's response.
+
+    Each caller parses the response separately, so callers do not share parsed
+    objects.
+    """
+    session = LinnworksAPISession.current()
+    headers = session.request_headers()
     headers.update(request_method.headers(*args, **kwargs))
-    params = request_method.params(*args, **kwargs)
-    data = request_method.data(*args, **kwargs)
-    json = request_method.json(*args, **kwargs)
-    response = LinnworksAPISession.session.request(
-        url=request_method.URL,
-        method=request_method.METHOD,
-        headers=headers,
-        params=params,
-        data=data,
-        json=json,
-    )
+    request_kwargs = {
+        "url": request_method.url(session.server_url()),
+        "method": request_method.METHOD,
+        "headers": headers,
+        "params": request_method.params(*args, **kwargs),
+        "data": request_method.data(*args, **kwargs),
+        "json": request_method.json(*args, **kwargs),
+    }
+
+    def fetch() -> requests.Response:
+        if session.deduplicate_requests and request_method.READ_ONLY:
+            return session.in_flight_requests.do(  # type: ignore[no-any-return]
+                request_key(request_method, **request_kwargs),
+                lambda: send_request(session, request_method, **request_kwargs),
+            )
+        return send_request(session, request_method, **request_kwargs)
+
+    cache = session.response_cache
+    if cache is None:
+        response = fetch()
+    elif request_method.CACHE_TTL is not None and request_method.READ_ONLY:
+        response = cache.get_or_fetch(
+            request_key(request_method, **request_kwargs),
+            fetch,
+            ttl=request_method.CACHE_TTL,
+            tags=request_method.cache_tags(*args, **kwargs),
+            cacheable=lambda response: bool(response.ok),
+        )
+    else:
+        try:
+            response = fetch()
+        finally:
+            cache.invalidate(*request_method.invalidates(*args, **kwargs))
     return request_method.parse_response(response, *args, **kwargs)
@@ -5,14 +5,28 @@ from typing import Any, MutableMapping
 
 import requests
 
+from linnapi.ratelimit import RateLimit
 from linnapi.request import LinnworksAPIRequest
 
+STOCK_RATE_LIMIT = RateLimit(calls=150, period=60)
+
+IMAGES_CACHE_TAG = "images"
+STOCK_HISTORY_CACHE_TAG = "stock_history"
+CHANNEL_SKUS_CACHE_TAG = "channel_skus"
+
+
+def images_cache_tag(stock_item_id: Any) -> str:
+    """Return the cache tag for the images of a stock item."""
+    return f"{IMAGES_CACHE_TAG}:{stock_item_id}"
+
 
 class GetStockItemIDsBySKU(LinnworksAPIRequest):
     """Return the stock item ID for a SKU."""
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/GetStockItemIdsBySKU"
+    PATH = "/api/Inventory/GetStockItemIdsBySKU"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    MAX_ITEMS_PER_REQUEST = 200
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -24,8 +38,10 @@ class GetStockItemIDsBySKU(LinnworksAPIRequest):
 class GetStockLevel(LinnworksAPIRequest):
     """Return the current stock level for a product by stock item ID."""
 
-    URL = "https://eu-ext.linnworks.net/api/Stock/GetStockLevel"
+    PATH = "/api/Stock/GetStockLevel"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    RATE_LIMIT = STOCK_RATE_LIMIT
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -37,8 +53,11 @@ class GetStockLevel(LinnworksAPIRequest):
 class GetStockLevelBatch(LinnworksAPIRequest):
     """Return the stock level for multiple products by stock item ID."""
 
-    URL = "https://eu-ext.linnworks.net/api/Stock/GetStockLevel_Batch"
+    PATH = "/api/Stock/GetStockLevel_Batch"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    RATE_LIMIT = STOCK_RATE_LIMIT
+    MAX_ITEMS_PER_REQUEST = 200
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -48,27 +67,75 @@ class GetStockLevelBatch(LinnworksAPIRequest):
 
 
 class SetStockLevelBySKU(LinnworksAPIRequest):
-    """Update the stock level for a product."""
+    """
+    Update the stock level for a product.
 
-    URL = "https://eu-ext.linnworks.net/api/Stock/UpdateStockLevelsBySKU"
+    Multi-item requests take one change per request with the kwargs `sku`,
+    `level`, `location_id` and `change_source`. The change source of the first
+    request is used for all of them.
+    """
+
+    PATH = "/api/Stock/UpdateStockLevelsBySKU"
     METHOD = LinnworksAPIRequest.POST
+    RATE_LIMIT = STOCK_RATE_LIMIT
+    MAX_ITEMS_PER_REQUEST = 200
 
     @classmethod
     def params(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Return request URL parameters."""
         return {"changeSource": str(kwargs["change_source"])}
 
+    @classmethod
+    def item_json(cls, sku: str, location_id: str, level: int) -> dict[str, Any]:
+        """Return request data for a single stock level change."""
+        return {"SKU": str(sku), "LocationID": location_id, "Level": int(level)}
+
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
         """Return request JSON post data."""
         location_id: str = kwargs["location_id"]
         changes: tuple[tuple[str, int]] = kwargs["changes"]
         stock_levels = [
-            {"SKU": str(sku), "LocationID": location_id, "Level": int(level)}
+            cls.item_json(sku=sku, location_id=location_id, level=level)
             for sku, level in changes
         ]
         return {"stockLevels": stock_levels}
 
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        return [STOCK_HISTORY_CACHE_TAG]
+
+    @classmethod
+    def multi_params(cls, requests: list[MutableMapping[str, Any]]) -> dict[str, Any]:
+        """Return request URL parameters."""
+        return cls.params(change_source=requests[0]["change_source"])
+
+    @classmethod
+    def multi_json(
+        cls, requests: list[MutableMapping[str, Any]]
+    ) -> dict[str, Any] | list[Any]:
+        """Return request JSON with multiple stock level changes."""
+        stock_levels = [
+            cls.item_json(
+                sku=request["sku"],
+                location_id=request["location_id"],
+                level=request["level"],
+            )
+            for request in requests
+        ]
+        return {"stockLevels": stock_levels}
+
+    @classmethod
+    def multi_parse_response(
+        cls,
+        response: requests.models.Response,
+        requests: list[MutableMapping[str, Any]],
+    ) -> Any:
+        """Parse the request response, raising for unsuccessful responses."""
+        response.raise_for_status()
+        return response.json()
+
 
 class AddImageToInventoryItem(LinnworksAPIRequest):
     """
@@ -83,7 +150,7 @@ class AddImageToInventoryItem(LinnworksAPIRequest):
         is_main (bool): Is the image the main image for the product.
     """
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/AddImageToInventoryItem"
+    PATH = "/api/Inventory/AddImageToInventoryItem"
     METHOD = LinnworksAPIRequest.POST
 
     @classmethod
@@ -105,6 +172,14 @@ class AddImageToInventoryItem(LinnworksAPIRequest):
             request_data["StockItemId"] = stock_item_id
         return {"request": request_data}
 
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        stock_item_id = kwargs.get("stock_item_id")
+        if stock_item_id:
+            return [images_cache_tag(stock_item_id)]
+        return [IMAGES_CACHE_TAG]
+
 
 class UpdateImages(LinnworksAPIRequest):
     """
@@ -118,8 +193,9 @@ class UpdateImages(LinnworksAPIRequest):
         sort_order (int): The position of the image, passed as "SortOrder".
     """
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/UpdateImages"
+    PATH = "/api/Inventory/UpdateImages"
     METHOD = LinnworksAPIRequest.POST
+    MAX_ITEMS_PER_REQUEST = 100
 
     @classmethod
     def item_json(cls, **kwargs: Any) -> dict[str, Any]:
@@ -149,6 +225,11 @@ class UpdateImages(LinnworksAPIRequest):
         """Return request JSON with multiple updates."""
         return {"images": [cls.item_json(**request) for request in requests]}
 
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        return [images_cache_tag(kwargs.get("stock_item_id"))]
+
     @classmethod
     def parse_response(
         cls, response: requests.models.Response, *args: Any, **kwargs: Any
@@ -156,6 +237,11 @@ class UpdateImages(LinnworksAPIRequest):
         """Parse the request response."""
         return response.text
 
+    @classmethod
+    def multi_merge_responses(cls, responses: list[str]) -> str:
+        """Return the response texts of a request sent in chunks joined together."""
+        return "".join(responses)
+
 
 class GetInventoryItemImages(LinnworksAPIRequest):
     """
@@ -166,8 +252,10 @@ class GetInventoryItemImages(LinnworksAPIRequest):
             passed as "InventoryItemId".
     """
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/GetInventoryItemImages"
+    PATH = "/api/Inventory/GetInventoryItemImages"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    CACHE_TTL = 300
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -175,6 +263,11 @@ class GetInventoryItemImages(LinnworksAPIRequest):
         inventory_item_id = kwargs.get("inventory_item_id")
         return {"inventoryItemId": inventory_item_id}
 
+    @classmethod
+    def cache_tags(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return tags that invalidate a cached response to the request."""
+        return [IMAGES_CACHE_TAG, images_cache_tag(kwargs.get("inventory_item_id"))]
+
 
 class DeleteImagesFromInventoryItem(LinnworksAPIRequest):
     """
@@ -186,8 +279,9 @@ class DeleteImagesFromInventoryItem(LinnworksAPIRequest):
             belongs. Requred.
     """
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/DeleteImagesFromInventoryItem"
+    PATH = "/api/Inventory/DeleteImagesFromInventoryItem"
     METHOD = LinnworksAPIRequest.POST
+    MAX_ITEMS_PER_REQUEST = 100
 
     @classmethod
     def item_json(cls, **kwargs: Any) -> dict[str, Any]:
@@ -207,6 +301,11 @@ class DeleteImagesFromInventoryItem(LinnworksAPIRequest):
                 stock_items[key].extend(images)
         return {"inventoryItemImages": dict(stock_items)}
 
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        return [images_cache_tag(kwargs.get("stock_item_id"))]
+
     @classmethod
     def parse_response(
         cls, response: requests.models.Response, *args: Any, **kwargs: Any
@@ -214,6 +313,11 @@ class DeleteImagesFromInventoryItem(LinnworksAPIRequest):
         """Parse the request response."""
         return response.text
 
+    @classmethod
+    def multi_merge_responses(cls, responses: list[str]) -> str:
+        """Return the response texts of a request sent in chunks joined together."""
+        return "".join(responses)
+
 
 class GetItemChangesHistory(LinnworksAPIRequest):
     """Get the stock change history for an item.
@@ -222,8 +326,11 @@ class GetItemChangesHistory(LinnworksAPIRequest):
 
     """
 
-    URL = "https://eu-ext.linnworks.net/api/Stock/GetItemChangesHistory"
+    PATH = "/api/Stock/GetItemChangesHistory"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    RATE_LIMIT = STOCK_RATE_LIMIT
+    CACHE_TTL = 60
 
     @classmethod
     def params(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
@@ -239,12 +346,19 @@ class GetItemChangesHistory(LinnworksAPIRequest):
             "pageNumber": page_number,
         }
 
+    @classmethod
+    def cache_tags(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return tags that invalidate a cached response to the request."""
+        return [STOCK_HISTORY_CACHE_TAG]
+
 
 class BatchGetInventoryItemChannelSKUs(LinnworksAPIRequest):
     """Get channel skus for a list of inventory items."""
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/BatchGetInventoryItemChannelSKUs"
+    PATH = "/api/Inventory/BatchGetInventoryItemChannelSKUs"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    CACHE_TTL = 300
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -252,11 +366,16 @@ class BatchGetInventoryItemChannelSKUs(LinnworksAPIRequest):
         stock_item_ids = kwargs["stock_item_ids"]
         return {"inventoryItemIds": list(stock_item_ids)}
 
+    @classmethod
+    def cache_tags(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return tags that invalidate a cached response to the request."""
+        return [CHANNEL_SKUS_CACHE_TAG]
+
 
 class DeleteInventoryItemChannelSKUs(LinnworksAPIRequest):
     """Delete channel SKUs from inventory items."""
 
-    URL = "https://eu-ext.linnworks.net/api/Inventory/DeleteInventoryItemChannelSKUs"
+    PATH = "/api/Inventory/DeleteInventoryItemChannelSKUs"
     METHOD = LinnworksAPIRequest.POST
 
     @classmethod
@@ -265,6 +384,11 @@ class DeleteInventoryItemChannelSKUs(LinnworksAPIRequest):
         inventory_item_channel_sku_ids = kwargs["inventory_item_channel_sku_ids"]
         return {"inventoryItemChannelSKUIds": inventory_item_channel_sku_ids}
 
+    @classmethod
+    def invalidates(cls, *args: Any, **kwargs: Any) -> list[str]:
+        """Return the cache tags made stale by sending the request."""
+        return [CHANNEL_SKUS_CACHE_TAG]
+
     @classmethod
     def parse_response(
         cls, response: requests.Response, *args: Any, **kwargs: Any
@@ -2,14 +2,17 @@
 
 from typing import Any, MutableMapping
 
+from linnapi.ratelimit import RateLimit
 from linnapi.request import LinnworksAPIRequest
 
 
 class SearchProcessedOrders(LinnworksAPIRequest):
     """Return details for a processed order."""
 
-    URL = "https://eu-ext.linnworks.net/api/ProcessedOrders/SearchProcessedOrders"
+    PATH = "/api/ProcessedOrders/SearchProcessedOrders"
     METHOD = LinnworksAPIRequest.POST
+    READ_ONLY = True
+    RATE_LIMIT = RateLimit(calls=150, period=60)
 
     @classmethod
     def json(cls, *args: Any, **kwargs: Any) -> dict[str, Any] | list[Any]:
@@ -29,8 +32,10 @@ class SearchProcessedOrders(LinnworksAPIRequest):
 class GetProcessedAuditTrail(LinnworksAPIRequest):
     """Return the audit trail for a processed order."""
 
-    URL = "https://eu-ext.linnworks.net/api/ProcessedOrders/GetProcessedAuditTrail"
+    PATH = "/api/ProcessedOrders/GetProcessedAuditTrail"
     METHOD = LinnworksAPIRequest.GET
+    READ_ONLY = True
+    CACHE_TTL = 300
 
     @classmethod
     def params(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
@@ -47,8 +52,9 @@ class GetProcessedAuditTrail(LinnworksAPIRequest):
 class GetOrderDetailsByNumOrderId(LinnworksAPIRequest):
     """Return the details of a processed order by order ID."""
 
-    URL = "https://eu-ext.linnworks.net/api/Orders/GetOrderDetailsByNumOrderId"
+    PATH = "/api/Orders/GetOrderDetailsByNumOrderId"
     METHOD = LinnworksAPIRequest.GET
+    READ_ONLY = True
 
     @classmethod
     def params(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
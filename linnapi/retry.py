@@ -0,0 +1,141 @@
+"""Retry policies for Linnworks API requests."""
+
+import datetime as dt
+import email.utils
+import random
+import threading
+from typing import Iterable, Optional
+
+import requests
+
+
+class RetryPolicy:
+    """
+    Retry failed requests with bounded exponential backoff and jitter.
+
+    Requests are retried when they fail to connect, time out or return one of
+    status_codes. Only read-only requests are retried unless retry_writes is
+    True.
+
+    Kwargs:
+        max_attempts (int): The maximum number of attempts, including the first.
+        backoff_factor (float): The delay in seconds before the first retry.
+            The delay doubles with each further retry.
+        max_backoff (float): The maximum delay in seconds between attempts.
+        jitter (bool): If True, wait a random time of up to the calculated
+            delay so that clients do not retry in lockstep.
+        retry_writes (bool): If True, also retry requests that change data.
+        respect_retry_after (bool): If True, wait as long as a response's
+            Retry-After header asks, up to max_backoff. Responses asking for a
+            longer wait are not retried.
+        status_codes (Iterable[int]): Response status codes to retry.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_writes: bool = False,
+        respect_retry_after: bool = True,
+        status_codes: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Retry failed requests with bounded exponential backoff and jitter."""
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_writes = retry_writes
+        self.respect_retry_after = respect_retry_after
+        if status_codes is None:
+            status_codes = self.RETRY_STATUS_CODES
+        self.status_codes = frozenset(status_codes)
+
+    def allows_retry(self, read_only: bool) -> bool:
+        """Return True if a request may be retried under this policy."""
+        return self.max_attempts > 1 and (read_only or self.retry_writes)
+
+    def should_retry(self, response: requests.Response) -> bool:
+        """Return True if response has a status code that should be retried."""
+        return response.status_code in self.status_codes
+
+    def retry_after_exceeds_max_backoff(self, response: requests.Response) -> bool:
+        """Return True if response asks for a longer wait than max_backoff."""
+        if not self.respect_retry_after:
+            return False
+        retry_after = self.retry_after(response)
+        return retry_after is not None and retry_after > self.max_backoff
+
+    def backoff(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Return the number of seconds to wait after a failed attempt.
+
+        The delay never exceeds max_backoff, even if a Retry-After header asks
+        for longer.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2.0 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), self.max_backoff)
+        return delay
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """Return the delay requested by a Retry-After header in seconds or None."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=dt.timezone.utc)
+        now = dt.datetime.now(tz=dt.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class RetryStats:
+    """Thread-safe counters for request attempts and retry backoff."""
+
+    def __init__(self) -> None:
+        """Thread-safe counters for request attempts and retry backoff."""
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+
+    def record_attempt(self) -> None:
+        """Count an attempt to send a request."""
+        with self._lock:
+            self.attempts += 1
+
+    def record_backoff(self, seconds: float) -> None:
+        """Count a retry and the time waited before it."""
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += seconds
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the current counter values."""
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "backoff_seconds": self.backoff_seconds,
+            }
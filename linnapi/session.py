@@ -1,44 +1,238 @@
 """Session manager for the Linnworks API."""
 
+import contextvars
+import hashlib
+import threading
+import time
+import types
 from pathlib import Path
-from typing import Any, Callable, MutableMapping, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Concatenate,
+    Generic,
+    MutableMapping,
+    Optional,
+    ParamSpec,
+    TypeVar,
+    Union,
+)
 
 import requests
+import requests.adapters
 import toml
 
 from . import exceptions
+from .cache import ResponseCache, StockItemIDCache, StockLevelCache
+from .loader import BatchLoader
+from .ratelimit import RateLimiter
+from .retry import RetryStats
+from .singleflight import SingleFlight
+from .token_store import MemoryTokenStore, TokenStore
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_active_sessions: contextvars.ContextVar[tuple["LinnworksAPISession", ...]] = (
+    contextvars.ContextVar("linnapi_active_sessions", default=())
+)
+
+
+class _DefaultSessionMethod(Generic[P, R]):
+    """
+    A session method that applies to the default session when called on the class.
+
+    Credentials were once set on the class itself, so calls such as
+    LinnworksAPISession.set_login(...) still configure the default session.
+    """
+
+    def __init__(
+        self, method: Callable[Concatenate["LinnworksAPISession", P], R]
+    ) -> None:
+        self.method = method
+
+    def __get__(
+        self,
+        instance: Optional["LinnworksAPISession"],
+        owner: type["LinnworksAPISession"],
+    ) -> Callable[P, R]:
+        if instance is None:
+            instance = owner.default()
+        return types.MethodType(self.method, instance)
 
 
 class LinnworksAPISession:
-    """Session manager for the Linnworks API."""
+    """
+    Session manager for the Linnworks API.
 
-    application_id = None
-    application_secret = None
-    application_token = None
-    session_token = None
+    Each instance holds the credentials, session token and HTTP connection pool
+    for one Linnworks account. Requests made inside a `with` block use the
+    session that was entered, so several accounts can be used from the same
+    process. Requests made outside any block use the default session.
 
-    session = requests.Session()
+    Session tokens are shared by every session for the same account, so
+    entering a new session for an account that is already authorised does not
+    authorise again.
+    """
 
     AUTH_URL = "https://api.linnworks.net/api/Auth/AuthorizeByApplication"
+    DEFAULT_SERVER = "https://eu-ext.linnworks.net"
 
     CONFIG_FILENAME = ".linnapi.toml"
 
-    def __enter__(self) -> requests.Session:
-        if not self.__class__.credentials_are_set():
-            config_path = self.__class__.find_config_filepath()
-            if config_path is not None:
-                self.__class__.load_from_config_file(config_file_path=config_path)
-        if not self.__class__.credentials_are_set():
+    DEFAULT_SESSION_TOKEN_TTL = 1800
+    SESSION_TOKEN_RENEWAL_MARGIN = 60
+
+    DEFAULT_POOL_CONNECTIONS = requests.adapters.DEFAULT_POOLSIZE
+    DEFAULT_POOL_MAXSIZE = requests.adapters.DEFAULT_POOLSIZE
+
+    _default: ClassVar[Optional["LinnworksAPISession"]] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+    _shared_token_store: ClassVar[MemoryTokenStore] = MemoryTokenStore()
+
+    def __init__(
+        self,
+        application_id: Optional[str] = None,
+        application_secret: Optional[str] = None,
+        application_token: Optional[str] = None,
+        token_store: Optional[TokenStore] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        stock_item_id_cache: Optional[StockItemIDCache] = None,
+        stock_item_id_loader: Optional[BatchLoader[str, str]] = None,
+        deduplicate_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        stock_level_cache: Optional[StockLevelCache] = None,
+    ) -> None:
+        """
+        Create a session for a Linnworks account.
+
+        If credentials are not passed, those of the default session are used
+        when the session is first entered. The default session's credentials
+        are loaded from a config file if they are not set.
+
+        Kwargs:
+            pool_connections (int): The number of hosts to keep connection pools
+                for.
+            pool_maxsize (int): The maximum number of connections kept open to
+                each host. Set this to at least the number of threads making
+                requests so that connections are not discarded.
+            pool_block (bool): If True, block when all pooled connections to a
+                host are in use instead of opening a connection that will not
+                be kept.
+            keep_alive (bool): If False, close connections after each request.
+            stock_item_id_cache (StockItemIDCache): A cache used to look up the
+                stock item IDs of SKUs before requesting them. IDs are always
+                requested if this is None.
+            stock_item_id_loader (BatchLoader): A loader used to combine
+                concurrent single SKU lookups into batched requests, such as
+                inventory.StockItemIDLoader.
+            deduplicate_requests (bool): If True, identical read-only requests
+                made while one is already in progress wait for and share its
+                response instead of being sent again.
+            response_cache (ResponseCache): A cache for responses to request
+                methods that declare a CACHE_TTL. Responses are not cached if
+                this is None.
+            stock_level_cache (StockLevelCache): A cache of stock levels by
+                SKU, kept up to date by stock level reads.
+        """
+        self.application_id = application_id
+        self.application_secret = application_secret
+        self.application_token = application_token
+        self.token_store = token_store
+        self.session_token: Optional[str] = None
+        self.session_token_expires_at: Optional[float] = None
+        self.server: Optional[str] = None
+        self.session = self._create_http_session(
+            pool_connections=pool_connections or self.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or self.DEFAULT_POOL_MAXSIZE,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self.retry_stats = RetryStats()
+        self.rate_limiter = RateLimiter()
+        self.stock_item_id_cache = stock_item_id_cache
+        self.stock_item_id_loader = stock_item_id_loader
+        self.deduplicate_requests = deduplicate_requests
+        self.in_flight_requests = SingleFlight()
+        self.response_cache = response_cache
+        self.stock_level_cache = stock_level_cache
+        self._auth_lock = threading.Lock()
+
+    def __enter__(self) -> "LinnworksAPISession":
+        if not self.credentials_are_set():
+            self._use_default_credentials()
+        if not self.credentials_are_set():
             raise exceptions.LoginCredentialsNotSetError()
-        self.__class__._authorise_session()
-        return self.__class__.session
+        self.authorise_if_required()
+        _active_sessions.set(_active_sessions.get() + (self,))
+        return self
 
     def __exit__(self, exc_type: None, exc_value: None, exc_tb: None) -> None:
-        self.__class__.session
+        _active_sessions.set(_active_sessions.get()[:-1])
+
+    @staticmethod
+    def _create_http_session(
+        pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool
+    ) -> requests.Session:
+        http_session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        http_session.mount("https://", adapter)
+        http_session.mount("http://", adapter)
+        if not keep_alive:
+            http_session.headers["Connection"] = "close"
+        return http_session
+
+    @classmethod
+    def default(cls) -> "LinnworksAPISession":
+        """Return the process-wide default session, creating it if necessary."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
 
     @classmethod
+    def set_default(cls, session: Optional["LinnworksAPISession"]) -> None:
+        """Set the process-wide default session."""
+        with cls._default_lock:
+            cls._default = session
+
+    @classmethod
+    def current(cls) -> "LinnworksAPISession":
+        """
+        Return the session requests should be made with.
+
+        This is the innermost session entered in the current context (thread or
+        task), or the default session if none has been entered.
+        """
+        active_sessions = _active_sessions.get()
+        if active_sessions:
+            return active_sessions[-1]
+        return cls.default()
+
+    def _use_default_credentials(self) -> None:
+        default_session = self.default()
+        if not default_session.credentials_are_set():
+            config_path = self.find_config_filepath()
+            if config_path is not None:
+                default_session.load_from_config_file(config_file_path=config_path)
+        if default_session is not self and default_session.credentials_are_set():
+            self.set_login(
+                application_id=default_session.application_id,
+                application_secret=default_session.application_secret,
+                application_token=default_session.application_token,
+            )
+
+    @_DefaultSessionMethod
     def set_login(
-        cls,
+        self,
         application_id: Optional[str] = None,
         application_secret: Optional[str] = None,
         application_token: Optional[str] = None,
@@ -48,24 +242,149 @@ class LinnworksAPISession:
 
         (application_id, application_secret, application_token).
         """
-        cls.application_id = application_id
-        cls.application_secret = application_secret
-        cls.application_token = application_token
+        self.application_id = application_id
+        self.application_secret = application_secret
+        self.application_token = application_token
+        self.clear_session_token()
 
-    @classmethod
-    def credentials_are_set(cls) -> bool:
+    def set_token_store(self, token_store: Optional[TokenStore]) -> None:
+        """
+        Share session tokens through a persistent token store.
+
+        Processes using the same store reuse each other's session tokens instead
+        of authorising separately. Pass None to share tokens only with sessions
+        in the same process.
+        """
+        self.token_store = token_store
+        self.clear_session_token()
+
+    @_DefaultSessionMethod
+    def credentials_are_set(self) -> bool:
         """Return True if all auth credentials are set, otherwise False."""
-        if None in (cls.application_id, cls.application_secret, cls.application_token):
+        if None in (
+            self.application_id,
+            self.application_secret,
+            self.application_token,
+        ):
             return False
         else:
             return True
 
-    @classmethod
-    def request_headers(cls) -> MutableMapping[str, str]:
+    @_DefaultSessionMethod
+    def request_headers(self) -> MutableMapping[str, str]:
         """Return request auth headers."""
-        if cls.session_token is None:
+        if self.session_token is None:
             raise exceptions.SessionNotAuthorizedError()
-        return {"Authorization": str(cls.session_token)}
+        return {"Authorization": str(self.session_token)}
+
+    def server_url(self) -> str:
+        """Return the URL of the server assigned to the session by authorisation."""
+        return self.server or self.DEFAULT_SERVER
+
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Return connection reuse statistics for the session's connection pools.
+
+        Returns a dict with the number of requests made, connections created
+        by the pools and requests that reused a pooled connection, counted
+        across the currently pooled hosts. A pooled connection that reconnects
+        after the server closes it is not counted again.
+        """
+        requests_made = 0
+        connections_opened = 0
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pool_manager = getattr(adapter, "poolmanager", None)
+            if pool_manager is None:
+                continue
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is None:
+                    continue
+                requests_made += pool.num_requests
+                connections_opened += pool.num_connections
+        return {
+            "requests": requests_made,
+            "connections_opened": connections_opened,
+            "connections_reused": max(requests_made - connections_opened, 0),
+        }
+
+    def session_token_is_valid(self) -> bool:
+        """Return True if the session token is set and not close to expiring."""
+        if self.session_token is None:
+            return False
+        return self._token_is_fresh(self.session_token_expires_at)
+
+    def _token_is_fresh(self, expires_at: Optional[float]) -> bool:
+        if expires_at is None:
+            return False
+        return time.time() < expires_at - self.SESSION_TOKEN_RENEWAL_MARGIN
+
+    def clear_session_token(self) -> None:
+        """
+        Discard the session's token.
+
+        The next time the session is entered it uses a valid token held by
+        another session for the account, or otherwise authorises again.
+        """
+        self.session_token = None
+        self.session_token_expires_at = None
+        self.server = None
+
+    def authorise_if_required(self) -> str:
+        """
+        Return a valid session token, authorising only if necessary.
+
+        The cached token is reused until it is within
+        SESSION_TOKEN_RENEWAL_MARGIN seconds of expiring. A valid token
+        already held by another session for the account is used in preference
+        to authorising, and concurrent callers share a single authorisation
+        request. Tokens are shared through the token store, if one is set, or
+        otherwise with sessions in the same process.
+        """
+        if not self.session_token_is_valid():
+            with self._auth_lock:
+                if not self.session_token_is_valid():
+                    self._load_or_refresh_stored_token(
+                        self.token_store or self._shared_token_store
+                    )
+        return str(self.session_token)
+
+    def token_store_key(self) -> str:
+        """
+        Return the key identifying this account's token in a token store.
+
+        Accounts that install the same application share an application ID, so
+        the key also includes a hash of the install's application token.
+        """
+        token_hash = hashlib.sha256(str(self.application_token).encode()).hexdigest()
+        return f"{self.application_id}:{token_hash[:16]}"
+
+    def _load_stored_token(self, token_store: TokenStore) -> bool:
+        token_data = token_store.get(self.token_store_key())
+        if not token_data or not self._token_is_fresh(token_data.get("expires_at")):
+            return False
+        self.session_token = str(token_data["token"])
+        self.session_token_expires_at = float(token_data["expires_at"])
+        self.server = token_data.get("server")
+        return True
+
+    def _load_or_refresh_stored_token(self, token_store: TokenStore) -> None:
+        if self._load_stored_token(token_store):
+            return
+        key = self.token_store_key()
+        with token_store.lock(key):
+            if self._load_stored_token(token_store):
+                return
+            self._authorise_session()
+            token_store.set(
+                key,
+                {
+                    "token": self.session_token,
+                    "expires_at": self.session_token_expires_at,
+                    "server": self.server,
+                },
+            )
 
     @classmethod
     def find_config_filepath(cls) -> Optional[Path]:
@@ -84,35 +403,43 @@ class LinnworksAPISession:
             path = path.parent
         return None
 
-    @classmethod
-    def load_from_config_file(cls, config_file_path: Union[Path, str]) -> None:
+    @_DefaultSessionMethod
+    def load_from_config_file(self, config_file_path: Union[Path, str]) -> None:
         """Set login credentials as specified in a toml file located at config_file_path."""
         with open(config_file_path) as f:
             config = toml.load(f)
-        cls.set_login(
+        self.set_login(
             application_id=config.get("APPLICATION_ID"),
             application_secret=config.get("APPLICATION_SECRET"),
             application_token=config.get("APPLICATION_TOKEN"),
         )
 
-    @classmethod
-    def _authorise_session(cls) -> str:
+    def _authorise_session(self) -> str:
         auth_request_data = {
-            "ApplicationID": cls.application_id,
-            "ApplicationSecret": cls.application_secret,
-            "Token": cls.application_token,
+            "ApplicationID": self.application_id,
+            "ApplicationSecret": self.application_secret,
+            "Token": self.application_token,
         }
-        auth_request_response = cls.session.post(cls.AUTH_URL, data=auth_request_data)
+        auth_request_response = self.session.post(self.AUTH_URL, data=auth_request_data)
         auth_request_response.raise_for_status()
-        cls.session_token = str(auth_request_response.json()["Token"])
-        return cls.session_token
+        auth_data = auth_request_response.json()
+        ttl = auth_data.get("TTL") or self.DEFAULT_SESSION_TOKEN_TTL
+        self.session_token = str(auth_data["Token"])
+        self.session_token_expires_at = time.time() + int(ttl)
+        self.server = auth_data.get("Server") or None
+        return self.session_token
 
 
 def linnworks_api_session(func: Callable) -> Callable:
-    """Use a Linnworks API session as a method decorator."""
+    """
+    Use a Linnworks API session as a method decorator.
+
+    The decorated function runs in the session bound to the calling context, or
+    in the default session if none is bound.
+    """
 
     def wrapper_linnapi_session(*args: Any, **kwargs: Any) -> Any:
-        with LinnworksAPISession():
+        with LinnworksAPISession.current():
             return func(*args, **kwargs)
 
     return wrapper_linnapi_session
@@ -0,0 +1,49 @@
+"""Share the result of identical calls that are in progress at the same time."""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Run only one call at a time for each key.
+
+    Callers that ask for a key while a call for it is in progress wait for that
+    call and receive its result or exception instead of making their own.
+    Results are not kept once the call has finished.
+    """
+
+    def __init__(self) -> None:
+        """Run only one call at a time for each key."""
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the result of func, sharing a call in progress for key."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Return the number of keys with a call in progress."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,122 @@
+"""Persistent stores for sharing Linnworks session tokens between processes."""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows.
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenStore:
+    """Base class for session token stores."""
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the token data stored under key or None."""
+        raise NotImplementedError
+
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Store token data under key."""
+        raise NotImplementedError
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock while the token stored under key is refreshed."""
+        raise NotImplementedError
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    Store session tokens in memory, shared by sessions in the same process.
+
+    Sessions without a token store share tokens through one of these, so that
+    every session for an account reuses the same token.
+    """
+
+    def __init__(self) -> None:
+        """Store session tokens in memory."""
+        self._tokens: dict[str, dict[str, Any]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the token data stored under key or None."""
+        return self._tokens.get(key)
+
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Store token data under key."""
+        self._tokens[key] = token_data
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock while the token stored under key is refreshed."""
+        with self._locks_lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    Store session tokens in a JSON file shared by multiple processes.
+
+    Tokens are keyed by LinnworksAPISession.token_store_key. Refreshes are serialised with an
+    exclusive lock on a companion ".lock" file so that only one process
+    re-authorises when a token expires. Requires a POSIX platform.
+    """
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        """Store session tokens in the file at path."""
+        if fcntl is None:
+            raise RuntimeError("FileTokenStore requires a POSIX platform.")
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the token data stored under key or None."""
+        return self._read().get(key)
+
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Store token data under key."""
+        tokens = self._read()
+        tokens[key] = token_data
+        self._write(tokens)
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on the store while a token is refreshed."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if not isinstance(tokens, dict):
+            return {}
+        return tokens
+
+    def _write(self, tokens: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
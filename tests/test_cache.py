@@ -0,0 +1,439 @@
+import contextvars
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from linnapi import LinnworksAPISession, cache
+
+
+@pytest.fixture
+def lru_cache():
+    return cache.LRUCache(maxsize=3)
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    sqlite_cache = cache.SQLiteCache(tmp_path / "cache.sqlite")
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+@pytest.fixture
+def mock_time():
+    with patch("linnapi.cache.time.time") as mock_time:
+        mock_time.return_value = 1000.0
+        yield mock_time
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("get", ("key",)),
+        ("set", ("key", "value")),
+        ("delete", ("key",)),
+        ("clear", ()),
+    ],
+)
+def test_base_cache_methods_raise_not_implemented(method, args):
+    with pytest.raises(NotImplementedError):
+        getattr(cache.Cache(), method)(*args)
+
+
+def test_lru_cache_get_returns_set_value(lru_cache):
+    lru_cache.set("key", "value")
+    assert lru_cache.get("key") == "value"
+
+
+def test_lru_cache_get_raises_key_error_for_missing_key(lru_cache):
+    with pytest.raises(KeyError):
+        lru_cache.get("key")
+
+
+def test_lru_cache_caches_none(lru_cache):
+    lru_cache.set("key", None)
+    assert lru_cache.get("key") is None
+
+
+def test_lru_cache_discards_least_recently_used_entry(lru_cache):
+    lru_cache.set("a", 1)
+    lru_cache.set("b", 2)
+    lru_cache.set("c", 3)
+    lru_cache.get("a")
+    lru_cache.set("d", 4)
+    assert lru_cache.get_many(["a", "b", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+    assert len(lru_cache) == 3
+
+
+def test_lru_cache_entries_expire(mock_time):
+    lru_cache = cache.LRUCache(ttl=10)
+    lru_cache.set("key", "value")
+    mock_time.return_value = 1009.0
+    assert lru_cache.get("key") == "value"
+    mock_time.return_value = 1010.0
+    with pytest.raises(KeyError):
+        lru_cache.get("key")
+    assert len(lru_cache) == 0
+
+
+def test_lru_cache_set_ttl_overrides_default(mock_time):
+    lru_cache = cache.LRUCache(ttl=10)
+    lru_cache.set("key", "value", ttl=100)
+    mock_time.return_value = 1050.0
+    assert lru_cache.get("key") == "value"
+
+
+def test_lru_cache_counts_hits_and_misses(lru_cache):
+    lru_cache.set("key", "value")
+    lru_cache.get("key")
+    lru_cache.get_many(["key", "other"])
+    assert lru_cache.stats() == {"size": 1, "hits": 2, "misses": 1}
+
+
+def test_lru_cache_delete(lru_cache):
+    lru_cache.set_many({"a": 1, "b": 2})
+    lru_cache.delete("a", "missing")
+    assert lru_cache.get_many(["a", "b"]) == {"b": 2}
+
+
+def test_lru_cache_clear(lru_cache):
+    lru_cache.set_many({"a": 1, "b": 2})
+    lru_cache.clear()
+    assert len(lru_cache) == 0
+
+
+def test_lru_cache_rejects_invalid_maxsize():
+    with pytest.raises(ValueError):
+        cache.LRUCache(maxsize=0)
+
+
+def test_lru_cache_is_thread_safe():
+    lru_cache = cache.LRUCache(maxsize=50)
+
+    def fill(offset):
+        for i in range(500):
+            lru_cache.set(f"{offset}-{i}", i)
+            lru_cache.get_many([f"{offset}-{i}", f"{offset}-{i - 1}"])
+
+    threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(lru_cache) == 50
+
+
+def test_sqlite_cache_get_returns_set_value(sqlite_cache):
+    sqlite_cache.set("key", {"value": [1, 2]})
+    assert sqlite_cache.get("key") == {"value": [1, 2]}
+
+
+def test_sqlite_cache_get_raises_key_error_for_missing_key(sqlite_cache):
+    with pytest.raises(KeyError):
+        sqlite_cache.get("key")
+
+
+def test_sqlite_cache_caches_none(sqlite_cache):
+    sqlite_cache.set("key", None)
+    assert sqlite_cache.get("key") is None
+
+
+def test_sqlite_cache_get_many(sqlite_cache):
+    sqlite_cache.set_many({f"key-{i}": i for i in range(1200)})
+    keys = [f"key-{i}" for i in range(0, 1300, 2)]
+    assert sqlite_cache.get_many(keys) == {f"key-{i}": i for i in range(0, 1200, 2)}
+
+
+def test_sqlite_cache_entries_expire(tmp_path, mock_time):
+    sqlite_cache = cache.SQLiteCache(tmp_path / "cache.sqlite", ttl=10)
+    sqlite_cache.set("a", 1)
+    sqlite_cache.set("b", 2, ttl=100)
+    mock_time.return_value = 1010.0
+    assert sqlite_cache.get_many(["a", "b"]) == {"b": 2}
+    with pytest.raises(KeyError):
+        sqlite_cache.get("a")
+
+
+def test_sqlite_cache_persists_between_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache.SQLiteCache(path).set("key", "value")
+    assert cache.SQLiteCache(path).get("key") == "value"
+
+
+def test_sqlite_cache_delete_and_clear(sqlite_cache):
+    sqlite_cache.set_many({"a": 1, "b": 2, "c": 3})
+    sqlite_cache.delete("a")
+    assert sqlite_cache.get_many(["a", "b", "c"]) == {"b": 2, "c": 3}
+    sqlite_cache.clear()
+    assert sqlite_cache.get_many(["a", "b", "c"]) == {}
+
+
+def test_sqlite_cache_rejects_invalid_table_name(tmp_path):
+    with pytest.raises(ValueError):
+        cache.SQLiteCache(tmp_path / "cache.sqlite", table="cache; DROP")
+
+
+def test_tiered_cache_copies_values_to_faster_tiers(sqlite_cache):
+    memory_cache = cache.LRUCache()
+    tiered_cache = cache.TieredCache(memory_cache, sqlite_cache)
+    sqlite_cache.set("key", "value")
+    assert tiered_cache.get("key") == "value"
+    assert memory_cache.get("key") == "value"
+
+
+def test_tiered_cache_get_raises_key_error_for_missing_key(sqlite_cache):
+    tiered_cache = cache.TieredCache(cache.LRUCache(), sqlite_cache)
+    with pytest.raises(KeyError):
+        tiered_cache.get("key")
+
+
+def test_tiered_cache_get_many_reads_faster_tiers_first(sqlite_cache):
+    memory_cache = cache.LRUCache()
+    tiered_cache = cache.TieredCache(memory_cache, sqlite_cache)
+    memory_cache.set("a", "memory")
+    sqlite_cache.set_many({"a": "disk", "b": "disk"})
+    assert tiered_cache.get_many(["a", "b", "c"]) == {"a": "memory", "b": "disk"}
+
+
+def test_tiered_cache_set_delete_and_clear_apply_to_every_tier(sqlite_cache):
+    memory_cache = cache.LRUCache()
+    tiered_cache = cache.TieredCache(memory_cache, sqlite_cache)
+    tiered_cache.set_many({"a": 1, "b": 2})
+    tiered_cache.set("c", 3)
+    for tier in (memory_cache, sqlite_cache):
+        assert tier.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+    tiered_cache.delete("a")
+    for tier in (memory_cache, sqlite_cache):
+        assert tier.get_many(["a", "b", "c"]) == {"b": 2, "c": 3}
+    tiered_cache.clear()
+    for tier in (memory_cache, sqlite_cache):
+        assert tier.get_many(["a", "b", "c"]) == {}
+
+
+def test_tiered_cache_requires_a_tier():
+    with pytest.raises(ValueError):
+        cache.TieredCache()
+
+
+def test_stock_item_id_cache_stores_found_and_unknown_skus():
+    stock_item_id_cache = cache.StockItemIDCache()
+    stock_item_id_cache.store(["a", "b"], {"a": "id-a"})
+    assert stock_item_id_cache.lookup(["a", "b", "c"]) == {"a": "id-a", "b": None}
+
+
+def test_stock_item_id_cache_unknown_skus_use_negative_ttl(mock_time):
+    stock_item_id_cache = cache.StockItemIDCache(ttl=100, negative_ttl=10)
+    stock_item_id_cache.store(["a", "b"], {"a": "id-a"})
+    mock_time.return_value = 1010.0
+    assert stock_item_id_cache.lookup(["a", "b"]) == {"a": "id-a"}
+    mock_time.return_value = 1100.0
+    assert stock_item_id_cache.lookup(["a", "b"]) == {}
+
+
+def test_stock_item_id_cache_invalidate_skus():
+    stock_item_id_cache = cache.StockItemIDCache()
+    stock_item_id_cache.store(["a", "b"], {"a": "id-a", "b": "id-b"})
+    stock_item_id_cache.invalidate("a")
+    assert stock_item_id_cache.lookup(["a", "b"]) == {"b": "id-b"}
+
+
+def test_stock_item_id_cache_invalidate_all():
+    stock_item_id_cache = cache.StockItemIDCache()
+    stock_item_id_cache.store(["a", "b"], {"a": "id-a", "b": "id-b"})
+    stock_item_id_cache.invalidate()
+    assert stock_item_id_cache.lookup(["a", "b"]) == {}
+
+
+def test_stock_item_id_cache_with_sqlite_persists(tmp_path):
+    path = tmp_path / "ids.sqlite"
+    cache.StockItemIDCache.with_sqlite(path).store(["a"], {"a": "id-a"})
+    assert cache.StockItemIDCache.with_sqlite(path).lookup(["a"]) == {"a": "id-a"}
+
+
+def test_stock_item_id_cache_with_sqlite_separates_accounts(tmp_path):
+    path = tmp_path / "ids.sqlite"
+    account_a = LinnworksAPISession("app", "secret", "install-token-a")
+    account_b = LinnworksAPISession("app", "secret", "install-token-b")
+    cache_a = cache.StockItemIDCache.with_sqlite(
+        path, namespace=account_a.token_store_key()
+    )
+    cache_b = cache.StockItemIDCache.with_sqlite(
+        path, namespace=account_b.token_store_key()
+    )
+    cache_a.store(["a"], {"a": "id-a"})
+    cache_b.store(["a", "b"], {"b": "id-b"})
+    assert cache_a.lookup(["a", "b"]) == {"a": "id-a"}
+    assert cache_b.lookup(["a", "b"]) == {"a": None, "b": "id-b"}
+    cache_b.invalidate()
+    assert cache.StockItemIDCache.with_sqlite(
+        path, namespace=account_a.token_store_key()
+    ).lookup(["a"]) == {"a": "id-a"}
+
+
+@pytest.fixture
+def response_cache():
+    return cache.ResponseCache(maxsize=2)
+
+
+def test_response_cache_fetches_and_caches(response_cache):
+    fetch = Mock(return_value="response")
+    assert response_cache.get_or_fetch("key", fetch, ttl=10) == "response"
+    assert response_cache.get_or_fetch("key", fetch, ttl=10) == "response"
+    fetch.assert_called_once_with()
+    assert response_cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_response_cache_entries_expire(response_cache, mock_time):
+    fetch = Mock(return_value="response")
+    response_cache.get_or_fetch("key", fetch, ttl=10)
+    mock_time.return_value = 1010.0
+    response_cache.get_or_fetch("key", fetch, ttl=10)
+    assert fetch.call_count == 2
+
+
+def test_response_cache_does_not_cache_uncacheable_responses(response_cache):
+    fetch = Mock(return_value="error")
+    for _ in range(2):
+        response_cache.get_or_fetch("key", fetch, ttl=10, cacheable=lambda r: False)
+    assert fetch.call_count == 2
+
+
+def test_response_cache_evicts_least_recently_used(response_cache):
+    for key in ("a", "b", "c"):
+        response_cache.get_or_fetch(key, Mock(return_value=key), ttl=10)
+    fetch = Mock(return_value="a")
+    response_cache.get_or_fetch("a", fetch, ttl=10)
+    fetch.assert_called_once_with()
+
+
+def test_response_cache_invalidate_tag(response_cache):
+    response_cache.get_or_fetch("a", Mock(return_value="a"), ttl=10, tags=["x"])
+    response_cache.get_or_fetch("b", Mock(return_value="b"), ttl=10, tags=["y"])
+    response_cache.invalidate("x")
+    fetch_a = Mock(return_value="new a")
+    fetch_b = Mock(return_value="new b")
+    assert response_cache.get_or_fetch("a", fetch_a, ttl=10, tags=["x"]) == "new a"
+    assert response_cache.get_or_fetch("b", fetch_b, ttl=10, tags=["y"]) == "b"
+    fetch_b.assert_not_called()
+
+
+def test_response_cache_invalidation_during_fetch(response_cache):
+    def fetch():
+        response_cache.invalidate("x")
+        return "stale"
+
+    response_cache.get_or_fetch("key", fetch, ttl=10, tags=["x"])
+    refetch = Mock(return_value="fresh")
+    assert response_cache.get_or_fetch("key", refetch, ttl=10, tags=["x"]) == "fresh"
+
+
+def test_response_cache_clear(response_cache):
+    response_cache.get_or_fetch("key", Mock(return_value="response"), ttl=10)
+    response_cache.clear()
+    assert response_cache.stats()["size"] == 0
+
+
+@pytest.fixture
+def stock_level_cache():
+    stock_level_cache = cache.StockLevelCache(fresh_for=10)
+    yield stock_level_cache
+    stock_level_cache.close()
+
+
+def test_stock_level_cache_lookup(stock_level_cache, mock_time):
+    stock_level_cache.store({"a": "level-a"})
+    mock_time.return_value = 1005.0
+    stock_level_cache.store({"b": "level-b"})
+    mock_time.return_value = 1012.0
+    assert stock_level_cache.lookup(["a", "b", "c"], max_staleness=60) == (
+        {"a": "level-a", "b": "level-b"},
+        ["a"],
+    )
+
+
+def test_stock_level_cache_lookup_excludes_entries_older_than_max_staleness(
+    stock_level_cache, mock_time
+):
+    stock_level_cache.store({"a": "level-a"})
+    mock_time.return_value = 1061.0
+    assert stock_level_cache.lookup(["a"], max_staleness=60) == ({}, [])
+
+
+def test_stock_level_cache_invalidate(stock_level_cache):
+    stock_level_cache.store({"a": "level-a", "b": "level-b"})
+    stock_level_cache.invalidate("a")
+    assert stock_level_cache.lookup(["a", "b"], max_staleness=60)[0] == {"b": "level-b"}
+    stock_level_cache.invalidate()
+    assert stock_level_cache.lookup(["a", "b"], max_staleness=60)[0] == {}
+
+
+def test_stock_level_cache_refresh_stores_fetched_stock_levels(stock_level_cache):
+    future = stock_level_cache.refresh(["a"], lambda skus: {"a": "new-a"})
+    future.result(timeout=5)
+    assert stock_level_cache.lookup(["a"], max_staleness=60)[0] == {"a": "new-a"}
+
+
+def test_stock_level_cache_deduplicates_refreshes(stock_level_cache):
+    release = threading.Event()
+    fetched = []
+
+    def fetch(skus):
+        fetched.append(skus)
+        release.wait(timeout=5)
+        return {sku: sku for sku in skus}
+
+    first = stock_level_cache.refresh(["a", "b"], fetch)
+    second = stock_level_cache.refresh(["a", "b", "c"], fetch)
+    assert stock_level_cache.refresh(["a"], fetch) is None
+    release.set()
+    first.result(timeout=5)
+    second.result(timeout=5)
+    assert fetched == [["a", "b"], ["c"]]
+    stock_level_cache.refresh(["a"], fetch).result(timeout=5)
+    assert fetched[-1] == ["a"]
+
+
+def test_stock_level_cache_refresh_runs_in_callers_context(stock_level_cache):
+    variable = contextvars.ContextVar("variable", default="unset")
+    variable.set("caller")
+    seen = []
+
+    def fetch(skus):
+        seen.append(variable.get())
+        return {}
+
+    stock_level_cache.refresh(["a"], fetch).result(timeout=5)
+    assert seen == ["caller"]
+
+
+def test_stock_level_cache_keeps_refresh_errors(stock_level_cache):
+    error = ValueError("failed")
+
+    def fetch(skus):
+        raise error
+
+    stock_level_cache.refresh(["a"], fetch).result(timeout=5)
+    assert list(stock_level_cache.refresh_errors) == [error]
+    assert stock_level_cache.refresh(["a"], fetch) is not None
+
+
+def test_stock_level_cache_update_stores_new_skus(stock_level_cache):
+    stock_level = Mock(sku="a", location_id="location")
+    stock_level_cache.update([stock_level])
+    assert stock_level_cache.lookup(["a"], max_staleness=60)[0] == {"a": stock_level}
+
+
+def test_stock_level_cache_update_replaces_same_location(stock_level_cache):
+    stock_level_cache.store({"a": Mock(sku="a", location_id="location")})
+    stock_level = Mock(sku="a", location_id="location")
+    stock_level_cache.update([stock_level])
+    assert stock_level_cache.lookup(["a"], max_staleness=60)[0] == {"a": stock_level}
+
+
+def test_stock_level_cache_update_keeps_other_location(stock_level_cache):
+    cached_stock_level = Mock(sku="a", location_id="location")
+    stock_level_cache.store({"a": cached_stock_level})
+    stock_level_cache.update([Mock(sku="a", location_id="other location")])
+    assert stock_level_cache.lookup(["a"], max_staleness=60)[0] == {
+        "a": cached_stock_level
+    }
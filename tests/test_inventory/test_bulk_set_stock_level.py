@@ -0,0 +1,237 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from linnapi import LinnworksAPISession, exceptions, inventory
+from linnapi.cache import StockLevelCache
+from linnapi.models import StockLevelInfo
+
+
+@pytest.fixture
+def location_id():
+    return "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture
+def changes():
+    return [(f"SKU-{i}", i) for i in range(5)]
+
+
+def stock_level_data(sku, level, location_id):
+    return {
+        "Location": {
+            "StockLocationId": location_id,
+            "StockLocationIntId": 0,
+            "LocationName": "Default",
+            "IsFulfillmentCenter": False,
+        },
+        "StockLevel": level,
+        "StockValue": 0.0,
+        "MinimumLevel": 4,
+        "InOrderBook": 0,
+        "Due": 0,
+        "JIT": False,
+        "InOrders": 0,
+        "Available": level,
+        "UnitCost": 9.6,
+        "SKU": sku,
+        "LastUpdateDate": "2022-03-18T15:22:06.273Z",
+        "rowid": "2df49516-77f7-4eb6-aa75-dd6ae9ec7e82",
+        "PendingUpdate": False,
+        "StockItemPurchasePrice": 9.6,
+        "StockItemId": "965c4c47-227d-4b87-913f-0114dab13b61",
+        "StockItemIntId": 0,
+    }
+
+
+def update_response(**kwargs):
+    stock_levels = kwargs["json"]["stockLevels"]
+    response = Mock()
+    if any(item["SKU"] == "SKU-3" for item in stock_levels):
+        response.raise_for_status.side_effect = requests.HTTPError("500")
+    response.json.return_value = [
+        stock_level_data(item["SKU"], item["Level"], item["LocationID"])
+        for item in stock_levels
+    ]
+    return response
+
+
+@pytest.fixture
+def mock_session():
+    with patch("linnapi.request.LinnworksAPISession") as mock_session_class:
+        mock_session = mock_session_class.current.return_value
+        mock_session.request_headers.return_value = {}
+        mock_session.server_url.return_value = "https://eu-ext.linnworks.net"
+        mock_session.session.request.side_effect = update_response
+        mock_session.response_cache = None
+        yield mock_session
+
+
+@pytest.fixture
+def small_chunks():
+    with patch.object(inventory.SetStockLevelBySKU, "MAX_ITEMS_PER_REQUEST", 2):
+        yield
+
+
+def sent_skus(mock_session):
+    return sorted(
+        item["SKU"]
+        for _, kwargs in mock_session.session.request.call_args_list
+        for item in kwargs["json"]["stockLevels"]
+    )
+
+
+def test_bulk_set_stock_level_sends_changes_in_chunks(
+    mock_session, small_chunks, changes, location_id
+):
+    inventory.bulk_set_stock_level(changes, location_id, change_source="Feed")
+    assert mock_session.session.request.call_count == 3
+    assert sent_skus(mock_session) == [sku for sku, _ in changes]
+    for _, kwargs in mock_session.session.request.call_args_list:
+        assert kwargs["params"] == {"changeSource": "Feed"}
+
+
+def test_bulk_set_stock_level_returns_stock_levels(
+    mock_session, small_chunks, changes, location_id
+):
+    result = inventory.bulk_set_stock_level(changes[:3], location_id)
+    assert result.succeeded is True
+    assert result.failed_changes == []
+    assert result.errors == []
+    assert all(isinstance(_, StockLevelInfo) for _ in result.stock_levels)
+    assert sorted(info.sku for info in result.stock_levels) == [
+        "SKU-0",
+        "SKU-1",
+        "SKU-2",
+    ]
+
+
+def test_bulk_set_stock_level_reports_failed_chunks(
+    mock_session, small_chunks, changes, location_id
+):
+    result = inventory.bulk_set_stock_level(changes, location_id)
+    assert result.succeeded is False
+    assert sorted(result.failed_changes) == [("SKU-2", 2), ("SKU-3", 3)]
+    assert sorted(result.failed_skus) == ["SKU-2", "SKU-3"]
+    assert len(result.errors) == 1
+    assert isinstance(result.errors[0], requests.HTTPError)
+    assert sorted(info.sku for info in result.stock_levels) == [
+        "SKU-0",
+        "SKU-1",
+        "SKU-4",
+    ]
+
+
+def test_bulk_set_stock_level_reports_failure_of_single_chunk(
+    mock_session, changes, location_id
+):
+    result = inventory.bulk_set_stock_level(changes, location_id)
+    assert result.stock_levels == []
+    assert result.failed_changes == changes
+
+
+def test_bulk_set_stock_level_reports_invalid_responses(
+    mock_session, small_chunks, changes, location_id
+):
+    response = Mock()
+    response.json.return_value = {"invalid_key": "invalid_value"}
+    mock_session.session.request.side_effect = None
+    mock_session.session.request.return_value = response
+    result = inventory.bulk_set_stock_level(changes[:2], location_id)
+    assert result.failed_changes == changes[:2]
+    assert isinstance(result.errors[0], exceptions.InvalidResponseError)
+
+
+def test_bulk_set_stock_level_raises_errors_other_than_request_failures(
+    mock_session, small_chunks, changes, location_id
+):
+    mock_session.request_headers.side_effect = exceptions.SessionNotAuthorizedError
+    with pytest.raises(exceptions.SessionNotAuthorizedError):
+        inventory.bulk_set_stock_level(changes, location_id)
+
+
+def test_bulk_set_stock_level_raises_error_of_single_chunk(
+    mock_session, changes, location_id
+):
+    mock_session.request_headers.side_effect = exceptions.SessionNotAuthorizedError
+    with pytest.raises(exceptions.SessionNotAuthorizedError):
+        inventory.bulk_set_stock_level(changes, location_id)
+
+
+def test_bulk_set_stock_level_reports_connection_errors(
+    mock_session, small_chunks, changes, location_id
+):
+    mock_session.session.request.side_effect = requests.ConnectionError
+    result = inventory.bulk_set_stock_level(changes[:3], location_id)
+    assert result.failed_changes == changes[:3]
+    assert all(isinstance(_, requests.ConnectionError) for _ in result.errors)
+
+
+def test_bulk_set_stock_level_without_changes(mock_session, location_id):
+    result = inventory.bulk_set_stock_level([], location_id)
+    assert result.succeeded is True
+    mock_session.session.request.assert_not_called()
+
+
+@pytest.fixture
+def stock_level_cache():
+    stock_level_cache = StockLevelCache()
+    api_session = LinnworksAPISession(stock_level_cache=stock_level_cache)
+    with patch("linnapi.inventory.LinnworksAPISession") as mock_session_class:
+        mock_session_class.current.return_value = api_session
+        yield stock_level_cache
+
+
+def test_bulk_set_stock_level_updates_stock_level_cache(
+    stock_level_cache, mock_session, small_chunks, changes, location_id
+):
+    stock_level_cache.store({"SKU-3": "cached"})
+    result = inventory.bulk_set_stock_level(changes, location_id)
+    cached, _ = stock_level_cache.lookup([sku for sku, _ in changes], max_staleness=60)
+    assert cached == {info.sku: info for info in result.stock_levels}
+
+
+def test_bulk_set_stock_level_skips_changes_of_zero(mock_session, location_id):
+    changes = [("SKU-0", 0), ("SKU-1", 5), ("SKU-2", 0), ("SKU-4", -3)]
+    result = inventory.bulk_set_stock_level(changes, location_id, skip_unchanged=True)
+    assert sent_skus(mock_session) == ["SKU-1", "SKU-4"]
+    assert result.skipped_changes == [("SKU-0", 0), ("SKU-2", 0)]
+    assert result.skipped_count == 2
+
+
+def test_bulk_set_stock_level_does_not_skip_by_default(mock_session, location_id):
+    result = inventory.bulk_set_stock_level([("SKU-0", 0)], location_id)
+    assert sent_skus(mock_session) == ["SKU-0"]
+    assert result.skipped_count == 0
+
+
+def test_bulk_set_stock_level_sends_changes_matching_the_current_level(
+    stock_level_cache, mock_session, location_id
+):
+    stock_level_cache.store(
+        {"SKU-0": StockLevelInfo(stock_level_data("SKU-0", 5, location_id))}
+    )
+    result = inventory.bulk_set_stock_level(
+        [("SKU-0", 5)], location_id, skip_unchanged=True
+    )
+    assert sent_skus(mock_session) == ["SKU-0"]
+    assert result.skipped_count == 0
+
+
+def test_bulk_set_stock_level_sends_repeated_changes(mock_session, location_id):
+    result = inventory.bulk_set_stock_level(
+        [("SKU-0", 5), ("SKU-0", 5)], location_id, skip_unchanged=True
+    )
+    _, kwargs = mock_session.session.request.call_args
+    assert [item["Level"] for item in kwargs["json"]["stockLevels"]] == [5, 5]
+    assert result.skipped_count == 0
+
+
+def test_bulk_set_stock_level_with_only_changes_of_zero(mock_session, location_id):
+    result = inventory.bulk_set_stock_level(
+        [("SKU-0", 0)], location_id, skip_unchanged=True
+    )
+    mock_session.session.request.assert_not_called()
+    assert result.succeeded is True
+    assert result.skipped_count == 1
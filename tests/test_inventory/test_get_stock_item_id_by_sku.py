@@ -1,8 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
-from linnapi import exceptions, inventory
+from linnapi import LinnworksAPISession, exceptions, inventory
 
 
 @pytest.fixture
@@ -61,3 +62,35 @@ def test_get_stock_item_id_by_sku_with_invalid_response(mock_get_stock_item_ids)
     with pytest.raises(exceptions.InvalidResponseError) as exc_info:
         inventory.get_stock_item_id_by_sku("654166456")
     assert str(exc_info.value) == "Requested SKU not in response."
+
+
+@pytest.fixture
+def stock_item_id_loader():
+    stock_item_id_loader = inventory.StockItemIDLoader(wait=0.2)
+    api_session = LinnworksAPISession(stock_item_id_loader=stock_item_id_loader)
+    with patch("linnapi.inventory.LinnworksAPISession") as mock_session_class:
+        mock_session_class.current.return_value = api_session
+        yield stock_item_id_loader
+
+
+def test_get_stock_item_id_by_sku_with_loader_batches_concurrent_lookups(
+    stock_item_id_loader, mock_get_stock_item_ids, skus, stock_item_ids
+):
+    with ThreadPoolExecutor(max_workers=len(skus)) as pool:
+        returned_value = list(pool.map(inventory.get_stock_item_id_by_sku, skus))
+    assert returned_value == stock_item_ids
+    mock_get_stock_item_ids.assert_called_once()
+    assert sorted(mock_get_stock_item_ids.call_args.args) == sorted(skus)
+
+
+def test_get_stock_item_id_by_sku_with_loader_with_missing_sku(
+    stock_item_id_loader, mock_get_stock_item_ids
+):
+    with pytest.raises(exceptions.InvalidResponseError) as exc_info:
+        inventory.get_stock_item_id_by_sku("654166456")
+    assert str(exc_info.value) == "Requested SKU not in response."
+
+
+def test_stock_item_id_loader_max_batch_size():
+    loader = inventory.StockItemIDLoader()
+    assert loader.max_batch_size == inventory.GetStockItemIDsBySKU.MAX_ITEMS_PER_REQUEST
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
-from linnapi import exceptions, inventory
+from linnapi import LinnworksAPISession, cache, exceptions, inventory
 from linnapi.requests.inventory import GetStockItemIDsBySKU
 
 
@@ -108,3 +108,50 @@ def test_get_stock_item_ids_by_sku_return_value_multiple_skus(
 def test_get_stock_item_ids_by_sku_invalid_response(mock_invalid_response, sku):
     with pytest.raises(exceptions.InvalidResponseError):
         inventory.get_stock_item_ids_by_sku(sku)
+
+
+@pytest.fixture
+def stock_item_id_cache():
+    stock_item_id_cache = cache.StockItemIDCache()
+    api_session = LinnworksAPISession(stock_item_id_cache=stock_item_id_cache)
+    with patch("linnapi.inventory.LinnworksAPISession") as mock_session_class:
+        mock_session_class.current.return_value = api_session
+        yield stock_item_id_cache
+
+
+def test_get_stock_item_ids_by_sku_only_requests_uncached_skus(
+    stock_item_id_cache, mock_multiple_response, skus, stock_item_ids
+):
+    stock_item_id_cache.store([skus[0]], {skus[0]: stock_item_ids[0]})
+    inventory.get_stock_item_ids_by_sku(*skus)
+    mock_multiple_response.assert_called_once_with(
+        GetStockItemIDsBySKU, skus=tuple(skus[1:])
+    )
+
+
+def test_get_stock_item_ids_by_sku_caches_response(
+    stock_item_id_cache, mock_multiple_response, skus, stock_item_ids
+):
+    inventory.get_stock_item_ids_by_sku(*skus)
+    returned_value = inventory.get_stock_item_ids_by_sku(*skus)
+    mock_multiple_response.assert_called_once()
+    assert returned_value == dict(zip(skus, stock_item_ids, strict=True))
+
+
+def test_get_stock_item_ids_by_sku_caches_unknown_skus(
+    stock_item_id_cache, mock_multiple_response, skus, stock_item_ids
+):
+    inventory.get_stock_item_ids_by_sku(*skus, "unknown")
+    returned_value = inventory.get_stock_item_ids_by_sku(*skus, "unknown")
+    mock_multiple_response.assert_called_once()
+    assert returned_value == dict(zip(skus, stock_item_ids, strict=True))
+
+
+def test_get_stock_item_ids_by_sku_with_invalidated_sku(
+    stock_item_id_cache, mock_multiple_response, skus
+):
+    inventory.get_stock_item_ids_by_sku(*skus)
+    stock_item_id_cache.invalidate(skus[1])
+    inventory.get_stock_item_ids_by_sku(*skus)
+    assert mock_multiple_response.call_count == 2
+    mock_multiple_response.assert_called_with(GetStockItemIDsBySKU, skus=(skus[1],))
@@ -161,3 +161,141 @@ def test_get_stock_level_history_by_stock_item_id_sorts_response(
     assert returned_value == sorted(
         returned_value, key=lambda x: x.timestamp, reverse=True
     )
+
+
+def history_page(page_number, total_pages, dates):
+    return {
+        "PageNumber": page_number,
+        "EntriesPerPage": len(dates),
+        "TotalEntries": len(dates) * total_pages,
+        "TotalPages": total_pages,
+        "Data": [
+            {
+                "Date": date,
+                "Level": 0,
+                "StockValue": 0.0,
+                "Note": f"Page {page_number}",
+                "ChangeQty": 0,
+                "ChangeValue": 0.0,
+                "StockItemId": "6079faa4-e4ff-4b5b-9990-fc571e70412e",
+                "StockItemIntId": 0,
+            }
+            for date in dates
+        ],
+    }
+
+
+@pytest.fixture
+def history_pages():
+    return {
+        1: history_page(1, 3, ["2022-04-11T13:32:10.993Z", "2022-04-10T13:32:10.993Z"]),
+        2: history_page(2, 3, ["2022-04-08T13:32:10.993Z", "2022-04-09T13:32:10.993Z"]),
+        3: history_page(3, 3, ["2022-04-07T13:32:10.993Z"]),
+    }
+
+
+@pytest.fixture
+def mock_paged_make_request(mock_make_request, history_pages):
+    mock_make_request.side_effect = lambda *args, **kwargs: history_pages[
+        kwargs["page_number"]
+    ]
+    return mock_make_request
+
+
+def test_get_stock_level_history_by_stock_item_id_requests_all_pages(
+    mock_paged_make_request, stock_item_id, location_id
+):
+    inventory.get_stock_level_history_by_stock_item_id(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=2,
+        all_pages=True,
+    )
+    requested_pages = sorted(
+        kwargs["page_number"] for _, kwargs in mock_paged_make_request.call_args_list
+    )
+    assert requested_pages == [1, 2, 3]
+    for _, kwargs in mock_paged_make_request.call_args_list:
+        assert kwargs["entries_per_page"] == 2
+        assert kwargs["stock_item_id"] == stock_item_id
+        assert kwargs["location_id"] == location_id
+
+
+def test_get_stock_level_history_by_stock_item_id_all_pages_with_page_number(
+    mock_make_request, stock_item_id, location_id
+):
+    with pytest.raises(ValueError):
+        inventory.get_stock_level_history_by_stock_item_id(
+            stock_item_id=stock_item_id,
+            location_id=location_id,
+            page_number=2,
+            all_pages=True,
+        )
+    mock_make_request.assert_not_called()
+
+
+def test_get_stock_level_history_by_stock_item_id_returns_all_pages_sorted(
+    mock_paged_make_request, stock_item_id, location_id
+):
+    returned_value = inventory.get_stock_level_history_by_stock_item_id(
+        stock_item_id=stock_item_id, location_id=location_id, all_pages=True
+    )
+    assert len(returned_value) == 5
+    assert [record.timestamp.day for record in returned_value] == [11, 10, 9, 8, 7]
+
+
+def test_get_stock_level_history_by_stock_item_id_all_pages_with_one_page(
+    mock_make_request, call_response, stock_item_id, location_id
+):
+    returned_value = inventory.get_stock_level_history_by_stock_item_id(
+        stock_item_id=stock_item_id, location_id=location_id, all_pages=True
+    )
+    mock_make_request.assert_called_once()
+    assert len(returned_value) == len(call_response["Data"])
+
+
+def test_get_stock_level_history_by_stock_item_id_all_pages_with_invalid_page(
+    mock_paged_make_request, history_pages, invalid_response, stock_item_id, location_id
+):
+    history_pages[3] = invalid_response
+    with pytest.raises(exceptions.InvalidResponseError):
+        inventory.get_stock_level_history_by_stock_item_id(
+            stock_item_id=stock_item_id, location_id=location_id, all_pages=True
+        )
+
+
+def test_get_stock_level_history_by_stock_item_id_with_fields(
+    mock_make_request, call_response, stock_item_id, location_id
+):
+    returned_value = inventory.get_stock_level_history_by_stock_item_id(
+        stock_item_id=stock_item_id, location_id=location_id, fields=["stock_level"]
+    )
+    assert [record.stock_level for record in returned_value] == [44, 0]
+    for record in returned_value:
+        with pytest.raises(AttributeError):
+            record.text
+        with pytest.raises(AttributeError, match="without retaining raw data"):
+            record.raw
+
+
+def test_get_stock_level_history_by_stock_item_id_with_fields_keeps_timestamp(
+    mock_paged_make_request, stock_item_id, location_id
+):
+    returned_value = inventory.get_stock_level_history_by_stock_item_id(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        all_pages=True,
+        fields=["text"],
+    )
+    assert [record.timestamp.day for record in returned_value] == [11, 10, 9, 8, 7]
+    assert returned_value[-1].text == "Page 3"
+
+
+def test_get_stock_level_history_by_stock_item_id_with_unknown_field(
+    mock_make_request, stock_item_id, location_id
+):
+    with pytest.raises(ValueError):
+        inventory.get_stock_level_history_by_stock_item_id(
+            stock_item_id=stock_item_id, location_id=location_id, fields=["level"]
+        )
+    mock_make_request.assert_not_called()
@@ -56,7 +56,32 @@ def test_get_stock_level_history_by_sku_calls_get_stock_level_history_by_stock_i
 ):
     inventory.get_stock_level_history_by_sku(sku=sku, location_id=location_id)
     mock_get_stock_level_history_by_stock_item_id.assert_called_once_with(
-        stock_item_id=stock_item_id, location_id=location_id
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=500,
+        all_pages=False,
+        max_workers=4,
+        fields=None,
+    )
+
+
+def test_get_stock_level_history_by_sku_passes_all_pages(
+    mock_get_stock_item_id_by_sku,
+    mock_get_stock_level_history_by_stock_item_id,
+    stock_item_id,
+    sku,
+    location_id,
+):
+    inventory.get_stock_level_history_by_sku(
+        sku=sku, location_id=location_id, all_pages=True
+    )
+    mock_get_stock_level_history_by_stock_item_id.assert_called_once_with(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=500,
+        all_pages=True,
+        max_workers=4,
+        fields=None,
     )
 
 
@@ -70,3 +95,47 @@ def test_get_stock_level_history_by_sku_calls_return_value(
         sku=sku, location_id=location_id
     )
     assert returned_value == mock_get_stock_level_history_by_stock_item_id.return_value
+
+
+def test_get_stock_level_history_by_sku_passes_fields(
+    mock_get_stock_item_id_by_sku,
+    mock_get_stock_level_history_by_stock_item_id,
+    stock_item_id,
+    sku,
+    location_id,
+):
+    inventory.get_stock_level_history_by_sku(
+        sku=sku, location_id=location_id, fields=["stock_level"]
+    )
+    mock_get_stock_level_history_by_stock_item_id.assert_called_once_with(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=500,
+        all_pages=False,
+        max_workers=4,
+        fields=["stock_level"],
+    )
+
+
+def test_get_stock_level_history_by_sku_passes_paging_options(
+    mock_get_stock_item_id_by_sku,
+    mock_get_stock_level_history_by_stock_item_id,
+    stock_item_id,
+    sku,
+    location_id,
+):
+    inventory.get_stock_level_history_by_sku(
+        sku=sku,
+        location_id=location_id,
+        all_pages=True,
+        entries_per_page=100,
+        max_workers=8,
+    )
+    mock_get_stock_level_history_by_stock_item_id.assert_called_once_with(
+        stock_item_id=stock_item_id,
+        location_id=location_id,
+        entries_per_page=100,
+        all_pages=True,
+        max_workers=8,
+        fields=None,
+    )
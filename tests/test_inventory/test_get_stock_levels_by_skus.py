@@ -1,8 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 
-from linnapi import exceptions, inventory
+from linnapi import LinnworksAPISession, exceptions, inventory
+from linnapi.cache import StockLevelCache
 from linnapi.models import StockLevelInfo
 from linnapi.requests.inventory import GetStockLevelBatch
 
@@ -218,3 +219,201 @@ def test_incorrect_product_in_response(
 ):
     with pytest.raises(exceptions.InvalidResponseError):
         inventory.get_stock_levels_by_skus(*skus)
+
+
+@pytest.fixture
+def small_batches():
+    with patch.object(
+        inventory.GetStockItemIDsBySKU, "MAX_ITEMS_PER_REQUEST", 2
+    ), patch.object(inventory.GetStockLevelBatch, "MAX_ITEMS_PER_REQUEST", 1):
+        yield
+
+
+@pytest.fixture
+def mock_batched_get_stock_item_ids_by_sku(skus, stock_item_ids):
+    lookup = dict(zip(skus, stock_item_ids, strict=True))
+    with patch("linnapi.inventory.get_stock_item_ids_by_sku") as mock_get_ids:
+        mock_get_ids.side_effect = lambda *batch: {sku: lookup[sku] for sku in batch}
+        yield mock_get_ids
+
+
+@pytest.fixture
+def mock_batched_make_request(get_stock_level_batch_response):
+    def batch_response(request_method, stock_item_ids):
+        return [
+            item
+            for item in get_stock_level_batch_response
+            if item["pkStockItemId"] in stock_item_ids
+        ]
+
+    with patch("linnapi.inventory.make_request") as mock_request:
+        mock_request.side_effect = batch_response
+        yield mock_request
+
+
+def test_get_stock_levels_by_skus_requests_stock_item_ids_in_batches(
+    small_batches,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    skus,
+):
+    inventory.get_stock_levels_by_skus(*skus)
+    assert sorted(mock_batched_get_stock_item_ids_by_sku.call_args_list) == sorted(
+        [call(*skus[:2]), call(*skus[2:])]
+    )
+
+
+def test_get_stock_levels_by_skus_requests_stock_levels_in_batches(
+    small_batches,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    skus,
+    stock_item_ids,
+):
+    inventory.get_stock_levels_by_skus(*skus)
+    assert sorted(
+        mock_batched_make_request.call_args_list,
+        key=lambda c: c.kwargs["stock_item_ids"],
+    ) == sorted(
+        [
+            call(GetStockLevelBatch, stock_item_ids=[stock_item_id])
+            for stock_item_id in stock_item_ids
+        ],
+        key=lambda c: c.kwargs["stock_item_ids"],
+    )
+
+
+def test_get_stock_levels_by_skus_merges_batches(
+    small_batches,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    skus,
+    get_stock_level_batch_response,
+):
+    returned_value = inventory.get_stock_levels_by_skus(*skus)
+    assert set(returned_value) == set(skus)
+    for i, sku in enumerate(skus):
+        assert (
+            returned_value[sku].stock_level
+            == get_stock_level_batch_response[i]["StockItemLevels"][0]["StockLevel"]
+        )
+
+
+def test_get_stock_levels_by_skus_raises_for_invalid_batch(
+    small_batches, mock_batched_get_stock_item_ids_by_sku, skus
+):
+    with patch("linnapi.inventory.make_request") as mock_request:
+        mock_request.return_value = [{"invalid_key": "invalid_value"}]
+        with pytest.raises(exceptions.InvalidResponseError):
+            inventory.get_stock_levels_by_skus(*skus)
+
+
+@pytest.fixture
+def stock_level_cache():
+    stock_level_cache = StockLevelCache(fresh_for=30)
+    api_session = LinnworksAPISession(stock_level_cache=stock_level_cache)
+    with patch("linnapi.inventory.LinnworksAPISession") as mock_session_class:
+        mock_session_class.current.return_value = api_session
+        yield stock_level_cache
+    stock_level_cache.close()
+
+
+@pytest.fixture
+def mock_time():
+    with patch("linnapi.cache.time.time") as mock_time:
+        mock_time.return_value = 1000.0
+        yield mock_time
+
+
+def requested_stock_item_ids(mock_request):
+    return sorted(
+        stock_item_id
+        for c in mock_request.call_args_list
+        for stock_item_id in c.kwargs["stock_item_ids"]
+    )
+
+
+def test_get_stock_levels_by_skus_stores_stock_levels_in_cache(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    skus,
+):
+    returned_value = inventory.get_stock_levels_by_skus(*skus)
+    cached, stale = stock_level_cache.lookup(skus, max_staleness=60)
+    assert cached == returned_value
+    assert stale == []
+
+
+def test_get_stock_levels_by_skus_without_max_staleness_ignores_cache(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    skus,
+):
+    inventory.get_stock_levels_by_skus(*skus)
+    inventory.get_stock_levels_by_skus(*skus)
+    assert mock_batched_make_request.call_count == 2
+
+
+def test_get_stock_levels_by_skus_returns_fresh_cached_stock_levels(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    mock_time,
+    skus,
+):
+    first_value = inventory.get_stock_levels_by_skus(*skus)
+    mock_time.return_value = 1010.0
+    returned_value = inventory.get_stock_levels_by_skus(*skus, max_staleness=60)
+    assert returned_value == first_value
+    assert mock_batched_make_request.call_count == 1
+
+
+def test_get_stock_levels_by_skus_requests_only_uncached_skus(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    mock_time,
+    skus,
+    stock_item_ids,
+):
+    inventory.get_stock_levels_by_skus(skus[0])
+    mock_batched_make_request.reset_mock()
+    returned_value = inventory.get_stock_levels_by_skus(*skus, max_staleness=60)
+    assert set(returned_value) == set(skus)
+    assert requested_stock_item_ids(mock_batched_make_request) == sorted(
+        stock_item_ids[1:]
+    )
+
+
+def test_get_stock_levels_by_skus_refreshes_stale_stock_levels_in_background(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    mock_time,
+    skus,
+):
+    first_value = inventory.get_stock_levels_by_skus(*skus)
+    mock_time.return_value = 1040.0
+    returned_value = inventory.get_stock_levels_by_skus(*skus, max_staleness=60)
+    assert returned_value == first_value
+    stock_level_cache.close()
+    assert mock_batched_make_request.call_count == 2
+    cached, stale = stock_level_cache.lookup(skus, max_staleness=60)
+    assert set(cached) == set(skus)
+    assert stale == []
+    assert cached[skus[0]] is not first_value[skus[0]]
+
+
+def test_get_stock_levels_by_skus_requests_stock_levels_older_than_max_staleness(
+    stock_level_cache,
+    mock_batched_get_stock_item_ids_by_sku,
+    mock_batched_make_request,
+    mock_time,
+    skus,
+):
+    inventory.get_stock_levels_by_skus(*skus)
+    mock_time.return_value = 1100.0
+    inventory.get_stock_levels_by_skus(*skus, max_staleness=60)
+    assert mock_batched_make_request.call_count == 2
@@ -1,8 +1,10 @@
 from unittest.mock import patch
 
 import pytest
+import requests
 
-from linnapi import exceptions, inventory
+from linnapi import LinnworksAPISession, exceptions, inventory
+from linnapi.cache import StockLevelCache
 from linnapi.models import StockLevelInfo
 from linnapi.requests.inventory import SetStockLevelBySKU
 
@@ -107,3 +109,45 @@ def test_set_stock_level_with_invalid_response(
         inventory.set_stock_level(
             changes=changes, location_id=location_id, change_source=change_source
         )
+
+
+@pytest.fixture
+def stock_level_cache():
+    stock_level_cache = StockLevelCache()
+    api_session = LinnworksAPISession(stock_level_cache=stock_level_cache)
+    with patch("linnapi.inventory.LinnworksAPISession") as mock_session_class:
+        mock_session_class.current.return_value = api_session
+        yield stock_level_cache
+
+
+def test_set_stock_level_updates_stock_level_cache(
+    stock_level_cache, mock_make_request, sku, location_id, changes
+):
+    returned_value = inventory.set_stock_level(changes=changes, location_id=location_id)
+    cached, _ = stock_level_cache.lookup([sku], max_staleness=60)
+    assert cached == {sku: returned_value[0]}
+
+
+def test_set_stock_level_invalidates_cache_for_invalid_response(
+    stock_level_cache,
+    mock_make_request_with_invalid_response,
+    sku,
+    location_id,
+    changes,
+):
+    stock_level_cache.store({sku: "cached", "other": "cached"})
+    with pytest.raises(exceptions.InvalidResponseError):
+        inventory.set_stock_level(changes=changes, location_id=location_id)
+    cached, _ = stock_level_cache.lookup([sku, "other"], max_staleness=60)
+    assert cached == {"other": "cached"}
+
+
+def test_set_stock_level_invalidates_cache_for_failed_request(
+    stock_level_cache, sku, location_id, changes
+):
+    stock_level_cache.store({sku: "cached"})
+    with patch("linnapi.inventory.make_request") as mock_request:
+        mock_request.side_effect = requests.ConnectionError()
+        with pytest.raises(requests.ConnectionError):
+            inventory.set_stock_level(changes=changes, location_id=location_id)
+    assert stock_level_cache.lookup([sku], max_staleness=60) == ({}, [])
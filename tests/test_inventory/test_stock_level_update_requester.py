@@ -0,0 +1,21 @@
+from linnapi.inventory import StockLevelUpdateRequester
+from linnapi.requests.inventory import SetStockLevelBySKU
+
+
+def test_stock_level_update_requester_request_method():
+    assert StockLevelUpdateRequester().request_method == SetStockLevelBySKU
+
+
+def test_add_request_method():
+    requester = StockLevelUpdateRequester()
+    requester.add_request(
+        sku="E32-99X-8G2", level=5, location_id="aaa-bbb-ccc", change_source="Feed"
+    )
+    assert requester.requests == [
+        {
+            "sku": "E32-99X-8G2",
+            "level": 5,
+            "location_id": "aaa-bbb-ccc",
+            "change_source": "Feed",
+        }
+    ]
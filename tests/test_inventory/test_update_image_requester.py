@@ -1,7 +1,12 @@
+import time
+
 import pytest
+import requests
 
+from linnapi import exceptions
 from linnapi.inventory import UpdateImageRequster
 from linnapi.requests.inventory import UpdateImages
+from linnapi.session import LinnworksAPISession
 
 
 @pytest.fixture
@@ -39,3 +44,60 @@ def test_add_request_method(image_id, stock_item_id, sort_order):
             "is_main": True,
         }
     ]
+
+
+@pytest.fixture
+def api_session():
+    api_session = LinnworksAPISession("app", "secret", "install-token")
+    api_session.session_token = "session-token"
+    api_session.session_token_expires_at = time.time() + 3600
+    with api_session:
+        yield api_session
+
+
+@pytest.fixture
+def requester():
+    requester = UpdateImageRequster(max_workers=1)
+    for i in range(250):
+        requester.add_request(
+            image_id=f"image-{i}", stock_item_id=f"item-{i}", sort_order=i
+        )
+    return requester
+
+
+def test_update_image_requester_reports_chunks_with_error_status(
+    requests_mock, api_session, requester
+):
+    requests_mock.post(
+        UpdateImages.url(api_session.server_url()),
+        [
+            {"text": "ok", "status_code": 200},
+            {"text": "boom", "status_code": 500},
+            {"text": "too big", "status_code": 413},
+        ],
+    )
+    with pytest.raises(exceptions.PartialRequestError) as exc_info:
+        requester.request()
+    assert [result.succeeded for result in requester.chunk_results] == [
+        True,
+        False,
+        False,
+    ]
+    assert all(
+        isinstance(result.error, requests.HTTPError)
+        for result in exc_info.value.failed_chunks
+    )
+    assert requester.failed_requests == requester.requests[100:]
+    assert exc_info.value.result == "ok"
+
+
+def test_update_image_requester_returns_text_for_any_number_of_chunks(
+    requests_mock, api_session, requester
+):
+    requests_mock.post(UpdateImages.url(api_session.server_url()), text="")
+    assert requester.request() == ""
+    single_chunk_requester = UpdateImageRequster()
+    single_chunk_requester.add_request(
+        image_id="image", stock_item_id="item", sort_order=0
+    )
+    assert single_chunk_requester.request() == ""
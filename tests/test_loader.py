@@ -0,0 +1,106 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from linnapi.loader import BatchLoader
+
+
+@pytest.fixture
+def load_batch():
+    return Mock(side_effect=lambda keys: {key: key.upper() for key in keys})
+
+
+def load_concurrently(loader, keys):
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        return list(pool.map(loader.load, keys))
+
+
+def test_load_returns_value(load_batch):
+    loader = BatchLoader(load_batch, wait=0)
+    assert loader.load("a") == "A"
+    load_batch.assert_called_once_with(["a"])
+
+
+def test_concurrent_loads_are_batched(load_batch):
+    loader = BatchLoader(load_batch, wait=0.2)
+    keys = [f"key-{i}" for i in range(10)]
+    assert load_concurrently(loader, keys) == [key.upper() for key in keys]
+    assert load_batch.call_count == 1
+    assert sorted(load_batch.call_args.args[0]) == sorted(keys)
+    assert loader.batches_loaded == 1
+
+
+def test_duplicate_keys_are_loaded_once(load_batch):
+    loader = BatchLoader(load_batch, wait=0.2)
+    assert load_concurrently(loader, ["a", "a", "b"]) == ["A", "A", "B"]
+    assert sorted(load_batch.call_args.args[0]) == ["a", "b"]
+
+
+def test_full_batch_is_loaded_without_waiting(load_batch):
+    loader = BatchLoader(load_batch, wait=10, max_batch_size=3)
+    start = time.monotonic()
+    load_concurrently(loader, ["a", "b", "c"])
+    assert time.monotonic() - start < 5
+    assert load_batch.call_count == 1
+
+
+def test_batches_are_limited_to_max_batch_size(load_batch):
+    loader = BatchLoader(load_batch, wait=0.2, max_batch_size=2)
+    keys = [f"key-{i}" for i in range(6)]
+    assert load_concurrently(loader, keys) == [key.upper() for key in keys]
+    assert all(len(call.args[0]) <= 2 for call in load_batch.call_args_list)
+    assert sum(len(call.args[0]) for call in load_batch.call_args_list) == 6
+
+
+def test_missing_key_raises_key_error():
+    loader = BatchLoader(lambda keys: {}, wait=0)
+    with pytest.raises(KeyError):
+        loader.load("a")
+
+
+def test_batch_error_is_raised_for_every_caller():
+    barrier = threading.Barrier(3)
+
+    def load_batch(keys):
+        raise ValueError("failed")
+
+    loader = BatchLoader(load_batch, wait=0.2)
+
+    def load(key):
+        barrier.wait()
+        try:
+            loader.load(key)
+        except ValueError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert list(pool.map(load, ["a", "b", "c"])) == ["failed"] * 3
+
+
+def test_batch_is_loaded_in_context_of_first_caller():
+    variable = contextvars.ContextVar("variable", default="unset")
+    seen = []
+
+    def load_batch(keys):
+        seen.append(variable.get())
+        return {key: key for key in keys}
+
+    loader = BatchLoader(load_batch, wait=0)
+
+    def load():
+        variable.set("caller")
+        return loader.load("a")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(load).result()
+    assert seen == ["caller"]
+
+
+@pytest.mark.parametrize("kwargs", [{"wait": -1}, {"max_batch_size": 0}])
+def test_invalid_settings_raise_value_error(kwargs):
+    with pytest.raises(ValueError):
+        BatchLoader(Mock(), **kwargs)
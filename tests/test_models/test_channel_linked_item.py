@@ -138,3 +138,9 @@ def test_channel_linked_item_sets_stock_item_id(
     channel_linked_item, channel_skus_response
 ):
     assert channel_linked_item.stock_item_id == channel_skus_response["StockItemId"]
+
+
+def test_channel_linked_item_uses_slots(channel_linked_item):
+    assert not hasattr(channel_linked_item, "__dict__")
+    with pytest.raises(AttributeError):
+        channel_linked_item.undeclared_attribute = None
@@ -60,3 +60,9 @@ def test_inventory_item_image_sets_in_order_image_thumbnail_url(
         inventory_item_image_with_response.image_thumbnail_url
         == add_image_to_inventory_item_response["ImageThumbnailUrl"]
     )
+
+
+def test_inventory_item_image_uses_slots(inventory_item_image_with_response):
+    assert not hasattr(inventory_item_image_with_response, "__dict__")
+    with pytest.raises(AttributeError):
+        inventory_item_image_with_response.undeclared_attribute = None
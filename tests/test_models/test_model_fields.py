@@ -0,0 +1,198 @@
+import pytest
+
+from linnapi import models
+
+
+@pytest.fixture
+def stock_item_history_data():
+    return {
+        "Date": "2022-04-11T13:32:10.993Z",
+        "Level": 44,
+        "StockValue": 0.0,
+        "Note": "Imported from file",
+        "ChangeQty": 44,
+        "ChangeValue": 0.0,
+        "StockItemId": "6079faa4-e4ff-4b5b-9990-fc571e70412e",
+        "StockItemIntId": 0,
+    }
+
+
+@pytest.fixture
+def stock_level_data():
+    return {
+        "Location": {
+            "StockLocationId": "00000000-0000-0000-0000-000000000000",
+            "StockLocationIntId": 0,
+            "LocationName": "Default",
+            "IsFulfillmentCenter": False,
+            "IsWarehouseManaged": False,
+        },
+        "StockLevel": 3,
+        "StockValue": 0.0,
+        "MinimumLevel": 4,
+        "InOrderBook": 0,
+        "Due": 0,
+        "JIT": False,
+        "InOrders": 0,
+        "Available": 3,
+        "UnitCost": 0.0,
+        "SKU": "E32-99X-8G2",
+        "LastUpdateDate": "2022-03-15T14:31:09.103Z",
+        "rowid": "2df49516-77f7-4eb6-aa75-dd6ae9ec7e82",
+        "PendingUpdate": False,
+        "StockItemPurchasePrice": 9.6,
+        "StockItemId": "965c4c47-227d-4b87-913f-0114dab13b61",
+        "StockItemIntId": 0,
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_raw_retention():
+    yield
+    models.set_raw_retention("full")
+
+
+def is_set(model, name):
+    try:
+        getattr(type(model), name).__get__(model)
+    except AttributeError:
+        return False
+    return True
+
+
+def test_lazy_fields_are_not_converted_on_creation(stock_level_data):
+    stock_level = models.StockLevelInfo(stock_level_data)
+    assert not is_set(stock_level, "last_update_date")
+    assert is_set(stock_level, "sku")
+
+
+def test_lazy_field_is_converted_on_first_access(stock_level_data):
+    stock_level = models.StockLevelInfo(stock_level_data)
+    assert stock_level.last_update_date == models.parse_date_time(
+        stock_level_data["LastUpdateDate"]
+    )
+    assert is_set(stock_level, "last_update_date")
+
+
+def test_converted_lazy_field_is_kept(stock_level_data):
+    stock_level = models.StockLevelInfo(stock_level_data)
+    last_update_date = stock_level.last_update_date
+    stock_level_data["LastUpdateDate"] = "2023-01-01T00:00:00Z"
+    assert stock_level.last_update_date is last_update_date
+
+
+def test_lazy_field_conversion_errors_are_raised_on_access(stock_level_data):
+    stock_level_data["LastUpdateDate"] = "not a date"
+    stock_level = models.StockLevelInfo(stock_level_data)
+    with pytest.raises(ValueError):
+        stock_level.last_update_date
+
+
+@pytest.mark.parametrize("mode", ["compact", "none"])
+def test_lazy_fields_are_converted_on_creation_without_full_raw(mode, stock_level_data):
+    with models.raw_retention(mode):
+        stock_level = models.StockLevelInfo(stock_level_data)
+    assert is_set(stock_level, "last_update_date")
+    assert stock_level.last_update_date == models.parse_date_time(
+        stock_level_data["LastUpdateDate"]
+    )
+
+
+def test_missing_lazy_field_key_raises_key_error(stock_level_data):
+    del stock_level_data["LastUpdateDate"]
+    with pytest.raises(KeyError, match="LastUpdateDate"):
+        models.StockLevelInfo(stock_level_data)
+
+
+def test_missing_key_raises_key_error(stock_level_data):
+    del stock_level_data["SKU"]
+    with pytest.raises(KeyError, match="SKU"):
+        models.StockLevelInfo(stock_level_data)
+
+
+def test_non_dict_data_raises_type_error():
+    with pytest.raises(TypeError):
+        models.StockLevelInfo(["SKU", "LastUpdateDate"])
+
+
+def test_unknown_attribute_raises_attribute_error(stock_level_data):
+    stock_level = models.StockLevelInfo(stock_level_data)
+    with pytest.raises(AttributeError):
+        stock_level.undeclared_attribute
+
+
+def test_lazy_field_can_be_set(stock_level_data):
+    stock_level = models.StockLevelInfo(stock_level_data)
+    stock_level.last_update_date = None
+    assert stock_level.last_update_date is None
+
+
+def test_model_without_lazy_fields_converts_on_creation(stock_item_history_data):
+    record = models.StockItemHistoryRecord(stock_item_history_data)
+    assert is_set(record, "timestamp")
+
+
+def test_projection_sets_requested_fields(stock_item_history_data):
+    record = models.StockItemHistoryRecord(
+        stock_item_history_data, fields=["stock_level", "timestamp"]
+    )
+    assert record.stock_level == 44
+    assert is_set(record, "timestamp")
+    assert not is_set(record, "text")
+
+
+def test_projection_does_not_keep_raw(stock_item_history_data):
+    record = models.StockItemHistoryRecord(stock_item_history_data, fields=[])
+    assert models.get_raw_retention() == "full"
+    with pytest.raises(AttributeError, match="without retaining raw data"):
+        record.raw
+
+
+def test_unprojected_field_raises_attribute_error(stock_item_history_data):
+    record = models.StockItemHistoryRecord(
+        stock_item_history_data, fields=["stock_level"]
+    )
+    with pytest.raises(AttributeError, match="not among the fields loaded"):
+        record.text
+
+
+def test_projection_with_unknown_field_raises_value_error(stock_item_history_data):
+    with pytest.raises(ValueError):
+        models.StockItemHistoryRecord(stock_item_history_data, fields=["level"])
+
+
+def test_projection_with_missing_key_raises_key_error(stock_item_history_data):
+    del stock_item_history_data["Level"]
+    with pytest.raises(KeyError):
+        models.StockItemHistoryRecord(stock_item_history_data, fields=["stock_level"])
+
+
+def test_projection_of_non_dict_data_raises_type_error():
+    with pytest.raises(TypeError):
+        models.StockItemHistoryRecord(["Level"], fields=["stock_level"])
+
+
+def test_check_fields_returns_tuple():
+    assert models.StockItemHistoryRecord.check_fields(
+        iter(["stock_level", "text"])
+    ) == ("stock_level", "text")
+
+
+def test_check_fields_with_unknown_field_raises_value_error():
+    with pytest.raises(ValueError, match="'level'"):
+        models.StockItemHistoryRecord.check_fields(["stock_level", "level"])
+
+
+def test_check_fields_for_model_without_projection_raises_value_error():
+    with pytest.raises(ValueError):
+        models.StockLevelInfo.check_fields(["sku"])
+
+
+def test_raw_error_message_when_raw_is_not_retained(stock_item_history_data):
+    with models.raw_retention("none"):
+        record = models.StockItemHistoryRecord(stock_item_history_data)
+    with pytest.raises(AttributeError) as exc_info:
+        record.raw
+    assert str(exc_info.value) == (
+        "StockItemHistoryRecord was created without retaining raw data."
+    )
@@ -94,3 +94,25 @@ def test_order_audit_trail_entry_sets_type_description(
         order_audit_trail_entry_with_data.type_description
         == order_audit_trail_data["TypeDescription"]
     )
+
+
+def test_order_audit_trail_entry_uses_slots(order_audit_trail_entry_with_data):
+    assert not hasattr(order_audit_trail_entry_with_data, "__dict__")
+    with pytest.raises(AttributeError):
+        order_audit_trail_entry_with_data.undeclared_attribute = None
+
+
+def test_order_audit_trail_entry_fields_cover_every_attribute():
+    assert set(models.OrderAuditTrailEntry._fields) == set(
+        models.OrderAuditTrailEntry.__slots__
+    )
+
+
+@pytest.mark.parametrize("field", list(models.OrderAuditTrailEntry._fields))
+def test_order_audit_trail_entry_projection_matches_full_model(
+    order_audit_trail_data, order_audit_trail_entry_with_data, field
+):
+    projected = models.OrderAuditTrailEntry(order_audit_trail_data, fields=[field])
+    assert getattr(projected, field) == getattr(
+        order_audit_trail_entry_with_data, field
+    )
@@ -1,6 +1,7 @@
 import datetime as dt
 
 import pytest
+import pytz
 
 from linnapi import models
 
@@ -19,7 +20,14 @@ def test_parse_date_time_method(
     date_string,
 ):
     date = dt.datetime(
-        year=2022, month=3, day=15, hour=14, minute=31, second=9, microsecond=103
+        year=2022,
+        month=3,
+        day=15,
+        hour=14,
+        minute=31,
+        second=9,
+        microsecond=103000,
+        tzinfo=dt.timezone.utc,
     )
     assert models.parse_date_time(date_string) == date
 
@@ -28,7 +36,14 @@ def test_parse_date_time_method_with_short_date_time(
     short_date_time_string,
 ):
     date = dt.datetime(
-        year=2022, month=4, day=19, hour=7, minute=1, second=37, microsecond=0
+        year=2022,
+        month=4,
+        day=19,
+        hour=7,
+        minute=1,
+        second=37,
+        microsecond=0,
+        tzinfo=dt.timezone.utc,
     )
     assert models.parse_date_time(short_date_time_string) == date
 
@@ -43,3 +58,42 @@ def test_parse_date_time_method_raises_value_error_for_invalid_input():
     with pytest.raises(ValueError) as exec_info:
         models.parse_date_time(date_string)
     assert date_string in str(exec_info.value)
+
+
+def test_parse_date_time_method_returns_utc_datetime(date_string):
+    assert models.parse_date_time(date_string).tzinfo is pytz.utc
+
+
+def test_parse_date_time_method_pads_short_fractions():
+    date_string = "2022-05-23T07:25:47.19Z"
+    assert models.parse_date_time(date_string).microsecond == 190000
+
+
+def test_parse_date_time_method_assumes_utc_without_timezone():
+    date_string = "2022-04-19T07:01:37"
+    assert models.parse_date_time(date_string) == dt.datetime(
+        2022, 4, 19, 7, 1, 37, tzinfo=dt.timezone.utc
+    )
+
+
+def test_parse_date_time_method_converts_offsets_to_utc():
+    date_string = "2022-04-19T08:01:37+01:00"
+    date_time = models.parse_date_time(date_string)
+    assert date_time.hour == 7
+    assert date_time.tzinfo is pytz.utc
+
+
+def test_parse_date_time_method_with_minimum_date():
+    assert models.parse_date_time("0001-01-01T00:00:00Z").year == 1
+
+
+def test_parse_date_time_method_memoises_results(date_string):
+    models.parse_date_time.cache_clear()
+    first = models.parse_date_time(date_string)
+    assert models.parse_date_time(date_string) is first
+    assert models.parse_date_time.cache_info().hits == 1
+
+
+def test_parse_date_time_method_raises_value_error_for_non_string_input():
+    with pytest.raises(ValueError):
+        models.parse_date_time(None)
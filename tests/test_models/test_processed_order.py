@@ -289,3 +289,29 @@ def test_processed_order_sets_fulfilment_location_name(
         processed_order.fulfilment_location_name
         == processed_order_data["FulfilmentLocationName"]
     )
+
+
+def test_processed_order_uses_slots(processed_order):
+    assert not hasattr(processed_order, "__dict__")
+    with pytest.raises(AttributeError):
+        processed_order.undeclared_attribute = None
+
+
+def test_processed_order_fields_cover_every_attribute():
+    assert set(models.ProcessedOrder._fields) == set(models.ProcessedOrder.__slots__)
+
+
+@pytest.mark.parametrize("field", list(models.ProcessedOrder._fields))
+def test_processed_order_projection_matches_full_model(
+    processed_order_data, processed_order, field
+):
+    projected = models.ProcessedOrder(processed_order_data, fields=[field])
+    assert getattr(projected, field) == getattr(processed_order, field)
+
+
+def test_processed_order_projection_sets_only_requested_fields(processed_order_data):
+    projected = models.ProcessedOrder(processed_order_data, fields=["order_id"])
+    with pytest.raises(AttributeError):
+        projected.total_charge
+    with pytest.raises(AttributeError):
+        projected.processed_at
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from linnapi import models
+
+
+@pytest.fixture
+def stock_item_history_data():
+    return {
+        "Date": "2022-04-11T13:32:10.993Z",
+        "Level": 44,
+        "StockValue": 0.0,
+        "Note": "Imported from file",
+        "ChangeQty": 44,
+        "ChangeValue": 0.0,
+        "StockItemId": "6079faa4-e4ff-4b5b-9990-fc571e70412e",
+        "StockItemIntId": 0,
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_raw_retention():
+    yield
+    models.set_raw_retention("full")
+
+
+def test_raw_retention_defaults_to_full(stock_item_history_data):
+    assert models.get_raw_retention() == "full"
+    record = models.StockItemHistoryRecord(stock_item_history_data)
+    assert record.raw is stock_item_history_data
+
+
+def test_set_raw_retention_none_drops_raw(stock_item_history_data):
+    models.set_raw_retention("none")
+    record = models.StockItemHistoryRecord(stock_item_history_data)
+    with pytest.raises(AttributeError, match="without retaining raw data"):
+        record.raw
+
+
+def test_raw_retention_none_keeps_parsed_attributes(stock_item_history_data):
+    models.set_raw_retention("none")
+    record = models.StockItemHistoryRecord(stock_item_history_data)
+    assert record.stock_level == stock_item_history_data["Level"]
+    assert record.timestamp == models.parse_date_time(stock_item_history_data["Date"])
+
+
+def test_set_raw_retention_compact_stores_bytes(stock_item_history_data):
+    models.set_raw_retention("compact")
+    record = models.StockItemHistoryRecord(stock_item_history_data)
+    assert isinstance(record._raw, bytes)
+    assert record.raw == stock_item_history_data
+    assert record.raw is not stock_item_history_data
+
+
+def test_set_raw_retention_applies_to_later_models(stock_item_history_data):
+    kept = models.StockItemHistoryRecord(stock_item_history_data)
+    models.set_raw_retention("none")
+    models.StockItemHistoryRecord(stock_item_history_data)
+    assert kept.raw == stock_item_history_data
+
+
+def test_set_raw_retention_rejects_invalid_mode():
+    with pytest.raises(ValueError):
+        models.set_raw_retention("partial")
+    assert models.get_raw_retention() == "full"
+
+
+def test_raw_retention_context_manager_sets_mode(stock_item_history_data):
+    with models.raw_retention("none"):
+        assert models.get_raw_retention() == "none"
+        dropped = models.StockItemHistoryRecord(stock_item_history_data)
+    kept = models.StockItemHistoryRecord(stock_item_history_data)
+    with pytest.raises(AttributeError, match="without retaining raw data"):
+        dropped.raw
+    assert kept.raw == stock_item_history_data
+
+
+def test_raw_retention_context_manager_overrides_global_mode():
+    models.set_raw_retention("none")
+    with models.raw_retention("compact"):
+        assert models.get_raw_retention() == "compact"
+    assert models.get_raw_retention() == "none"
+
+
+def test_raw_retention_context_manager_restores_mode_on_error():
+    with pytest.raises(RuntimeError):
+        with models.raw_retention("none"):
+            raise RuntimeError()
+    assert models.get_raw_retention() == "full"
+
+
+def test_raw_retention_context_manager_rejects_invalid_mode():
+    with pytest.raises(ValueError):
+        with models.raw_retention("partial"):
+            pass
+
+
+def test_raw_retention_context_manager_does_not_affect_other_threads():
+    modes = []
+    with models.raw_retention("none"):
+        thread = threading.Thread(
+            target=lambda: modes.append(models.get_raw_retention())
+        )
+        thread.start()
+        thread.join()
+    assert modes == ["full"]
+
+
+def test_set_raw_retention_affects_other_threads():
+    modes = []
+    models.set_raw_retention("compact")
+    thread = threading.Thread(target=lambda: modes.append(models.get_raw_retention()))
+    thread.start()
+    thread.join()
+    assert modes == ["compact"]
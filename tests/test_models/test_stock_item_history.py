@@ -52,3 +52,23 @@ def test_stock_item_history_sets_stock_item_id(
     stock_item_history_data, stock_item_history
 ):
     assert stock_item_history.stock_item_id == stock_item_history_data["StockItemId"]
+
+
+def test_stock_item_history_uses_slots(stock_item_history):
+    assert not hasattr(stock_item_history, "__dict__")
+    with pytest.raises(AttributeError):
+        stock_item_history.undeclared_attribute = None
+
+
+def test_stock_item_history_fields_cover_every_attribute():
+    assert set(models.StockItemHistoryRecord._fields) == set(
+        models.StockItemHistoryRecord.__slots__
+    )
+
+
+@pytest.mark.parametrize("field", list(models.StockItemHistoryRecord._fields))
+def test_stock_item_history_projection_matches_full_model(
+    stock_item_history_data, stock_item_history, field
+):
+    projected = models.StockItemHistoryRecord(stock_item_history_data, fields=[field])
+    assert getattr(projected, field) == getattr(stock_item_history, field)
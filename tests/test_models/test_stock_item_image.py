@@ -98,3 +98,9 @@ def test_stock_item__image_sets_sort_order(
         stock_item_image_with_response.sort_order
         == get_inventory_item_images_response["SortOrder"]
     )
+
+
+def test_stock_item_image_uses_slots(stock_item_image_with_response):
+    assert not hasattr(stock_item_image_with_response, "__dict__")
+    with pytest.raises(AttributeError):
+        stock_item_image_with_response.undeclared_attribute = None
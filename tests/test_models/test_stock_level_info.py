@@ -367,3 +367,9 @@ def test_stock_level_info_with_set_stock_level_response_sets_row_id(
         stock_level_info_with_set_stock_level_response.row_id
         == set_stock_level_response["rowid"]
     )
+
+
+def test_stock_level_info_uses_slots(stock_level_info_with_get_stock_level_response):
+    assert not hasattr(stock_level_info_with_get_stock_level_response, "__dict__")
+    with pytest.raises(AttributeError):
+        stock_level_info_with_get_stock_level_response.undeclared_attribute = None
@@ -90,3 +90,27 @@ def test_get_inventory_item_images_with_invalid_response(
 ):
     with pytest.raises(exceptions.InvalidResponseError):
         orders.get_processed_order_audit_trail(order_guid)
+
+
+def test_get_processed_order_audit_trail_with_fields(
+    mock_multiple_response, order_guid
+):
+    returned_value = orders.get_processed_order_audit_trail(
+        order_guid, fields=["tag", "timestamp"]
+    )
+    assert len(returned_value) == 3
+    for entry in returned_value:
+        assert entry.tag == "CONFIRMED"
+        assert entry.timestamp.minute == 27
+        with pytest.raises(AttributeError):
+            entry.history_note
+        with pytest.raises(AttributeError, match="without retaining raw data"):
+            entry.raw
+
+
+def test_get_processed_order_audit_trail_with_unknown_field(
+    mock_single_response, order_guid
+):
+    with pytest.raises(ValueError):
+        orders.get_processed_order_audit_trail(order_guid, fields=["note"])
+    mock_single_response.assert_not_called()
@@ -0,0 +1,185 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from linnapi import exceptions, models, orders
+
+
+@pytest.fixture
+def search_term():
+    return "184165186"
+
+
+@pytest.fixture
+def processed_order_response():
+    return {
+        "pkOrderID": "73846ae8-9f64-42ef-8d76-31aa418da9d5",
+        "dReceivedDate": "2022-05-23T00:09:35Z",
+        "dProcessedOn": "2022-05-23T07:25:47.19Z",
+        "timeDiff": 0.30291886574074073,
+        "fPostageCost": 0.0,
+        "fTotalCharge": 27.99,
+        "PostageCostExTax": 0.0,
+        "Subtotal": 23.325,
+        "fTax": 4.665,
+        "TotalDiscount": 0.0,
+        "ProfitMargin": 0.0,
+        "CountryTaxRate": 20.0,
+        "nOrderId": 109390,
+        "nStatus": 1,
+        "cCurrency": "GBP",
+        "PostalTrackingNumber": "JH47846456175GB",
+        "cCountry": "United Kingdom",
+        "Source": "EBAY",
+        "PostalServiceName": "TPS: Royal Mail Tracked 48 - Non Signature",
+        "ReferenceNum": "20-08658-40025",
+        "SecondaryReference": "20-08658-40025",
+        "ExternalReference": "1238579407101",
+        "Address1": "59 Fake Drive",
+        "Address2": "",
+        "Address3": "",
+        "Town": "Sometown",
+        "Region": "Nowhere",
+        "BuyerPhoneNumber": "999666999",
+        "Company": "",
+        "SubSource": "store",
+        "ChannelBuyerName": "buyer",
+        "AccountName": "Default",
+        "cFullName": "Some Name",
+        "cEmailAddress": "noone@nowhere.com",
+        "cPostCode": "GUFF FFF",
+        "dPaidOn": "2022-05-23T00:09:36Z",
+        "dCancelledOn": "0001-01-01T00:00:00Z",
+        "ItemWeight": 0.0,
+        "TotalWeight": 0.0,
+        "HoldOrCancel": False,
+        "IsResend": False,
+        "IsExchange": False,
+        "TaxId": "",
+        "FulfilmentLocationName": "Default",
+    }
+
+
+@pytest.fixture
+def total_pages():
+    return 3
+
+
+@pytest.fixture
+def page(total_pages, processed_order_response):
+    def page(page_number):
+        return {
+            "ProcessedOrders": {
+                "PageNumber": page_number,
+                "EntriesPerPage": 2,
+                "TotalEntries": total_pages * 2,
+                "TotalPages": total_pages,
+                "Data": [
+                    dict(processed_order_response, nOrderId=page_number * 10 + i)
+                    for i in range(2)
+                ],
+            }
+        }
+
+    return page
+
+
+@pytest.fixture
+def requested_pages():
+    return []
+
+
+@pytest.fixture
+def mock_make_request(page, requested_pages):
+    def make_request(*args, page_number, **kwargs):
+        requested_pages.append(page_number)
+        return page(page_number)
+
+    with patch("linnapi.orders.make_request", side_effect=make_request) as mock:
+        yield mock
+
+
+def test_iter_processed_orders_yields_all_orders_in_order(
+    mock_make_request, search_term
+):
+    returned_orders = list(orders.iter_processed_orders(search_term))
+    assert all(isinstance(order, models.ProcessedOrder) for order in returned_orders)
+    assert [order.order_id for order in returned_orders] == [
+        "10",
+        "11",
+        "20",
+        "21",
+        "30",
+        "31",
+    ]
+
+
+def test_iter_processed_orders_requests_each_page_once(
+    mock_make_request, requested_pages, search_term
+):
+    list(orders.iter_processed_orders(search_term))
+    assert requested_pages == [1, 2, 3]
+    mock_make_request.assert_any_call(
+        orders.SearchProcessedOrders, search_term=search_term, page_number=1
+    )
+
+
+def test_iter_processed_orders_is_lazy(mock_make_request, search_term):
+    orders.iter_processed_orders(search_term)
+    mock_make_request.assert_not_called()
+
+
+@pytest.mark.parametrize("total_pages", [1])
+def test_iter_processed_orders_with_single_page(
+    mock_make_request, requested_pages, search_term
+):
+    assert len(list(orders.iter_processed_orders(search_term))) == 2
+    assert requested_pages == [1]
+
+
+def test_iter_processed_orders_prefetches_next_page(page, search_term):
+    page_two_requested = threading.Event()
+
+    def make_request(*args, page_number, **kwargs):
+        if page_number == 2:
+            page_two_requested.set()
+        return page(page_number)
+
+    with patch("linnapi.orders.make_request", side_effect=make_request):
+        iterator = orders.iter_processed_orders(search_term)
+        next(iterator)
+        assert page_two_requested.wait(timeout=1)
+        iterator.close()
+
+
+def test_iter_processed_orders_only_prefetches_one_page(
+    mock_make_request, requested_pages, search_term
+):
+    iterator = orders.iter_processed_orders(search_term)
+    next(iterator)
+    next(iterator)
+    iterator.close()
+    assert requested_pages == [1, 2]
+
+
+def test_iter_processed_orders_with_invalid_response(search_term):
+    with patch("linnapi.orders.make_request") as mock_make_request:
+        mock_make_request.return_value = {"invalid_key": "invalid_value"}
+        with pytest.raises(exceptions.InvalidResponseError):
+            list(orders.iter_processed_orders(search_term))
+
+
+def test_iter_processed_orders_with_fields(mock_make_request, search_term):
+    returned_orders = list(orders.iter_processed_orders(search_term, fields=["town"]))
+    assert len(returned_orders) == 6
+    for order in returned_orders:
+        assert order.town == "Sometown"
+        with pytest.raises(AttributeError):
+            order.order_id
+
+
+def test_iter_processed_orders_with_unknown_field(mock_make_request, search_term):
+    with pytest.raises(ValueError):
+        orders.iter_processed_orders(search_term, fields=["order_number"])
+    mock_make_request.assert_not_called()
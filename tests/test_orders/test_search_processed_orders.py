@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import call, patch
 
 import pytest
@@ -156,9 +158,10 @@ def test_search_processed_orders_with_multiple_pages_requests_all_pages(
                 search_term=search_term,
                 page_number=3,
             ),
-        )
+        ),
+        any_order=True,
     )
-    mock_multipage_response.call_count == 3
+    assert mock_multipage_response.call_count == 3
 
 
 def test_search_processed_orders_with_multiple_pages_returns_all_objects(
@@ -173,3 +176,73 @@ def test_search_processed_orders_with_invalid_response(
 ):
     with pytest.raises(exceptions.InvalidResponseError):
         orders.search_processed_orders(search_term)
+
+
+@pytest.fixture
+def numbered_pages(processed_order_response):
+    def page(page_number):
+        order = dict(processed_order_response, nOrderId=page_number)
+        return {
+            "ProcessedOrders": {
+                "PageNumber": page_number,
+                "EntriesPerPage": 1,
+                "TotalEntries": 5,
+                "TotalPages": 5,
+                "Data": [order],
+            }
+        }
+
+    return page
+
+
+def test_search_processed_orders_returns_pages_in_order(numbered_pages, search_term):
+    def make_request(*args, page_number, **kwargs):
+        time.sleep(0.01 * (5 - page_number))
+        return numbered_pages(page_number)
+
+    with patch("linnapi.orders.make_request", side_effect=make_request):
+        returned_value = orders.search_processed_orders(search_term)
+    assert [order.order_id for order in returned_value] == ["1", "2", "3", "4", "5"]
+
+
+def test_search_processed_orders_requests_pages_concurrently(
+    numbered_pages, search_term
+):
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def make_request(*args, page_number, **kwargs):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return numbered_pages(page_number)
+
+    with patch("linnapi.orders.make_request", side_effect=make_request):
+        orders.search_processed_orders(search_term, max_workers=2)
+    assert max_active == 2
+
+
+def test_search_processed_orders_with_fields(mock_multipage_response, search_term):
+    returned_value = orders.search_processed_orders(
+        search_term, fields=["order_id", "processed_at", "total_charge"]
+    )
+    assert len(returned_value) == 9
+    for order in returned_value:
+        assert order.order_id == "109390"
+        assert order.total_charge == 27.99
+        assert order.processed_at.year == 2022
+        with pytest.raises(AttributeError):
+            order.town
+        with pytest.raises(AttributeError, match="without retaining raw data"):
+            order.raw
+
+
+def test_search_processed_orders_with_unknown_field(mock_single_response, search_term):
+    with pytest.raises(ValueError):
+        orders.search_processed_orders(search_term, fields=["order_number"])
+    mock_single_response.assert_not_called()
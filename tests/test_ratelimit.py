@@ -0,0 +1,71 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from linnapi import ratelimit
+
+
+def test_rate_limit_rate():
+    assert ratelimit.RateLimit(calls=150, period=60).rate == 2.5
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"calls": 0}, {"calls": 1, "period": 0}, {"calls": 1, "burst": 0}]
+)
+def test_rate_limit_rejects_invalid_values(kwargs):
+    with pytest.raises(ValueError):
+        ratelimit.RateLimit(**kwargs)
+
+
+def test_token_bucket_does_not_wait_within_burst():
+    bucket = ratelimit.TokenBucket(ratelimit.RateLimit(calls=1, period=60, burst=3))
+    with patch("linnapi.ratelimit.time.sleep") as mock_sleep:
+        waits = [bucket.acquire() for _ in range(3)]
+    assert waits == [0.0, 0.0, 0.0]
+    mock_sleep.assert_not_called()
+
+
+def test_token_bucket_waits_when_empty():
+    bucket = ratelimit.TokenBucket(ratelimit.RateLimit(calls=60, period=60))
+    with patch("linnapi.ratelimit.time.sleep") as mock_sleep:
+        bucket.acquire()
+        wait = bucket.acquire()
+    assert 0.9 < wait <= 1.0
+    mock_sleep.assert_called_once_with(wait)
+
+
+def test_token_bucket_queues_waiting_callers():
+    bucket = ratelimit.TokenBucket(ratelimit.RateLimit(calls=60, period=60))
+    with patch("linnapi.ratelimit.time.sleep"):
+        waits = [bucket.acquire() for _ in range(4)]
+    assert waits[0] == 0.0
+    assert 2.9 < waits[3] <= 3.0
+
+
+def test_token_bucket_limits_concurrent_callers():
+    bucket = ratelimit.TokenBucket(ratelimit.RateLimit(calls=50, period=1))
+    start = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_rate_limiter_returns_no_bucket_without_rate_limit():
+    assert ratelimit.RateLimiter().bucket("/api/Test", None) is None
+
+
+def test_rate_limiter_acquire_without_rate_limit():
+    assert ratelimit.RateLimiter().acquire("/api/Test", None) == 0.0
+
+
+def test_rate_limiter_shares_bucket_per_key():
+    rate_limiter = ratelimit.RateLimiter()
+    rate_limit = ratelimit.RateLimit(calls=150)
+    bucket = rate_limiter.bucket("/api/Test", rate_limit)
+    assert rate_limiter.bucket("/api/Test", rate_limit) is bucket
+    assert rate_limiter.bucket("/api/Other", rate_limit) is not bucket
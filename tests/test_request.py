@@ -1,8 +1,15 @@
+import contextvars
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
-from linnapi import request
+from linnapi import exceptions, ratelimit, request, retry
+from linnapi.cache import ResponseCache
+from linnapi.singleflight import SingleFlight
 
 
 @pytest.fixture
@@ -23,10 +30,19 @@ def mock_response(mock_response_value):
 
 
 @pytest.fixture
-def mock_linnworks_session(mock_response, request_headers):
-    with patch("linnapi.request.LinnworksAPISession") as mock_linnworks_session:
+def server():
+    return "https://us-ext.linnworks.net"
+
+
+@pytest.fixture
+def mock_linnworks_session(mock_response, request_headers, server):
+    with patch("linnapi.request.LinnworksAPISession") as mock_session_class:
+        mock_linnworks_session = mock_session_class.current.return_value
         mock_linnworks_session.session.request.return_value = mock_response
         mock_linnworks_session.request_headers.return_value = request_headers
+        mock_linnworks_session.server_url.return_value = server
+        mock_linnworks_session.deduplicate_requests = False
+        mock_linnworks_session.response_cache = None
         yield mock_linnworks_session
 
 
@@ -110,16 +126,33 @@ class TestLinnworksAPIRequest(request.LinnworksAPIRequest):
         return json_values
 
 
+class TestLinnworksAPIRequestWithPath(request.LinnworksAPIRequest):
+    PATH = "/api/Test/Path"
+
+
+def test_make_request_uses_session_server(mock_linnworks_session, server):
+    request.make_request(TestLinnworksAPIRequestWithPath)
+    _, kwargs = mock_linnworks_session.session.request.call_args
+    assert kwargs["url"] == f"{server}/api/Test/Path"
+
+
 def test_make_request_returns_request_json(mock_linnworks_session, mock_response_value):
     assert request.make_request(request.LinnworksAPIRequest) == mock_response_value
 
 
+def test_linnworks_api_request_url_method():
+    assert (
+        TestLinnworksAPIRequestWithPath.url("https://us-ext.linnworks.net/")
+        == "https://us-ext.linnworks.net/api/Test/Path"
+    )
+
+
 def test_make_request_makes_request(
-    mock_linnworks_session, request_headers, mock_response_value
+    mock_linnworks_session, request_headers, mock_response_value, server
 ):
     request.make_request(request.LinnworksAPIRequest)
     mock_linnworks_session.session.request.assert_called_once_with(
-        url=request.LinnworksAPIRequest.URL,
+        url=request.LinnworksAPIRequest.url(server),
         method=request.LinnworksAPIRequest.METHOD,
         headers=request_headers,
         params=None,
@@ -164,6 +197,8 @@ def test_linnworks_api_request_subclass_multi_json_method():
 def mocked_request(mock_linnworks_session):
     request_class = Mock()
     request_class.headers.return_value = {}
+    request_class.READ_ONLY = False
+    request_class.RETRY_POLICY = retry.RetryPolicy()
     request.make_request(request_class, 1, 2, test_param=3)
     return request_class
 
@@ -290,14 +325,529 @@ def test_multi_item_request_request_method_returns_request_json(
 
 
 def test_multi_item_request_request_method_makes_request(
-    mock_linnworks_session, request_headers, multi_item_requester_with_request
+    mock_linnworks_session, request_headers, multi_item_requester_with_request, server
 ):
     multi_item_requester_with_request.request()
     mock_linnworks_session.session.request.assert_called_once_with(
-        url=request.LinnworksAPIRequest.URL,
+        url=request.LinnworksAPIRequest.url(server),
         method=request.LinnworksAPIRequest.METHOD,
         headers=request_headers | multi_headers_values,
         params=multi_params_values,
         data=multi_data_values,
         json=multi_json_values,
     )
+
+
+def test_linnworks_api_request_is_not_read_only():
+    assert request.LinnworksAPIRequest.READ_ONLY is False
+
+
+def test_linnworks_api_request_has_no_rate_limit():
+    assert request.LinnworksAPIRequest.RATE_LIMIT is None
+
+
+def test_linnworks_api_request_retry_policy():
+    assert isinstance(request.LinnworksAPIRequest.RETRY_POLICY, retry.RetryPolicy)
+
+
+class ReadOnlyRequest(request.LinnworksAPIRequest):
+    READ_ONLY = True
+    RETRY_POLICY = retry.RetryPolicy(max_attempts=3, jitter=False)
+
+
+class WriteRequest(request.LinnworksAPIRequest):
+    RETRY_POLICY = retry.RetryPolicy(max_attempts=3, jitter=False)
+
+
+class RetriedWriteRequest(request.LinnworksAPIRequest):
+    RETRY_POLICY = retry.RetryPolicy(max_attempts=3, jitter=False, retry_writes=True)
+
+
+def response_with_status(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def api_session():
+    api_session = Mock()
+    api_session.retry_stats = retry.RetryStats()
+    api_session.rate_limiter = ratelimit.RateLimiter()
+    return api_session
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("linnapi.request.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def test_send_request_returns_successful_response(api_session, mock_sleep):
+    response = response_with_status(200)
+    api_session.session.request.return_value = response
+    assert request.send_request(api_session, ReadOnlyRequest, url="url") is response
+    api_session.session.request.assert_called_once_with(url="url")
+    mock_sleep.assert_not_called()
+
+
+def test_send_request_retries_read_only_requests(api_session, mock_sleep):
+    response = response_with_status(200)
+    api_session.session.request.side_effect = [
+        response_with_status(503),
+        response_with_status(429),
+        response,
+    ]
+    assert request.send_request(api_session, ReadOnlyRequest) is response
+    assert api_session.session.request.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_send_request_returns_last_response_when_attempts_are_exhausted(
+    api_session, mock_sleep
+):
+    responses = [response_with_status(503) for _ in range(3)]
+    api_session.session.request.side_effect = responses
+    assert request.send_request(api_session, ReadOnlyRequest) is responses[-1]
+    assert api_session.session.request.call_count == 3
+
+
+def test_send_request_does_not_retry_write_requests(api_session, mock_sleep):
+    response = response_with_status(503)
+    api_session.session.request.return_value = response
+    assert request.send_request(api_session, WriteRequest) is response
+    api_session.session.request.assert_called_once()
+
+
+def test_send_request_retries_write_requests_when_enabled(api_session, mock_sleep):
+    response = response_with_status(200)
+    api_session.session.request.side_effect = [response_with_status(503), response]
+    assert request.send_request(api_session, RetriedWriteRequest) is response
+    assert api_session.session.request.call_count == 2
+
+
+def test_send_request_does_not_retry_client_errors(api_session, mock_sleep):
+    response = response_with_status(400)
+    api_session.session.request.return_value = response
+    assert request.send_request(api_session, ReadOnlyRequest) is response
+    api_session.session.request.assert_called_once()
+
+
+def test_send_request_retries_connection_errors(api_session, mock_sleep):
+    response = response_with_status(200)
+    api_session.session.request.side_effect = [requests.ConnectionError(), response]
+    assert request.send_request(api_session, ReadOnlyRequest) is response
+
+
+def test_send_request_raises_connection_errors_when_attempts_are_exhausted(
+    api_session, mock_sleep
+):
+    api_session.session.request.side_effect = requests.ConnectionError()
+    with pytest.raises(requests.ConnectionError):
+        request.send_request(api_session, ReadOnlyRequest)
+    assert api_session.session.request.call_count == 3
+
+
+def test_send_request_honours_retry_after(api_session, mock_sleep):
+    api_session.session.request.side_effect = [
+        response_with_status(429, {"Retry-After": "7"}),
+        response_with_status(200),
+    ]
+    request.send_request(api_session, ReadOnlyRequest)
+    mock_sleep.assert_called_once_with(7.0)
+
+
+def test_send_request_does_not_retry_when_retry_after_exceeds_max_backoff(
+    api_session, mock_sleep
+):
+    response = response_with_status(429, {"Retry-After": "3600"})
+    api_session.session.request.return_value = response
+    assert request.send_request(api_session, ReadOnlyRequest) is response
+    api_session.session.request.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_send_request_records_retry_stats(api_session, mock_sleep):
+    api_session.session.request.side_effect = [
+        response_with_status(503),
+        response_with_status(503),
+        response_with_status(200),
+    ]
+    request.send_request(api_session, ReadOnlyRequest)
+    assert api_session.retry_stats.as_dict() == {
+        "attempts": 3,
+        "retries": 2,
+        "backoff_seconds": 1.5,
+    }
+
+
+class RateLimitedRequest(request.LinnworksAPIRequest):
+    PATH = "/api/Test/RateLimited"
+    RATE_LIMIT = ratelimit.RateLimit(calls=60, period=60)
+
+
+def test_send_request_waits_for_rate_limit(api_session):
+    api_session.session.request.return_value = response_with_status(200)
+    with patch("linnapi.ratelimit.time.sleep") as mock_sleep:
+        request.send_request(api_session, RateLimitedRequest)
+        request.send_request(api_session, RateLimitedRequest)
+    mock_sleep.assert_called_once()
+    assert 0.9 < mock_sleep.call_args.args[0] <= 1.0
+
+
+def test_linnworks_api_request_has_no_max_items_per_request():
+    assert request.LinnworksAPIRequest.MAX_ITEMS_PER_REQUEST is None
+
+
+def test_multi_merge_responses_returns_single_response():
+    response = {"key": "value"}
+    assert request.LinnworksAPIRequest.multi_merge_responses([response]) is response
+
+
+def test_multi_merge_responses_concatenates_lists():
+    merged = request.LinnworksAPIRequest.multi_merge_responses([[1, 2], [3], [4]])
+    assert merged == [1, 2, 3, 4]
+
+
+def test_multi_merge_responses_lists_other_responses():
+    merged = request.LinnworksAPIRequest.multi_merge_responses(["a", "b"])
+    assert merged == ["a", "b"]
+
+
+def test_request_executor_runs_in_callers_context():
+    context_var = contextvars.ContextVar("test_context_var", default=None)
+    context_var.set("caller")
+    with request.RequestExecutor(max_workers=2) as executor:
+        assert executor.submit(context_var.get).result() == "caller"
+
+
+def test_chunk_result_succeeded():
+    assert request.ChunkResult([{}], response=[]).succeeded is True
+
+
+def test_chunk_result_failed():
+    assert request.ChunkResult([{}], error=ValueError()).succeeded is False
+
+
+class ChunkedRequest(request.LinnworksAPIRequest):
+    MAX_ITEMS_PER_REQUEST = 2
+
+    @classmethod
+    def multi_json(cls, requests):
+        return [request["key"] for request in requests]
+
+    @classmethod
+    def multi_parse_response(cls, response, requests):
+        return response.json()
+
+
+class ChunkedRequester(request.MultiItemRequest):
+    request_method = ChunkedRequest
+
+    def add_request(self, key):
+        self._add_request({"key": key})
+
+
+def echo_json_response(**kwargs):
+    if "fail" in kwargs["json"]:
+        raise ValueError("Chunk failed")
+    response = Mock()
+    response.json.return_value = list(kwargs["json"])
+    if "error_status" in kwargs["json"]:
+        response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+    return response
+
+
+@pytest.fixture
+def chunked_requester(mock_linnworks_session):
+    mock_linnworks_session.session.request.side_effect = echo_json_response
+    requester = ChunkedRequester(max_workers=2)
+    for key in ("a", "b", "c", "d", "e"):
+        requester.add_request(key)
+    return requester
+
+
+def test_multi_item_request_default_max_workers():
+    assert (
+        request.MultiItemRequest().max_workers
+        == request.MultiItemRequest.DEFAULT_MAX_WORKERS
+    )
+
+
+def test_multi_item_request_chunks(chunked_requester):
+    assert chunked_requester.chunks() == [
+        [{"key": "a"}, {"key": "b"}],
+        [{"key": "c"}, {"key": "d"}],
+        [{"key": "e"}],
+    ]
+
+
+def test_multi_item_request_chunks_without_limit(multi_item_requester_with_request):
+    assert multi_item_requester_with_request.chunks() == [
+        multi_item_requester_with_request.requests
+    ]
+
+
+def test_multi_item_request_sends_chunks(mock_linnworks_session, chunked_requester):
+    chunked_requester.request()
+    sent = [
+        kwargs["json"]
+        for _, kwargs in mock_linnworks_session.session.request.call_args_list
+    ]
+    assert sorted(sent) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_multi_item_request_merges_chunk_responses(chunked_requester):
+    assert chunked_requester.request() == ["a", "b", "c", "d", "e"]
+
+
+def test_multi_item_request_records_chunk_results(chunked_requester):
+    chunked_requester.request()
+    assert len(chunked_requester.chunk_results) == 3
+    assert all(result.succeeded for result in chunked_requester.chunk_results)
+    assert chunked_requester.failed_requests == []
+
+
+def test_multi_item_request_reports_failed_chunks(chunked_requester):
+    chunked_requester.add_request("fail")
+    with pytest.raises(exceptions.PartialRequestError) as exc_info:
+        chunked_requester.request()
+    assert exc_info.value.result == ["a", "b", "c", "d"]
+    assert len(exc_info.value.failed_chunks) == 1
+    assert chunked_requester.failed_requests == [{"key": "e"}, {"key": "fail"}]
+
+
+def test_partial_request_error_can_be_pickled():
+    error = exceptions.PartialRequestError(
+        result=["a"], failed_chunks=[request.ChunkResult([{"key": "b"}])]
+    )
+    unpickled = pickle.loads(pickle.dumps(error))
+    assert unpickled.result == ["a"]
+    assert unpickled.failed_chunks[0].requests == [{"key": "b"}]
+    assert str(unpickled) == "1 request chunk(s) failed."
+
+
+def test_multi_item_request_reports_chunks_with_error_status(chunked_requester):
+    chunked_requester.add_request("error_status")
+    with pytest.raises(exceptions.PartialRequestError) as exc_info:
+        chunked_requester.request()
+    assert exc_info.value.result == ["a", "b", "c", "d"]
+    assert isinstance(exc_info.value.failed_chunks[0].error, requests.HTTPError)
+    assert chunked_requester.failed_requests == [{"key": "e"}, {"key": "error_status"}]
+
+
+def test_multi_item_request_raises_error_status_from_single_chunk(
+    mock_linnworks_session,
+):
+    mock_linnworks_session.session.request.side_effect = echo_json_response
+    requester = ChunkedRequester()
+    requester.add_request("error_status")
+    with pytest.raises(requests.HTTPError):
+        requester.request()
+    assert requester.failed_requests == [{"key": "error_status"}]
+
+
+def test_multi_item_request_raises_error_from_single_chunk(mock_linnworks_session):
+    mock_linnworks_session.session.request.side_effect = echo_json_response
+    requester = ChunkedRequester()
+    requester.add_request("fail")
+    with pytest.raises(ValueError):
+        requester.request()
+    assert requester.failed_requests == [{"key": "fail"}]
+
+
+@pytest.mark.parametrize(
+    "items,size,expected",
+    [
+        ([1, 2, 3], None, [[1, 2, 3]]),
+        ([1, 2, 3], 3, [[1, 2, 3]]),
+        ([1, 2, 3], 2, [[1, 2], [3]]),
+        ((1, 2, 3, 4), 2, [[1, 2], [3, 4]]),
+        ([], 2, [[]]),
+    ],
+)
+def test_chunked(items, size, expected):
+    assert request.chunked(items, size) == expected
+
+
+class DeduplicatedRequest(request.LinnworksAPIRequest):
+    READ_ONLY = True
+
+    @classmethod
+    def params(cls, *args, **kwargs):
+        return {"key": kwargs["key"]}
+
+
+class DeduplicatedWriteRequest(DeduplicatedRequest):
+    READ_ONLY = False
+
+
+@pytest.fixture
+def deduplicating_session(mock_linnworks_session):
+    mock_linnworks_session.deduplicate_requests = True
+    mock_linnworks_session.in_flight_requests = SingleFlight()
+    mock_linnworks_session.retry_stats = retry.RetryStats()
+    mock_linnworks_session.rate_limiter = ratelimit.RateLimiter()
+    return mock_linnworks_session
+
+
+def make_concurrent_requests(api_session, request_method, keys, shared=0):
+    release = threading.Event()
+    sent = threading.Semaphore(0)
+
+    def send(**kwargs):
+        sent.release()
+        release.wait(timeout=5)
+        response = Mock()
+        response.json.side_effect = lambda: {"key": kwargs["params"]["key"]}
+        return response
+
+    api_session.session.request.side_effect = send
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        futures = [
+            pool.submit(request.make_request, request_method, key=key) for key in keys
+        ]
+        sent.acquire(timeout=5)
+        while api_session.in_flight_requests.shared < shared:
+            threading.Event().wait(0.001)
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_make_request_deduplicates_identical_read_only_requests(
+    deduplicating_session,
+):
+    responses = make_concurrent_requests(
+        deduplicating_session, DeduplicatedRequest, ["a", "a", "a"], shared=2
+    )
+    assert responses == [{"key": "a"}] * 3
+    assert deduplicating_session.session.request.call_count == 1
+    assert responses[0] is not responses[1]
+
+
+def test_make_request_does_not_deduplicate_different_requests(
+    deduplicating_session,
+):
+    responses = make_concurrent_requests(
+        deduplicating_session, DeduplicatedRequest, ["a", "b"]
+    )
+    assert responses == [{"key": "a"}, {"key": "b"}]
+    assert deduplicating_session.session.request.call_count == 2
+
+
+def test_make_request_does_not_deduplicate_write_requests(deduplicating_session):
+    make_concurrent_requests(
+        deduplicating_session, DeduplicatedWriteRequest, ["a", "a"]
+    )
+    assert deduplicating_session.session.request.call_count == 2
+
+
+def test_make_request_does_not_deduplicate_by_default(mock_linnworks_session):
+    mock_linnworks_session.in_flight_requests = Mock()
+    request.make_request(DeduplicatedRequest, key="a")
+    mock_linnworks_session.in_flight_requests.do.assert_not_called()
+
+
+def test_request_key_matches_identical_requests():
+    assert request.request_key(
+        DeduplicatedRequest, url="url", params={"a": 1, "b": 2}
+    ) == request.request_key(DeduplicatedRequest, url="url", params={"b": 2, "a": 1})
+
+
+def test_request_key_differs_by_request_method():
+    assert request.request_key(DeduplicatedRequest, url="url") != request.request_key(
+        DeduplicatedWriteRequest, url="url"
+    )
+
+
+class CachedRequest(request.LinnworksAPIRequest):
+    READ_ONLY = True
+    CACHE_TTL = 60
+
+    @classmethod
+    def params(cls, *args, **kwargs):
+        return {"key": kwargs["key"]}
+
+    @classmethod
+    def cache_tags(cls, *args, **kwargs):
+        return [f"tag:{kwargs['key']}"]
+
+
+class InvalidatingRequest(request.LinnworksAPIRequest):
+    @classmethod
+    def invalidates(cls, *args, **kwargs):
+        return [f"tag:{kwargs['key']}"]
+
+
+class InvalidatingMultiItemRequest(request.MultiItemRequest):
+    request_method = InvalidatingRequest
+
+    def add_request(self, key):
+        self._add_request({"key": key})
+
+
+@pytest.fixture
+def caching_session(mock_linnworks_session, mock_response):
+    mock_response.ok = True
+    mock_linnworks_session.response_cache = ResponseCache()
+    mock_linnworks_session.retry_stats = retry.RetryStats()
+    mock_linnworks_session.rate_limiter = ratelimit.RateLimiter()
+    return mock_linnworks_session
+
+
+def test_make_request_caches_cacheable_responses(caching_session, mock_response_value):
+    for _ in range(3):
+        assert request.make_request(CachedRequest, key="a") == mock_response_value
+    assert caching_session.session.request.call_count == 1
+
+
+def test_make_request_caches_responses_by_request(caching_session):
+    request.make_request(CachedRequest, key="a")
+    request.make_request(CachedRequest, key="b")
+    assert caching_session.session.request.call_count == 2
+
+
+def test_make_request_does_not_cache_unsuccessful_responses(
+    caching_session, mock_response
+):
+    mock_response.ok = False
+    request.make_request(CachedRequest, key="a")
+    request.make_request(CachedRequest, key="a")
+    assert caching_session.session.request.call_count == 2
+
+
+def test_make_request_does_not_cache_requests_without_ttl(caching_session):
+    request.make_request(DeduplicatedRequest, key="a")
+    request.make_request(DeduplicatedRequest, key="a")
+    assert caching_session.session.request.call_count == 2
+
+
+def test_make_request_invalidates_cached_responses(caching_session):
+    request.make_request(CachedRequest, key="a")
+    request.make_request(CachedRequest, key="b")
+    request.make_request(InvalidatingRequest, key="a")
+    request.make_request(CachedRequest, key="a")
+    request.make_request(CachedRequest, key="b")
+    assert caching_session.session.request.call_count == 4
+
+
+def test_multi_item_request_invalidates_cached_responses(caching_session):
+    request.make_request(CachedRequest, key="a")
+    requester = InvalidatingMultiItemRequest()
+    requester.add_request("a")
+    requester.request()
+    request.make_request(CachedRequest, key="a")
+    assert caching_session.session.request.call_count == 3
+
+
+def test_request_default_cache_settings():
+    assert request.LinnworksAPIRequest.CACHE_TTL is None
+    assert request.LinnworksAPIRequest.cache_tags() == ["LinnworksAPIRequest"]
+    assert request.LinnworksAPIRequest.invalidates() == []
+
+
+def test_request_multi_invalidates():
+    assert InvalidatingRequest.multi_invalidates(
+        [{"key": "a"}, {"key": "b"}, {"key": "a"}]
+    ) == ["tag:a", "tag:b"]
@@ -20,15 +20,19 @@ def image_url():
     return "http://test.com/image.jpg"
 
 
-def test_add_image_to_inventory_item_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/AddImageToInventoryItem"
-    assert inventory.AddImageToInventoryItem.URL == url
+def test_add_image_to_inventory_item_path():
+    path = "/api/Inventory/AddImageToInventoryItem"
+    assert inventory.AddImageToInventoryItem.PATH == path
 
 
 def test_add_image_to_inventory_item_method():
     assert inventory.AddImageToInventoryItem.METHOD == "POST"
 
 
+def test_add_image_to_inventory_item_read_only():
+    assert inventory.AddImageToInventoryItem.READ_ONLY is False
+
+
 def test_add_image_to_inventory_item_headers(item_number, image_url):
     assert (
         inventory.AddImageToInventoryItem.headers(
@@ -121,3 +125,19 @@ def test_add_image_to_inventory_item_parse_response(item_number, image_url):
         )
         == response.json.return_value
     )
+
+
+def test_add_image_to_inventory_item_invalidates_stock_item_images(
+    stock_item_id, image_url
+):
+    assert inventory.AddImageToInventoryItem.invalidates(
+        stock_item_id=stock_item_id, image_url=image_url, is_main=True
+    ) == [f"images:{stock_item_id}"]
+
+
+def test_add_image_to_inventory_item_by_sku_invalidates_all_images(
+    item_number, image_url
+):
+    assert inventory.AddImageToInventoryItem.invalidates(
+        item_number=item_number, image_url=image_url, is_main=True
+    ) == ["images"]
@@ -13,15 +13,19 @@ def stock_item_ids():
     ]
 
 
-def test_get_stock_item_ids_by_sku_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/BatchGetInventoryItemChannelSKUs"
-    assert inventory.BatchGetInventoryItemChannelSKUs.URL == url
+def test_get_stock_item_ids_by_sku_path():
+    path = "/api/Inventory/BatchGetInventoryItemChannelSKUs"
+    assert inventory.BatchGetInventoryItemChannelSKUs.PATH == path
 
 
 def test_get_stock_item_ids_by_sku_method():
     assert inventory.BatchGetInventoryItemChannelSKUs.METHOD == "POST"
 
 
+def test_get_stock_item_ids_by_sku_read_only():
+    assert inventory.BatchGetInventoryItemChannelSKUs.READ_ONLY is True
+
+
 def test_get_stock_item_ids_by_sku_headers(stock_item_ids):
     assert (
         inventory.BatchGetInventoryItemChannelSKUs.headers(
@@ -62,3 +66,13 @@ def test_get_stock_item_ids_by_sku_parse_response(stock_item_ids):
         )
         == response.json.return_value
     )
+
+
+def test_batch_get_inventory_item_channel_skus_cache_ttl():
+    assert inventory.BatchGetInventoryItemChannelSKUs.CACHE_TTL == 300
+
+
+def test_batch_get_inventory_item_channel_skus_cache_tags(stock_item_ids):
+    assert inventory.BatchGetInventoryItemChannelSKUs.cache_tags(
+        stock_item_ids=stock_item_ids
+    ) == ["channel_skus"]
@@ -20,15 +20,23 @@ def kwargs(image_url, stock_item_id):
     return {"image_url": image_url, "stock_item_id": stock_item_id}
 
 
-def test_delete_images_from_inventory_item_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/DeleteImagesFromInventoryItem"
-    assert inventory.DeleteImagesFromInventoryItem.URL == url
+def test_delete_images_from_inventory_item_path():
+    path = "/api/Inventory/DeleteImagesFromInventoryItem"
+    assert inventory.DeleteImagesFromInventoryItem.PATH == path
 
 
 def test_delete_images_from_inventory_item_method():
     assert inventory.DeleteImagesFromInventoryItem.METHOD == "POST"
 
 
+def test_delete_images_from_inventory_item_read_only():
+    assert inventory.DeleteImagesFromInventoryItem.READ_ONLY is False
+
+
+def test_delete_images_from_inventory_item_max_items_per_request():
+    assert inventory.DeleteImagesFromInventoryItem.MAX_ITEMS_PER_REQUEST == 100
+
+
 def test_delete_images_from_inventory_item_multi_headers(kwargs):
     assert inventory.DeleteImagesFromInventoryItem.headers([kwargs]) == {}
 
@@ -90,3 +98,14 @@ def test_delete_images_from_inventory_item_multi_parse_response(kwargs):
         inventory.DeleteImagesFromInventoryItem.parse_response(response, [kwargs])
         == response.text
     )
+
+
+def test_delete_images_from_inventory_item_invalidates(kwargs, stock_item_id):
+    assert inventory.DeleteImagesFromInventoryItem.invalidates(**kwargs) == [
+        f"images:{stock_item_id}"
+    ]
+
+
+def test_delete_images_from_inventory_item_multi_merge_responses():
+    merged = inventory.DeleteImagesFromInventoryItem.multi_merge_responses(["a", "b"])
+    assert merged == "ab"
@@ -15,15 +15,19 @@ def kwargs(channel_item_id):
     return {"inventory_item_channel_sku_ids": [channel_item_id]}
 
 
-def test_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/DeleteInventoryItemChannelSKUs"
-    assert inventory.DeleteInventoryItemChannelSKUs.URL == url
+def test_path():
+    path = "/api/Inventory/DeleteInventoryItemChannelSKUs"
+    assert inventory.DeleteInventoryItemChannelSKUs.PATH == path
 
 
 def test_method():
     assert inventory.DeleteInventoryItemChannelSKUs.METHOD == "POST"
 
 
+def test_read_only():
+    assert inventory.DeleteInventoryItemChannelSKUs.READ_ONLY is False
+
+
 def test_headers(kwargs):
     assert inventory.DeleteInventoryItemChannelSKUs.headers(kwargs) == {}
 
@@ -68,3 +72,9 @@ def test_json_with_single_multiple_args():
 def test_parse_response(status_code, expected):
     response = Mock(status_code=status_code)
     assert inventory.DeleteInventoryItemChannelSKUs.parse_response(response) is expected
+
+
+def test_invalidates(kwargs):
+    assert inventory.DeleteInventoryItemChannelSKUs.invalidates(**kwargs) == [
+        "channel_skus"
+    ]
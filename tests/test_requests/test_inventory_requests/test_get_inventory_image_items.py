@@ -10,15 +10,19 @@ def inventory_item_id():
     return "972af264-d768-4c6c-9152-0ad9d9d5b352"
 
 
-def test_get_inventory_item_images_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/GetInventoryItemImages"
-    assert inventory.GetInventoryItemImages.URL == url
+def test_get_inventory_item_images_path():
+    path = "/api/Inventory/GetInventoryItemImages"
+    assert inventory.GetInventoryItemImages.PATH == path
 
 
 def test_get_inventory_item_images_method():
     assert inventory.GetInventoryItemImages.METHOD == "POST"
 
 
+def test_get_inventory_item_images_read_only():
+    assert inventory.GetInventoryItemImages.READ_ONLY is True
+
+
 def test_get_inventory_item_images_headers(inventory_item_id):
     assert (
         inventory.GetInventoryItemImages.headers(inventory_item_id=inventory_item_id)
@@ -57,3 +61,13 @@ def test_get_inventory_item_images_parse_response(inventory_item_id):
         )
         == response.json.return_value
     )
+
+
+def test_get_inventory_item_images_cache_ttl():
+    assert inventory.GetInventoryItemImages.CACHE_TTL == 300
+
+
+def test_get_inventory_item_images_cache_tags(inventory_item_id):
+    assert inventory.GetInventoryItemImages.cache_tags(
+        inventory_item_id=inventory_item_id
+    ) == ["images", f"images:{inventory_item_id}"]
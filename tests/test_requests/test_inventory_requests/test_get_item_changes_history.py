@@ -15,15 +15,23 @@ def location_id():
     return "00000000-0000-0000-0000-000000000000"
 
 
-def test_get_item_changes_history_url():
-    url = "https://eu-ext.linnworks.net/api/Stock/GetItemChangesHistory"
-    assert inventory.GetItemChangesHistory.URL == url
+def test_get_item_changes_history_path():
+    path = "/api/Stock/GetItemChangesHistory"
+    assert inventory.GetItemChangesHistory.PATH == path
 
 
 def test_get_item_changes_history_method():
     assert inventory.GetItemChangesHistory.METHOD == "POST"
 
 
+def test_get_item_changes_history_read_only():
+    assert inventory.GetItemChangesHistory.READ_ONLY is True
+
+
+def test_get_item_changes_history_rate_limit():
+    assert inventory.GetItemChangesHistory.RATE_LIMIT is inventory.STOCK_RATE_LIMIT
+
+
 def test_get_item_changes_history_headers(stock_item_id, location_id):
     assert (
         inventory.GetItemChangesHistory.headers(
@@ -111,3 +119,13 @@ def test_get_item_changes_history_parse_response(stock_item_id, location_id):
         )
         == response.json.return_value
     )
+
+
+def test_get_item_changes_history_cache_ttl():
+    assert inventory.GetItemChangesHistory.CACHE_TTL == 60
+
+
+def test_get_item_changes_history_cache_tags(stock_item_id, location_id):
+    assert inventory.GetItemChangesHistory.cache_tags(
+        stock_item_id=stock_item_id, location_id=location_id
+    ) == ["stock_history"]
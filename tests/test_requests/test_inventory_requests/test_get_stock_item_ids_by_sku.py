@@ -10,15 +10,23 @@ def skus():
     return ["aaa", "bbb"]
 
 
-def test_get_stock_item_ids_by_sku_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/GetStockItemIdsBySKU"
-    assert inventory.GetStockItemIDsBySKU.URL == url
+def test_get_stock_item_ids_by_sku_path():
+    path = "/api/Inventory/GetStockItemIdsBySKU"
+    assert inventory.GetStockItemIDsBySKU.PATH == path
 
 
 def test_get_stock_item_ids_by_sku_method():
     assert inventory.GetStockItemIDsBySKU.METHOD == "POST"
 
 
+def test_get_stock_item_ids_by_sku_read_only():
+    assert inventory.GetStockItemIDsBySKU.READ_ONLY is True
+
+
+def test_get_stock_item_ids_by_sku_max_items_per_request():
+    assert inventory.GetStockItemIDsBySKU.MAX_ITEMS_PER_REQUEST == 200
+
+
 def test_get_stock_item_ids_by_sku_headers(skus):
     assert inventory.GetStockItemIDsBySKU.headers(skus=skus) == {}
 
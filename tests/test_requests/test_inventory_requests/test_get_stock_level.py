@@ -10,15 +10,23 @@ def stock_item_id():
     return "1649861651"
 
 
-def test_get_stock_level_url():
-    url = "https://eu-ext.linnworks.net/api/Stock/GetStockLevel"
-    assert inventory.GetStockLevel.URL == url
+def test_get_stock_level_path():
+    path = "/api/Stock/GetStockLevel"
+    assert inventory.GetStockLevel.PATH == path
 
 
 def test_get_stock_level_method():
     assert inventory.GetStockLevel.METHOD == "POST"
 
 
+def test_get_stock_level_read_only():
+    assert inventory.GetStockLevel.READ_ONLY is True
+
+
+def test_get_stock_level_rate_limit():
+    assert inventory.GetStockLevel.RATE_LIMIT is inventory.STOCK_RATE_LIMIT
+
+
 def test_get_stock_level_headers(stock_item_id):
     assert inventory.GetStockLevel.headers(stock_item_id=stock_item_id) == {}
 
@@ -10,15 +10,27 @@ def stock_item_ids():
     return ["aaa", "bbb"]
 
 
-def test_get_stock_level_batch_url():
-    url = "https://eu-ext.linnworks.net/api/Stock/GetStockLevel_Batch"
-    assert inventory.GetStockLevelBatch.URL == url
+def test_get_stock_level_batch_path():
+    path = "/api/Stock/GetStockLevel_Batch"
+    assert inventory.GetStockLevelBatch.PATH == path
 
 
 def test_get_stock_level_batch_method():
     assert inventory.GetStockLevelBatch.METHOD == "POST"
 
 
+def test_get_stock_level_batch_read_only():
+    assert inventory.GetStockLevelBatch.READ_ONLY is True
+
+
+def test_get_stock_level_batch_max_items_per_request():
+    assert inventory.GetStockLevelBatch.MAX_ITEMS_PER_REQUEST == 200
+
+
+def test_get_stock_level_batch_rate_limit():
+    assert inventory.GetStockLevelBatch.RATE_LIMIT is inventory.STOCK_RATE_LIMIT
+
+
 def test_get_stock_level_batch_headers(stock_item_ids):
     assert inventory.GetStockLevelBatch.headers(stock_item_ids=stock_item_ids) == {}
 
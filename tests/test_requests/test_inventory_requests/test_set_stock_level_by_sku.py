@@ -20,15 +20,23 @@ def changes():
     return [("aaa", 5), ("bbb", -3)]
 
 
-def test_set_stock_level_by_sku_url():
-    url = "https://eu-ext.linnworks.net/api/Stock/UpdateStockLevelsBySKU"
-    assert inventory.SetStockLevelBySKU.URL == url
+def test_set_stock_level_by_sku_path():
+    path = "/api/Stock/UpdateStockLevelsBySKU"
+    assert inventory.SetStockLevelBySKU.PATH == path
 
 
 def test_set_stock_level_by_sku_method():
     assert inventory.SetStockLevelBySKU.METHOD == "POST"
 
 
+def test_set_stock_level_by_sku_read_only():
+    assert inventory.SetStockLevelBySKU.READ_ONLY is False
+
+
+def test_set_stock_level_by_sku_rate_limit():
+    assert inventory.SetStockLevelBySKU.RATE_LIMIT is inventory.STOCK_RATE_LIMIT
+
+
 def test_set_stock_level_by_sku_headers(location_id, changes, change_source):
     assert (
         inventory.SetStockLevelBySKU.headers(
@@ -80,3 +88,56 @@ def test_set_stock_level_by_sku_parse_response(location_id, changes, change_sour
         )
         == response.json.return_value
     )
+
+
+@pytest.fixture
+def multi_requests(location_id, change_source, changes):
+    return [
+        {
+            "sku": sku,
+            "level": level,
+            "location_id": location_id,
+            "change_source": change_source,
+        }
+        for sku, level in changes
+    ]
+
+
+def test_set_stock_level_by_sku_max_items_per_request():
+    assert inventory.SetStockLevelBySKU.MAX_ITEMS_PER_REQUEST == 200
+
+
+def test_set_stock_level_by_sku_multi_params(multi_requests, change_source):
+    assert inventory.SetStockLevelBySKU.multi_params(multi_requests) == {
+        "changeSource": change_source
+    }
+
+
+def test_set_stock_level_by_sku_multi_json(multi_requests, changes, location_id):
+    expected_response = {
+        "stockLevels": [
+            {"SKU": sku, "LocationID": location_id, "Level": level}
+            for sku, level in changes
+        ]
+    }
+    assert inventory.SetStockLevelBySKU.multi_json(multi_requests) == expected_response
+
+
+def test_set_stock_level_by_sku_multi_parse_response(multi_requests):
+    response = Mock()
+    response.json.return_value = [{"key": "value"}]
+    parsed = inventory.SetStockLevelBySKU.multi_parse_response(response, multi_requests)
+    assert parsed == response.json.return_value
+    response.raise_for_status.assert_called_once_with()
+
+
+def test_set_stock_level_by_sku_invalidates(location_id, change_source, changes):
+    assert inventory.SetStockLevelBySKU.invalidates(
+        location_id=location_id, change_source=change_source, changes=changes
+    ) == ["stock_history"]
+
+
+def test_set_stock_level_by_sku_multi_invalidates(multi_requests):
+    assert inventory.SetStockLevelBySKU.multi_invalidates(multi_requests) == [
+        "stock_history"
+    ]
@@ -30,15 +30,23 @@ def kwargs(image_id, stock_item_id, sort_order):
     }
 
 
-def test_update_images_url():
-    url = "https://eu-ext.linnworks.net/api/Inventory/UpdateImages"
-    assert inventory.UpdateImages.URL == url
+def test_update_images_path():
+    path = "/api/Inventory/UpdateImages"
+    assert inventory.UpdateImages.PATH == path
 
 
 def test_update_images_method():
     assert inventory.UpdateImages.METHOD == "POST"
 
 
+def test_update_images_read_only():
+    assert inventory.UpdateImages.READ_ONLY is False
+
+
+def test_update_images_max_items_per_request():
+    assert inventory.UpdateImages.MAX_ITEMS_PER_REQUEST == 100
+
+
 def test_update_images_multi_headers(kwargs):
     assert inventory.UpdateImages.headers([kwargs]) == {}
 
@@ -99,3 +107,11 @@ def test_update_images_multi_parse_response(kwargs):
     response = Mock()
     response.text = "Test Text"
     assert inventory.UpdateImages.parse_response(response, [kwargs]) == response.text
+
+
+def test_update_images_invalidates(kwargs, stock_item_id):
+    assert inventory.UpdateImages.invalidates(**kwargs) == [f"images:{stock_item_id}"]
+
+
+def test_update_images_multi_merge_responses():
+    assert inventory.UpdateImages.multi_merge_responses(["a", "", "b"]) == "ab"
@@ -10,15 +10,19 @@ def order_id():
     return "73846ae8-9f64-42ef-8d76-31aa418da9d5"
 
 
-def test_get_processed_audit_trail_url():
-    url = "https://eu-ext.linnworks.net/api/Orders/GetOrderDetailsByNumOrderId"
-    assert orders.GetOrderDetailsByNumOrderId.URL == url
+def test_get_processed_audit_trail_path():
+    path = "/api/Orders/GetOrderDetailsByNumOrderId"
+    assert orders.GetOrderDetailsByNumOrderId.PATH == path
 
 
 def test_get_processed_audit_trail_method():
     assert orders.GetOrderDetailsByNumOrderId.METHOD == "GET"
 
 
+def test_get_processed_audit_trail_read_only():
+    assert orders.GetOrderDetailsByNumOrderId.READ_ONLY is True
+
+
 def test_get_processed_audit_trail_headers(order_id):
     assert orders.GetOrderDetailsByNumOrderId.headers(order_id=order_id) == {}
 
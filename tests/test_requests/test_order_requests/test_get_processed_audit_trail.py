@@ -10,15 +10,19 @@ def order_guid():
     return "73846ae8-9f64-42ef-8d76-31aa418da9d5"
 
 
-def test_get_processed_audit_trail_url():
-    url = "https://eu-ext.linnworks.net/api/ProcessedOrders/GetProcessedAuditTrail"
-    assert orders.GetProcessedAuditTrail.URL == url
+def test_get_processed_audit_trail_path():
+    path = "/api/ProcessedOrders/GetProcessedAuditTrail"
+    assert orders.GetProcessedAuditTrail.PATH == path
 
 
 def test_get_processed_audit_trail_method():
     assert orders.GetProcessedAuditTrail.METHOD == "GET"
 
 
+def test_get_processed_audit_trail_read_only():
+    assert orders.GetProcessedAuditTrail.READ_ONLY is True
+
+
 def test_get_processed_audit_trail_headers(order_guid):
     assert orders.GetProcessedAuditTrail.headers(order_guid=order_guid) == {
         "accept": "application/json"
@@ -47,3 +51,7 @@ def test_get_processed_audit_trail_parse_response(order_guid):
         orders.GetProcessedAuditTrail.parse_response(response, order_guid=order_guid)
         == response.json.return_value
     )
+
+
+def test_get_processed_audit_trail_cache_ttl():
+    assert orders.GetProcessedAuditTrail.CACHE_TTL == 300
@@ -10,15 +10,25 @@ def search_term():
     return "89468168"
 
 
-def test_search_processed_orders_url():
-    url = "https://eu-ext.linnworks.net/api/ProcessedOrders/SearchProcessedOrders"
-    assert orders.SearchProcessedOrders.URL == url
+def test_search_processed_orders_path():
+    path = "/api/ProcessedOrders/SearchProcessedOrders"
+    assert orders.SearchProcessedOrders.PATH == path
 
 
 def test_search_processed_orders_method():
     assert orders.SearchProcessedOrders.METHOD == "POST"
 
 
+def test_search_processed_orders_read_only():
+    assert orders.SearchProcessedOrders.READ_ONLY is True
+
+
+def test_search_processed_orders_rate_limit():
+    rate_limit = orders.SearchProcessedOrders.RATE_LIMIT
+    assert rate_limit.calls == 150
+    assert rate_limit.period == 60
+
+
 def test_search_processed_orders_headers(search_term):
     assert orders.SearchProcessedOrders.headers(search_term=search_term) == {}
 
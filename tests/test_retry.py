@@ -0,0 +1,117 @@
+import datetime as dt
+import email.utils
+from unittest.mock import Mock
+
+import pytest
+
+from linnapi import retry
+
+
+def response_with_status(status_code, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_no_retry_policy_does_not_allow_retries():
+    assert retry.NO_RETRY.allows_retry(read_only=True) is False
+
+
+def test_retry_policy_allows_retry_for_read_only_requests():
+    assert retry.RetryPolicy().allows_retry(read_only=True) is True
+
+
+def test_retry_policy_does_not_allow_retry_for_writes_by_default():
+    assert retry.RetryPolicy().allows_retry(read_only=False) is False
+
+
+def test_retry_policy_allows_retry_for_writes_when_enabled():
+    policy = retry.RetryPolicy(retry_writes=True)
+    assert policy.allows_retry(read_only=False) is True
+
+
+@pytest.mark.parametrize(
+    "status_code,expected",
+    [(200, False), (400, False), (404, False), (429, True), (500, True), (503, True)],
+)
+def test_retry_policy_should_retry(status_code, expected):
+    response = response_with_status(status_code)
+    assert retry.RetryPolicy().should_retry(response) is expected
+
+
+def test_retry_policy_custom_status_codes():
+    policy = retry.RetryPolicy(status_codes=frozenset({418}))
+    assert policy.should_retry(response_with_status(418)) is True
+    assert policy.should_retry(response_with_status(503)) is False
+
+
+@pytest.mark.parametrize("attempt,expected", [(1, 0.5), (2, 1.0), (3, 2.0), (8, 30.0)])
+def test_retry_policy_backoff_is_exponential_and_bounded(attempt, expected):
+    policy = retry.RetryPolicy(backoff_factor=0.5, max_backoff=30.0, jitter=False)
+    assert policy.backoff(attempt) == expected
+
+
+def test_retry_policy_backoff_with_jitter():
+    policy = retry.RetryPolicy(backoff_factor=1.0, max_backoff=30.0)
+    delays = [policy.backoff(3) for _ in range(100)]
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_policy_backoff_uses_retry_after():
+    policy = retry.RetryPolicy(jitter=False)
+    response = response_with_status(429, {"Retry-After": "12"})
+    assert policy.backoff(1, response) == 12.0
+
+
+def test_retry_policy_backoff_ignores_retry_after_when_disabled():
+    policy = retry.RetryPolicy(jitter=False, respect_retry_after=False)
+    response = response_with_status(429, {"Retry-After": "12"})
+    assert policy.backoff(1, response) == 0.5
+
+
+def test_retry_policy_backoff_limits_retry_after_to_max_backoff():
+    response = response_with_status(429, {"Retry-After": "3600"})
+    assert retry.RetryPolicy().backoff(1, response) == 30.0
+
+
+def test_retry_after_exceeds_max_backoff():
+    policy = retry.RetryPolicy(max_backoff=30.0)
+    assert policy.retry_after_exceeds_max_backoff(
+        response_with_status(429, {"Retry-After": "3600"})
+    )
+    assert not policy.retry_after_exceeds_max_backoff(
+        response_with_status(429, {"Retry-After": "30"})
+    )
+    assert not policy.retry_after_exceeds_max_backoff(response_with_status(429))
+
+
+def test_retry_after_exceeds_max_backoff_when_disabled():
+    policy = retry.RetryPolicy(respect_retry_after=False)
+    response = response_with_status(429, {"Retry-After": "3600"})
+    assert not policy.retry_after_exceeds_max_backoff(response)
+
+
+def test_retry_after_without_header():
+    assert retry.RetryPolicy.retry_after(response_with_status(429)) is None
+
+
+def test_retry_after_with_http_date():
+    retry_at = dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(seconds=60)
+    header = email.utils.format_datetime(retry_at, usegmt=True)
+    response = response_with_status(429, {"Retry-After": header})
+    assert 55 <= retry.RetryPolicy.retry_after(response) <= 60
+
+
+def test_retry_after_with_invalid_header():
+    response = response_with_status(429, {"Retry-After": "soon"})
+    assert retry.RetryPolicy.retry_after(response) is None
+
+
+def test_retry_stats():
+    stats = retry.RetryStats()
+    stats.record_attempt()
+    stats.record_attempt()
+    stats.record_backoff(1.5)
+    assert stats.as_dict() == {"attempts": 2, "retries": 1, "backoff_seconds": 1.5}
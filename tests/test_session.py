@@ -1,10 +1,16 @@
+import http.server
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs
 
 import pytest
-import requests
 import toml
 
-from linnapi import exceptions, session
+from linnapi import exceptions, session, token_store
+from linnapi.cache import StockItemIDCache
 
 
 @pytest.fixture(autouse=True)
@@ -41,19 +47,23 @@ def auth_request_response(session_token):
 @pytest.fixture(autouse=True)
 def clean_linnworks_api_session():
     yield
-    session.LinnworksAPISession.application_id = None
-    session.LinnworksAPISession.application_secret = None
-    session.LinnworksAPISession.application_token = None
-    session.LinnworksAPISession.session_token = None
-    session.LinnworksAPISession.session = requests.Session()
+    session.LinnworksAPISession.set_default(None)
+    session.LinnworksAPISession._shared_token_store = token_store.MemoryTokenStore()
     session.LinnworksAPISession.CONFIG_FILENAME = ".linnapi.toml"
 
 
 @pytest.fixture
-def set_linnworks_session_config(application_id, application_secret, application_token):
-    session.LinnworksAPISession.application_id = application_id
-    session.LinnworksAPISession.application_secret = application_secret
-    session.LinnworksAPISession.application_token = application_token
+def api_session():
+    return session.LinnworksAPISession()
+
+
+@pytest.fixture
+def set_linnworks_session_config(
+    api_session, application_id, application_secret, application_token
+):
+    api_session.application_id = application_id
+    api_session.application_secret = application_secret
+    api_session.application_token = application_token
 
 
 @pytest.fixture
@@ -70,7 +80,7 @@ def config_file(application_id, application_secret, application_token):
 
 
 @pytest.fixture
-def mock_auth_request(requests_mock, auth_request_response):
+def mock_auth_request(requests_mock, auth_request_response, api_session):
     requests_mock.post(session.LinnworksAPISession.AUTH_URL, json=auth_request_response)
     return requests_mock
 
@@ -96,50 +106,51 @@ def test_credentials_are_set_method(
     application_secret_set,
     application_token_set,
     expected,
+    api_session,
 ):
     if application_id_set is True:
-        session.LinnworksAPISession.application_id = application_id
+        api_session.application_id = application_id
     else:
-        session.LinnworksAPISession.application_id = None
+        api_session.application_id = None
     if application_secret_set is True:
-        session.LinnworksAPISession.application_secret = application_secret
+        api_session.application_secret = application_secret
     else:
-        session.LinnworksAPISession.application_secret = None
+        api_session.application_secret = None
     if application_token_set is True:
-        session.LinnworksAPISession.application_token = application_token
+        api_session.application_token = application_token
     else:
-        session.LinnworksAPISession.application_token = None
-    assert session.LinnworksAPISession.credentials_are_set() is expected
+        api_session.application_token = None
+    assert api_session.credentials_are_set() is expected
 
 
-def test_raises_exception_when_called_without_credentials(requests_mock):
+def test_raises_exception_when_called_without_credentials(requests_mock, api_session):
     with pytest.raises(exceptions.LoginCredentialsNotSetError):
-        with session.LinnworksAPISession():
+        with api_session:
             pass
 
 
-def test_request_headers_raises_if_session_token_not_set():
+def test_request_headers_raises_if_session_token_not_set(api_session):
     with pytest.raises(exceptions.SessionNotAuthorizedError):
-        session.LinnworksAPISession.request_headers()
+        api_session.request_headers()
 
 
-def test_request_headers_returns_request_headers(session_token):
-    session.LinnworksAPISession.session_token = session_token
+def test_request_headers_returns_request_headers(session_token, api_session):
+    api_session.session_token = session_token
     expected_response = {"Authorization": session_token}
-    assert session.LinnworksAPISession.request_headers() == expected_response
+    assert api_session.request_headers() == expected_response
 
 
 def test_authorise_session_makes_auth_request(
-    mock_auth_request, auth_request_response, set_linnworks_session_config
+    mock_auth_request, auth_request_response, set_linnworks_session_config, api_session
 ):
-    session.LinnworksAPISession._authorise_session()
+    api_session._authorise_session()
     request = mock_auth_request.request_history[0]
     assert request.method == "POST"
     assert request.url == session.LinnworksAPISession.AUTH_URL
     assert request.text == (
-        f"ApplicationID={session.LinnworksAPISession.application_id}&"
-        f"ApplicationSecret={session.LinnworksAPISession.application_secret}&"
-        f"Token={session.LinnworksAPISession.application_token}"
+        f"ApplicationID={api_session.application_id}&"
+        f"ApplicationSecret={api_session.application_secret}&"
+        f"Token={api_session.application_token}"
     )
 
 
@@ -148,9 +159,10 @@ def test_authorise_session_sets_session_token(
     auth_request_response,
     set_linnworks_session_config,
     session_token,
+    api_session,
 ):
-    session.LinnworksAPISession._authorise_session()
-    assert session.LinnworksAPISession.session_token == session_token
+    api_session._authorise_session()
+    assert api_session.session_token == session_token
 
 
 def test_authorise_session_returns_session_token(
@@ -158,8 +170,9 @@ def test_authorise_session_returns_session_token(
     auth_request_response,
     set_linnworks_session_config,
     session_token,
+    api_session,
 ):
-    assert session.LinnworksAPISession._authorise_session() == session_token
+    assert api_session._authorise_session() == session_token
 
 
 def test_linnworks_api_session_authorizes_when_used_as_a_session_manager(
@@ -167,26 +180,33 @@ def test_linnworks_api_session_authorizes_when_used_as_a_session_manager(
     auth_request_response,
     set_linnworks_session_config,
     session_token,
+    api_session,
 ):
-    with session.LinnworksAPISession():
+    with api_session:
         last_request = mock_auth_request.request_history[0]
         assert last_request.url == session.LinnworksAPISession.AUTH_URL
-        assert session.LinnworksAPISession.session_token == session_token
+        assert api_session.session_token == session_token
 
 
-def test_set_login_method_sets_application_id(requests_mock, application_id):
-    session.LinnworksAPISession.set_login(application_id=application_id)
-    assert session.LinnworksAPISession.application_id == application_id
+def test_set_login_method_sets_application_id(
+    requests_mock, application_id, api_session
+):
+    api_session.set_login(application_id=application_id)
+    assert api_session.application_id == application_id
 
 
-def test_set_login_method_sets_application_secret(requests_mock, application_secret):
-    session.LinnworksAPISession.set_login(application_secret=application_secret)
-    assert session.LinnworksAPISession.application_secret == application_secret
+def test_set_login_method_sets_application_secret(
+    requests_mock, application_secret, api_session
+):
+    api_session.set_login(application_secret=application_secret)
+    assert api_session.application_secret == application_secret
 
 
-def test_set_login_method_sets_application_token(requests_mock, application_token):
-    session.LinnworksAPISession.set_login(application_token=application_token)
-    assert session.LinnworksAPISession.application_token == application_token
+def test_set_login_method_sets_application_token(
+    requests_mock, application_token, api_session
+):
+    api_session.set_login(application_token=application_token)
+    assert api_session.application_token == application_token
 
 
 def test_find_config_filepath_returns_config_file_in_cwd(temp_cwd, config_file):
@@ -199,19 +219,25 @@ def test_find_config_filepath_returns_None_without_config_file_in_cwd():
     assert path is None
 
 
-def test_load_from_config_file_sets_application_id(config_file, application_id):
-    session.LinnworksAPISession.load_from_config_file(config_file)
-    assert session.LinnworksAPISession.application_id == application_id
+def test_load_from_config_file_sets_application_id(
+    config_file, application_id, api_session
+):
+    api_session.load_from_config_file(config_file)
+    assert api_session.application_id == application_id
 
 
-def test_load_from_config_file_sets_application_secret(config_file, application_secret):
-    session.LinnworksAPISession.load_from_config_file(config_file)
-    assert session.LinnworksAPISession.application_secret == application_secret
+def test_load_from_config_file_sets_application_secret(
+    config_file, application_secret, api_session
+):
+    api_session.load_from_config_file(config_file)
+    assert api_session.application_secret == application_secret
 
 
-def test_load_from_config_file_sets_application_token(config_file, application_token):
-    session.LinnworksAPISession.load_from_config_file(config_file)
-    assert session.LinnworksAPISession.application_token == application_token
+def test_load_from_config_file_sets_application_token(
+    config_file, application_token, api_session
+):
+    api_session.load_from_config_file(config_file)
+    assert api_session.application_token == application_token
 
 
 def test_enter_method_loads_credentials_from_file_if_not_set(
@@ -220,33 +246,477 @@ def test_enter_method_loads_credentials_from_file_if_not_set(
     application_id,
     application_secret,
     application_token,
+    api_session,
 ):
-    with session.LinnworksAPISession():
+    with api_session:
         pass
-    assert session.LinnworksAPISession.application_id == application_id
-    assert session.LinnworksAPISession.application_secret == application_secret
-    assert session.LinnworksAPISession.application_token == application_token
+    assert api_session.application_id == application_id
+    assert api_session.application_secret == application_secret
+    assert api_session.application_token == application_token
 
 
 def test_enter_method_does_not_load_credentials_if_already_set(
-    mock_auth_request, config_file
+    mock_auth_request, config_file, api_session
 ):
     temp_value = "tmp_value"
-    session.LinnworksAPISession.application_id = temp_value
-    session.LinnworksAPISession.application_secret = temp_value
-    session.LinnworksAPISession.application_token = temp_value
-    with session.LinnworksAPISession():
+    api_session.application_id = temp_value
+    api_session.application_secret = temp_value
+    api_session.application_token = temp_value
+    with api_session:
         pass
-    assert session.LinnworksAPISession.application_id == temp_value
-    assert session.LinnworksAPISession.application_secret == temp_value
-    assert session.LinnworksAPISession.application_token == temp_value
+    assert api_session.application_id == temp_value
+    assert api_session.application_secret == temp_value
+    assert api_session.application_token == temp_value
 
 
 def test_linnworks_api_session_wrapper(
-    mock_auth_request, set_linnworks_session_config, session_token
+    mock_auth_request, set_linnworks_session_config, session_token, api_session
 ):
+    session.LinnworksAPISession.set_default(api_session)
+
     @session.linnworks_api_session
     def wrapped_function():
-        assert session.LinnworksAPISession.session_token == session_token
+        assert session.LinnworksAPISession.current() is api_session
+        assert api_session.session_token == session_token
 
     wrapped_function()
+
+
+def test_linnworks_api_session_wrapper_uses_bound_session(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    @session.linnworks_api_session
+    def wrapped_function():
+        return session.LinnworksAPISession.current()
+
+    with api_session:
+        assert wrapped_function() is api_session
+
+
+def test_default_returns_the_same_session():
+    default_session = session.LinnworksAPISession.default()
+    assert isinstance(default_session, session.LinnworksAPISession)
+    assert session.LinnworksAPISession.default() is default_session
+
+
+def test_set_default(api_session):
+    session.LinnworksAPISession.set_default(api_session)
+    assert session.LinnworksAPISession.default() is api_session
+
+
+def test_current_returns_default_outside_session():
+    current_session = session.LinnworksAPISession.current()
+    assert current_session is session.LinnworksAPISession.default()
+
+
+def test_current_returns_entered_session(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    with api_session as entered_session:
+        assert entered_session is api_session
+        assert session.LinnworksAPISession.current() is api_session
+    assert session.LinnworksAPISession.current() is not api_session
+
+
+def test_sessions_for_multiple_accounts(requests_mock):
+    requests_mock.post(
+        session.LinnworksAPISession.AUTH_URL,
+        [{"json": {"Token": "token-1"}}, {"json": {"Token": "token-2"}}],
+    )
+    account_1 = session.LinnworksAPISession("id-1", "secret-1", "token-1")
+    account_2 = session.LinnworksAPISession("id-2", "secret-2", "token-2")
+    with account_1:
+        with account_2:
+            assert session.LinnworksAPISession.current() is account_2
+        assert session.LinnworksAPISession.current() is account_1
+    assert account_1.request_headers() == {"Authorization": "token-1"}
+    assert account_2.request_headers() == {"Authorization": "token-2"}
+    assert account_1.session is not account_2.session
+
+
+def test_session_binding_is_local_to_thread(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    with api_session:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_session = executor.submit(session.LinnworksAPISession.current)
+            assert thread_session.result() is session.LinnworksAPISession.default()
+
+
+def test_authorise_session_sets_session_token_expiry(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    before = time.time()
+    api_session._authorise_session()
+    expires_at = api_session.session_token_expires_at
+    ttl = session.LinnworksAPISession.DEFAULT_SESSION_TOKEN_TTL
+    assert before + ttl <= expires_at <= time.time() + ttl
+
+
+def test_authorise_session_uses_ttl_from_response(
+    requests_mock, set_linnworks_session_config, session_token, api_session
+):
+    requests_mock.post(
+        session.LinnworksAPISession.AUTH_URL,
+        json={"Token": session_token, "TTL": 120},
+    )
+    before = time.time()
+    api_session._authorise_session()
+    expires_at = api_session.session_token_expires_at
+    assert before + 120 <= expires_at <= time.time() + 120
+
+
+def test_session_token_is_valid_without_token(api_session):
+    assert api_session.session_token_is_valid() is False
+
+
+def test_session_token_is_valid_with_unexpired_token(session_token, api_session):
+    api_session.session_token = session_token
+    api_session.session_token_expires_at = time.time() + 600
+    assert api_session.session_token_is_valid() is True
+
+
+def test_session_token_is_not_valid_close_to_expiry(session_token, api_session):
+    margin = session.LinnworksAPISession.SESSION_TOKEN_RENEWAL_MARGIN
+    api_session.session_token = session_token
+    api_session.session_token_expires_at = time.time() + margin - 1
+    assert api_session.session_token_is_valid() is False
+
+
+def test_session_token_is_reused_across_sessions(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    with api_session:
+        pass
+    with api_session:
+        with api_session:
+            pass
+    assert mock_auth_request.call_count == 1
+
+
+def test_session_token_is_renewed_close_to_expiry(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    with api_session:
+        pass
+    expires_at = api_session.session_token_expires_at
+    with patch("linnapi.session.time.time", return_value=expires_at):
+        with api_session:
+            pass
+    assert mock_auth_request.call_count == 2
+
+
+def test_set_login_clears_session_token(
+    mock_auth_request, set_linnworks_session_config, application_id, api_session
+):
+    with api_session:
+        pass
+    api_session.set_login(application_id=application_id)
+    assert api_session.session_token is None
+    assert api_session.session_token_expires_at is None
+
+
+def test_session_token_is_shared_by_sessions_for_the_same_account(
+    mock_auth_request, application_id, application_secret, application_token
+):
+    for _ in range(3):
+        with session.LinnworksAPISession(
+            application_id, application_secret, application_token
+        ) as api_session:
+            assert api_session.session_token is not None
+    assert mock_auth_request.call_count == 1
+
+
+def test_new_sessions_use_default_credentials_and_token(
+    mock_auth_request, config_file, application_id
+):
+    for _ in range(3):
+        with session.LinnworksAPISession() as api_session:
+            assert api_session.application_id == application_id
+    default_session = session.LinnworksAPISession.default()
+    assert default_session.application_id == application_id
+    assert mock_auth_request.call_count == 1
+
+
+def test_session_credentials_take_precedence_over_default_credentials(
+    mock_auth_request, config_file
+):
+    with session.LinnworksAPISession("id", "secret", "token") as api_session:
+        pass
+    assert api_session.application_id == "id"
+
+
+def test_set_login_on_class_sets_default_session_login(
+    mock_auth_request, application_id, application_secret, application_token
+):
+    session.LinnworksAPISession.set_login(
+        application_id=application_id,
+        application_secret=application_secret,
+        application_token=application_token,
+    )
+    assert session.LinnworksAPISession.credentials_are_set() is True
+    default_session = session.LinnworksAPISession.default()
+    assert default_session.application_id == application_id
+    with session.LinnworksAPISession() as api_session:
+        assert api_session.application_token == application_token
+
+
+def test_load_from_config_file_on_class_loads_default_session_login(
+    config_file, application_id
+):
+    session.LinnworksAPISession.load_from_config_file(config_file)
+    assert session.LinnworksAPISession.default().application_id == application_id
+
+
+def test_request_headers_on_class_returns_default_session_headers(
+    mock_auth_request, config_file, session_token
+):
+    with session.LinnworksAPISession.default():
+        pass
+    assert session.LinnworksAPISession.request_headers() == {
+        "Authorization": session_token
+    }
+
+
+def test_concurrent_sessions_authorise_once(
+    mock_auth_request, set_linnworks_session_config, api_session
+):
+    def enter_session(_):
+        with api_session:
+            return api_session.session_token
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(enter_session, range(32)))
+    assert mock_auth_request.call_count == 1
+    assert len(set(tokens)) == 1
+
+
+@pytest.fixture
+def file_token_store(tmp_path):
+    return token_store.FileTokenStore(tmp_path / "tokens.json")
+
+
+def test_set_token_store(file_token_store, api_session):
+    api_session.set_token_store(file_token_store)
+    assert api_session.token_store is file_token_store
+
+
+def test_session_saves_token_to_token_store(
+    mock_auth_request,
+    set_linnworks_session_config,
+    file_token_store,
+    session_token,
+    api_session,
+):
+    api_session.set_token_store(file_token_store)
+    with api_session:
+        pass
+    stored = file_token_store.get(api_session.token_store_key())
+    assert stored["token"] == session_token
+    assert stored["expires_at"] == api_session.session_token_expires_at
+
+
+def test_session_uses_valid_token_from_token_store(
+    mock_auth_request,
+    set_linnworks_session_config,
+    file_token_store,
+    application_id,
+    api_session,
+):
+    file_token_store.set(
+        api_session.token_store_key(),
+        {"token": "stored-token", "expires_at": time.time() + 600},
+    )
+    api_session.set_token_store(file_token_store)
+    with api_session:
+        pass
+    assert mock_auth_request.call_count == 0
+    assert api_session.session_token == "stored-token"
+
+
+def test_session_refreshes_expired_token_in_token_store(
+    mock_auth_request,
+    set_linnworks_session_config,
+    file_token_store,
+    application_id,
+    session_token,
+    api_session,
+):
+    file_token_store.set(
+        api_session.token_store_key(),
+        {"token": "stored-token", "expires_at": time.time()},
+    )
+    api_session.set_token_store(file_token_store)
+    with api_session:
+        pass
+    assert mock_auth_request.call_count == 1
+    assert file_token_store.get(api_session.token_store_key())["token"] == session_token
+
+
+def test_server_url_defaults_to_default_server(api_session):
+    server_url = api_session.server_url()
+    assert server_url == session.LinnworksAPISession.DEFAULT_SERVER
+
+
+def test_authorise_session_sets_server(
+    requests_mock, set_linnworks_session_config, session_token, api_session
+):
+    server = "https://us-ext.linnworks.net"
+    requests_mock.post(
+        session.LinnworksAPISession.AUTH_URL,
+        json={"Token": session_token, "Server": server},
+    )
+    api_session._authorise_session()
+    assert api_session.server_url() == server
+
+
+def test_clear_session_token_clears_server(api_session):
+    api_session.server = "https://us-ext.linnworks.net"
+    api_session.clear_session_token()
+    assert api_session.server is None
+
+
+def test_session_shares_server_through_token_store(
+    requests_mock,
+    set_linnworks_session_config,
+    file_token_store,
+    session_token,
+    api_session,
+):
+    server = "https://us-ext.linnworks.net"
+    requests_mock.post(
+        session.LinnworksAPISession.AUTH_URL,
+        json={"Token": session_token, "Server": server},
+    )
+    api_session.set_token_store(file_token_store)
+    with api_session:
+        pass
+    api_session.clear_session_token()
+    with api_session:
+        pass
+    assert requests_mock.call_count == 1
+    assert api_session.server_url() == server
+
+
+def test_token_store_key_differs_between_accounts_sharing_an_application():
+    account_a = session.LinnworksAPISession("app", "secret", "install-token-a")
+    account_b = session.LinnworksAPISession("app", "secret", "install-token-b")
+    assert account_a.token_store_key() != account_b.token_store_key()
+    assert account_a.token_store_key().startswith("app:")
+    assert "install-token-a" not in account_a.token_store_key()
+
+
+def test_accounts_sharing_an_application_do_not_share_stored_tokens(
+    requests_mock, file_token_store
+):
+    def auth_response(request, context):
+        token = parse_qs(request.text)["Token"][0]
+        return {"Token": f"session-{token}", "Server": f"https://{token}.example"}
+
+    requests_mock.post(session.LinnworksAPISession.AUTH_URL, json=auth_response)
+    account_a = session.LinnworksAPISession(
+        "app", "secret", "install-token-a", token_store=file_token_store
+    )
+    account_b = session.LinnworksAPISession(
+        "app", "secret", "install-token-b", token_store=file_token_store
+    )
+    assert account_a.authorise_if_required() == "session-install-token-a"
+    assert account_b.authorise_if_required() == "session-install-token-b"
+    assert account_b.server_url() == "https://install-token-b.example"
+    assert requests_mock.call_count == 2
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_uses_default_pool_size(api_session):
+    adapter = api_session.session.get_adapter("https://eu-ext.linnworks.net")
+    assert adapter._pool_maxsize == session.LinnworksAPISession.DEFAULT_POOL_MAXSIZE
+    assert (
+        adapter._pool_connections
+        == session.LinnworksAPISession.DEFAULT_POOL_CONNECTIONS
+    )
+
+
+def test_session_pool_settings():
+    api_session = session.LinnworksAPISession(
+        pool_connections=4, pool_maxsize=32, pool_block=True
+    )
+    adapter = api_session.session.get_adapter("https://eu-ext.linnworks.net")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_session_keep_alive_is_disabled():
+    api_session = session.LinnworksAPISession(keep_alive=False)
+    assert api_session.session.headers["Connection"] == "close"
+
+
+def test_pool_stats_without_requests(api_session):
+    assert api_session.pool_stats() == {
+        "requests": 0,
+        "connections_opened": 0,
+        "connections_reused": 0,
+    }
+
+
+def test_pool_stats_counts_reused_connections(api_session, local_server):
+    for _ in range(3):
+        api_session.session.get(local_server).raise_for_status()
+    assert api_session.pool_stats() == {
+        "requests": 3,
+        "connections_opened": 1,
+        "connections_reused": 2,
+    }
+
+
+def test_session_stock_item_id_cache_is_disabled_by_default(api_session):
+    assert api_session.stock_item_id_cache is None
+
+
+def test_session_stock_item_id_cache():
+    stock_item_id_cache = StockItemIDCache()
+    api_session = session.LinnworksAPISession(stock_item_id_cache=stock_item_id_cache)
+    assert api_session.stock_item_id_cache is stock_item_id_cache
+
+
+def test_session_stock_item_id_loader_is_disabled_by_default(api_session):
+    assert api_session.stock_item_id_loader is None
+
+
+def test_session_does_not_deduplicate_requests_by_default(api_session):
+    assert api_session.deduplicate_requests is False
+
+
+def test_session_deduplicate_requests():
+    api_session = session.LinnworksAPISession(deduplicate_requests=True)
+    assert api_session.deduplicate_requests is True
+
+
+def test_session_response_cache_is_disabled_by_default(api_session):
+    assert api_session.response_cache is None
+
+
+def test_session_stock_level_cache_is_disabled_by_default(api_session):
+    assert api_session.stock_level_cache is None
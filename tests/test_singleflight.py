@@ -0,0 +1,73 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from linnapi.singleflight import SingleFlight
+
+
+def test_do_returns_result():
+    assert SingleFlight().do("key", lambda: "value") == "value"
+
+
+def test_do_raises_exception():
+    def fail():
+        raise ValueError("failed")
+
+    single_flight = SingleFlight()
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+    assert single_flight.in_flight() == 0
+
+
+def run_concurrently(single_flight, keys, func):
+    started = threading.Event()
+    release = threading.Event()
+
+    def call(key):
+        return single_flight.do(key, lambda: func(key, started, release))
+
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        futures = [pool.submit(call, keys[0])]
+        started.wait(timeout=5)
+        futures += [pool.submit(call, key) for key in keys[1:]]
+        while single_flight.shared < keys[1:].count(keys[0]):
+            threading.Event().wait(0.001)
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_concurrent_calls_for_a_key_share_one_call():
+    calls = []
+
+    def func(key, started, release):
+        calls.append(key)
+        started.set()
+        release.wait(timeout=5)
+        return object()
+
+    single_flight = SingleFlight()
+    results = run_concurrently(single_flight, ["a", "a", "a"], func)
+    assert calls == ["a"]
+    assert results[0] is results[1] is results[2]
+    assert single_flight.shared == 2
+    assert single_flight.in_flight() == 0
+
+
+def test_concurrent_calls_share_exception():
+    def func(key, started, release):
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError(key)
+
+    single_flight = SingleFlight()
+    with pytest.raises(ValueError):
+        run_concurrently(single_flight, ["a", "a"], func)
+
+
+def test_calls_are_not_shared_once_finished():
+    calls = []
+    single_flight = SingleFlight()
+    single_flight.do("key", lambda: calls.append(1))
+    single_flight.do("key", lambda: calls.append(2))
+    assert calls == [1, 2]
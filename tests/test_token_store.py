@@ -0,0 +1,141 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from linnapi import token_store
+
+
+@pytest.fixture
+def application_id():
+    return "mock-application-id"
+
+
+@pytest.fixture
+def token_data():
+    return {"token": "mock-session-token", "expires_at": 1700000000.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return token_store.FileTokenStore(tmp_path / "tokens.json")
+
+
+def test_base_token_store_get_raises_not_implemented(application_id):
+    with pytest.raises(NotImplementedError):
+        token_store.TokenStore().get(application_id)
+
+
+def test_base_token_store_set_raises_not_implemented(application_id, token_data):
+    with pytest.raises(NotImplementedError):
+        token_store.TokenStore().set(application_id, token_data)
+
+
+def test_base_token_store_lock_raises_not_implemented(application_id):
+    with pytest.raises(NotImplementedError):
+        with token_store.TokenStore().lock(application_id):
+            pass
+
+
+def test_memory_token_store_get_returns_none_without_token(application_id):
+    assert token_store.MemoryTokenStore().get(application_id) is None
+
+
+def test_memory_token_store_set_and_get(application_id, token_data):
+    store = token_store.MemoryTokenStore()
+    store.set(application_id, token_data)
+    assert store.get(application_id) == token_data
+    assert store.get("other-application") is None
+
+
+def test_memory_token_store_lock_is_exclusive(application_id):
+    events = []
+    store = token_store.MemoryTokenStore()
+    locked = threading.Event()
+
+    def hold_lock():
+        with store.lock(application_id):
+            locked.set()
+            time.sleep(0.1)
+            events.append("first released")
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait()
+    with store.lock(application_id):
+        events.append("second acquired")
+    thread.join()
+    assert events == ["first released", "second acquired"]
+
+
+def test_memory_token_store_locks_keys_separately():
+    store = token_store.MemoryTokenStore()
+    with store.lock("application-1"):
+        with store.lock("application-2"):
+            pass
+
+
+def test_file_token_store_get_returns_none_without_file(store, application_id):
+    assert store.get(application_id) is None
+
+
+def test_file_token_store_set_and_get(store, application_id, token_data):
+    store.set(application_id, token_data)
+    assert store.get(application_id) == token_data
+
+
+def test_file_token_store_is_keyed_by_application_id(store, token_data):
+    store.set("application-1", token_data)
+    assert store.get("application-2") is None
+
+
+def test_file_token_store_is_shared_between_instances(
+    store, application_id, token_data
+):
+    store.set(application_id, token_data)
+    assert token_store.FileTokenStore(store.path).get(application_id) == token_data
+
+
+def test_file_token_store_ignores_corrupt_file(store, application_id):
+    store.path.write_text("not json")
+    assert store.get(application_id) is None
+
+
+def test_file_token_store_lock_is_exclusive(store, application_id):
+    events = []
+    second_store = token_store.FileTokenStore(store.path)
+    locked = threading.Event()
+
+    def hold_lock():
+        with store.lock(application_id):
+            locked.set()
+            time.sleep(0.1)
+            events.append("first released")
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait()
+    with second_store.lock(application_id):
+        events.append("second acquired")
+    thread.join()
+    assert events == ["first released", "second acquired"]
+
+
+def test_file_token_store_without_fcntl_raises_runtime_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_store, "fcntl", None)
+    with pytest.raises(RuntimeError, match="POSIX"):
+        token_store.FileTokenStore(tmp_path / "tokens.json")
+
+
+def test_linnapi_imports_without_fcntl():
+    code = (
+        "import sys; sys.modules['fcntl'] = None; "
+        "import linnapi; from linnapi import token_store; "
+        "assert token_store.fcntl is None"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1]
+    )